@@ -6,13 +6,14 @@
 import click
 
 # Local Imports
+from .benchmark import Benchmark
 from .test_schema import TestSchema
 
 
 class MainCLIGroup(click.Group):
     def __init__(self, *args, **kwargs):
         super().__init__(
-            *args, commands={'test-schema': TestSchema()}, **kwargs)
+            *args, commands={'benchmark': Benchmark(), 'test-schema': TestSchema()}, **kwargs)
 
 
 # Export CLI Application
@@ -0,0 +1,122 @@
+"""
+* CLI Commands: Benchmark
+"""
+# Standard Library Imports
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Third Party Imports
+import click
+from omnitils.logs import logger
+
+# Local Imports
+from hexproof.mtgjson import fetch as MTGJsonFetch
+from hexproof.mtgjson import schema as MTGJson
+from hexproof.mtgjson.enums import MTGJsonURL
+from hexproof.utils.validation import JSONData, ValidationMode, get_type_adapter, validate_json_data
+
+# MTGJSON files which can be benchmarked, mapped to the schema of their 'data'
+MTGJSON_FILES: dict[str, Any] = {
+    'AtomicCards': dict[str, list[MTGJson.CardAtomic]],
+    'AllPricesToday': MTGJson.Price,
+    'CardTypes': MTGJson.CardTypes,
+    'DeckList': list[MTGJson.DeckList],
+    'Keywords': MTGJson.Keywords,
+    'Meta': MTGJson.Meta,
+    'SetList': list[MTGJson.SetList]
+}
+
+"""
+* Utils
+"""
+
+
+def measure(func: Callable[[], Any], rounds: int = 3) -> tuple[float, int]:
+    """Measures the best wall time and the peak memory allocated by a function.
+
+    Notes:
+        Wall time is measured without tracing allocations, then one more call is made while
+        tracing to measure the peak memory allocated.
+
+    Args:
+        func: Function to measure.
+        rounds: Number of timed calls to make.
+
+    Returns:
+        A tuple containing the best wall time in seconds, and the peak memory allocated in bytes.
+    """
+    best = float('inf')
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+"""
+* Commands: Benchmark
+"""
+
+
+@click.command(
+    name='validation',
+    help="Benchmark validating an MTGJSON file directly from raw bytes against decoding it first.")
+@click.argument('name', type=click.Choice(list(MTGJSON_FILES)), default='AtomicCards')
+@click.option(
+    '-p', '--path', type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None,
+    help='Local copy of the file to read instead of downloading it.')
+@click.option('-r', '--rounds', type=int, default=3, help='Number of timed rounds for each method.')
+def benchmark_validation(name: str, path: Optional[Path] = None, rounds: int = 3) -> None:
+    """Benchmarks validating an MTGJSON file with `validate_json_data` in each validation mode, against
+        `json.loads` followed by validating the decoded Python objects.
+
+    Args:
+        name: Name of the MTGJSON file, e.g. AtomicCards
+        path: Local copy of the file to read instead of downloading it.
+        rounds: Number of timed rounds for each method.
+    """
+    schema = MTGJSON_FILES[name]
+    raw = path.read_bytes() if path else MTGJsonFetch.get_content(getattr(MTGJsonURL.BulkJSON, name))
+    adapter = get_type_adapter(JSONData[schema])
+    logger.info(f'Benchmarking {name}: {len(raw) / 1024 ** 2:.1f} MiB')
+
+    # Validate each way once before timing, to build the cached validators
+    methods: dict[str, Callable[[], Any]] = {
+        'json.loads + validate': lambda: adapter.validate_python(json.loads(raw)).data,
+        'validate_json': lambda: validate_json_data(schema, raw, mode=ValidationMode.Validate),
+        'validate_json (strict)': lambda: validate_json_data(schema, raw, mode=ValidationMode.Strict),
+        'construct': lambda: validate_json_data(schema, raw, mode=ValidationMode.Construct)
+    }
+    for func in methods.values():
+        func()
+    for label, func in methods.items():
+        seconds, peak = measure(func, rounds=rounds)
+        logger.info(f'{label:<24} {seconds:8.3f}s {peak / 1024 ** 2:10.1f} MiB peak')
+
+
+"""
+* Command Groups
+"""
+
+
+class Benchmark(click.Group):
+    """Command group for performance benchmarks."""
+    def __init__(self, *_args, **_kwargs) -> None:
+        super().__init__(
+            name='benchmark',
+            commands={
+                'validation': benchmark_validation
+            },
+            help="A command group for performance benchmarks.")
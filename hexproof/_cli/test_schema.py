@@ -49,7 +49,7 @@ def test_mtgjson_schema_card(trace: bool = False) -> None:
         reraise=True, log_trace=trace
     ):
         obj_atomic = MTGJsonFetch.get_cards_atomic_all()
-        assert isinstance(next(iter(obj_atomic.values())), MTGJson.CardAtomic)
+        assert isinstance(next(iter(obj_atomic.values()))[0], MTGJson.CardAtomic)
 
 
 @click.command(help="Test MTGJSON 'CardTypes' object schema.")
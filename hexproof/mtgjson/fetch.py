@@ -1,26 +1,39 @@
 """
 * MTGJSON Request Handling
 """
-import os
 # Standard Library Imports
-from typing import Callable, Optional
+import bz2
+import gzip
+import json
+import lzma
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Iterator, MutableMapping, Optional, TypeVar, Union
 from pathlib import Path
 
 # Third Party Imports
 import requests
 import yarl
-from ratelimit import sleep_and_retry, RateLimitDecorator
 from backoff import on_exception, expo
-from omnitils.fetch import request_header_default, download_file
 from omnitils.files.archive import unpack_tar_gz
+from requests import Response, Session
 
 # Local Imports
 from hexproof.mtgjson.enums import MTGJsonURL
 from hexproof.mtgjson import schema as MTGJsonTypes
+from hexproof.utils.cache import get_response_cache
+from hexproof.utils.limits import TokenBucket, call_rate_limited, is_throttled, set_rate_limiter
+from hexproof.utils.projection import project
+from hexproof.utils.sessions import download_file, get_session
+from hexproof.utils.snapshots import get_snapshot_cache
+from hexproof.utils.streaming import iter_json_object
+from hexproof.utils.validation import ValidationMode, get_validation_mode, validate_json, validate_json_data
+
+T = TypeVar('T')
 
-# Rate limiter to safely limit MTGJSON requests
-mtgjson_rate_limit = RateLimitDecorator(calls=20, period=1)
-mtgjson_gql_rate_limit = RateLimitDecorator(calls=20, period=1)
+# Rate limiter to safely limit MTGJSON requests, can be swapped using `set_rate_limiter('mtgjson', ...)`
+mtgjson_rate_limit = set_rate_limiter('mtgjson', TokenBucket(rate=20))
+mtgjson_gql_rate_limit = set_rate_limiter('mtgjson_gql', TokenBucket(rate=20))
 
 
 """
@@ -35,11 +48,9 @@ def request_handler_mtgjson(func) -> Callable:
         There are no known rate limits for requesting JSON file resources.
         We include a 20-per-second rate limit just to be nice.
     """
-    @sleep_and_retry
-    @mtgjson_rate_limit
-    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1)
+    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1, giveup=is_throttled)
     def decorator(*args, **kwargs):
-        return func(*args, **kwargs)
+        return call_rate_limited('mtgjson', func, *args, **kwargs)
     return decorator
 
 
@@ -50,11 +61,9 @@ def request_handler_mtgjson_gql(func) -> Callable:
         MTGJSON GraphQL requests are capped at 500 per-hour per-token at the moment.
         https://mtgjson.com/mtggraphql/#rate-limits
     """
-    @sleep_and_retry
-    @mtgjson_gql_rate_limit
-    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1)
+    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1, giveup=is_throttled)
     def decorator(*args, **kwargs):
-        return func(*args, **kwargs)
+        return call_rate_limited('mtgjson_gql', func, *args, **kwargs)
     return decorator
 
 
@@ -64,21 +73,119 @@ def request_handler_mtgjson_gql(func) -> Callable:
 
 
 @request_handler_mtgjson
-def get_json(url: yarl.URL, header: Optional[dict] = None) -> dict:
+def get_response(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> Response:
+    """Makes a GET request to a MTGJSON resource using the proper rate limits.
+
+    Args:
+        url: MTGJSON API request URL.
+        header: Optional headers to include in the response.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The Response, with its content loaded.
+    """
+    session = session or get_session(url)
+    with session.get(str(url), headers=header) as r:
+        r.raise_for_status()
+        return r
+
+
+def get_content(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> bytes:
+    """Retrieves the raw content of a MTGJSON API request using the proper rate limits.
+
+    Notes:
+        If a response cache is enabled, cached responses are used where possible. Fresh responses
+        are returned without making a request, so they don't count against the rate limit.
+
+    Args:
+        url: MTGJSON API request URL.
+        header: Optional headers to include in the response.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The raw response body.
+    """
+    if (cache := get_response_cache()) is not None:
+        return cache.fetch(
+            url=url,
+            request=lambda h: get_response(url=url, header=h, session=session),
+            header=header)
+    return get_response(url=url, header=header, session=session).content
+
+
+def get_json(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> dict:
     """Retrieves JSON results from a MTGJSON API request using the proper rate limits.
 
     Args:
         url: MTGJSON API request URL.
         header: Optional headers to include in the response.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
 
     Returns:
         Dict containing data from the JSON response.
     """
-    if header is None:
-        header = request_header_default.copy()
-    with requests.get(str(url), headers=header) as r:
-        r.raise_for_status()
-        return r.json()
+    return json.loads(get_content(url=url, header=header, session=session))
+
+
+def get_data(
+    url: yarl.URL,
+    schema: type[T],
+    header: Optional[dict] = None,
+    session: Optional[Session] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> T:
+    """Retrieves a MTGJSON file and validates its 'data' against a schema, directly from the raw response.
+
+    Notes:
+        The response body is handed straight to a cached pydantic validator, so the JSON is only
+        traversed once instead of being decoded into Python objects and then validated. If fields
+        are selected, the schema is swapped for its projected model and every other field is skipped.
+
+    Args:
+        url: MTGJSON API request URL.
+        schema: Schema model class or type annotation of the file's 'data', e.g. `dict[str, MTGJsonTypes.Set]`
+        header: Optional headers to include in the response.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional field names to keep, e.g. ['name', 'identifiers.scryfallId'], see `get_projected_model`.
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Returns:
+        The validated 'data' object.
+    """
+    if fields is not None:
+        schema = project(schema, fields)
+    return validate_json_data(schema, get_content(url=url, header=header, session=session), mode=mode)
+
+
+def get_snapshot(
+    name: str,
+    load: Callable[[], T],
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> T:
+    """Returns a dataset from the snapshot cache if one is enabled, keyed by the current MTGJSON 'Meta' version.
+
+    Notes:
+        The small 'Meta' file is requested to check the snapshot's version. If the snapshot is missing
+        or stale, the dataset is loaded and a new snapshot is saved. Each validation mode has its own
+        snapshot, so data built without validation is never returned to a caller asking for validation.
+        Projected datasets are never cached.
+
+    Args:
+        name: Name of the dataset, e.g. 'AtomicCards'
+        load: Function which fetches and validates the dataset.
+        mode: Validation mode the dataset is loaded with, uses the global validation mode if not provided.
+        fields: Field names selected by the caller, if any.
+
+    Returns:
+        The dataset.
+    """
+    if fields is not None or (cache := get_snapshot_cache()) is None:
+        return load()
+    mode, meta = ValidationMode(mode or get_validation_mode()), get_meta()
+    return cache.fetch(name=f'mtgjson_{name}_{mode}', version=f'{meta.version}:{meta.date}', load=load)
 
 
 """
@@ -86,154 +193,345 @@ def get_json(url: yarl.URL, header: Optional[dict] = None) -> dict:
 """
 
 
-@request_handler_mtgjson
-def get_cards_atomic_all() -> dict[str, MTGJsonTypes.CardAtomic]:
+def get_cards_atomic_all(
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> dict[str, list[MTGJsonTypes.CardAtomic]]:
     """Get a dictionary of all MTGJSON 'CardAtomic' objects mapped to their respective card names.
 
+    Notes:
+        If a snapshot cache is enabled, the dataset is loaded from its snapshot until the MTGJSON version changes.
+
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'CardAtomic' field names to keep, e.g. ['name', 'identifiers.scryfallOracleId']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
     Returns:
-        A dict with card name as the key, MTGJSON 'CardAtomic' object as the value.
+        A dict with card name as the key, a list of MTGJSON 'CardAtomic' objects (one for each face) as the value.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.AtomicCards,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', [])
-        return {k: MTGJsonTypes.CardAtomic(**v) for k, v in _obj.items()}
+    return get_snapshot('AtomicCards', lambda: get_data(
+        MTGJsonURL.BulkJSON.AtomicCards, dict[str, list[MTGJsonTypes.CardAtomic]], mode=mode, fields=fields
+    ), mode=mode, fields=fields)
 
 
-@request_handler_mtgjson
-def get_card_types() -> MTGJsonTypes.CardTypes:
+def get_card_types(mode: Optional[ValidationMode] = None) -> MTGJsonTypes.CardTypes:
     """Get the current MTGJSON 'CardTypes' resource.
 
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         MTGJSON 'CardTypes' object.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.CardTypes,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', {})
-        return MTGJsonTypes.CardTypes(**_obj)
+    return get_data(MTGJsonURL.BulkJSON.CardTypes, MTGJsonTypes.CardTypes, mode=mode)
 
 
-@request_handler_mtgjson
-def get_deck(name: str) -> MTGJsonTypes.Deck:
+def get_deck(name: str, mode: Optional[ValidationMode] = None) -> MTGJsonTypes.Deck:
     """Get a target MTGJSON 'Deck' resource.
 
     Args:
         name: Name of the deck on MTGJSON.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
 
     Returns:
         MTGJSON 'Deck' object.
     """
-    with requests.get(
-        url=(MTGJsonURL.Decks / name).with_suffix('.json'),
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', {})
-        return MTGJsonTypes.Deck(**_obj)
+    return get_data((MTGJsonURL.Decks / name).with_suffix('.json'), MTGJsonTypes.Deck, mode=mode)
 
 
-@request_handler_mtgjson
-def get_deck_list() -> list[MTGJsonTypes.DeckList]:
+def get_deck_list(mode: Optional[ValidationMode] = None) -> list[MTGJsonTypes.DeckList]:
     """Get the current MTGJSON 'DeckList' resource.
 
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         A list of MTGJSON 'DeckList' objects.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.DeckList,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', [])
-        return [MTGJsonTypes.DeckList(**n) for n in _obj]
+    return get_data(MTGJsonURL.BulkJSON.DeckList, list[MTGJsonTypes.DeckList], mode=mode)
 
 
-@request_handler_mtgjson
-def get_keywords() -> MTGJsonTypes.Keywords:
+def get_keywords(mode: Optional[ValidationMode] = None) -> MTGJsonTypes.Keywords:
     """Get the current MTGJSON 'Keywords' resource.
 
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         MTGJSON 'Keywords' object.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.Keywords,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', {})
-        return MTGJsonTypes.Keywords(**_obj)
+    return get_data(MTGJsonURL.BulkJSON.Keywords, MTGJsonTypes.Keywords, mode=mode)
 
 
-@request_handler_mtgjson
-def get_meta() -> MTGJsonTypes.Meta:
+def get_meta(mode: Optional[ValidationMode] = None) -> MTGJsonTypes.Meta:
     """Get the current MTGJSON 'Meta' resource.
 
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         MTGJSON 'Meta' object.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.Meta,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', {})
-        return MTGJsonTypes.Meta(**_obj)
+    return get_data(MTGJsonURL.BulkJSON.Meta, MTGJsonTypes.Meta, mode=mode)
 
 
-@request_handler_mtgjson
-def get_prices_today_all() -> MTGJsonTypes.Price:
+def get_prices_today_all(mode: Optional[ValidationMode] = None) -> MTGJsonTypes.Price:
     """Get today's MTGJSON 'PriceFormats' objects mapped to their respective card UUID's.
 
+    Notes:
+        If a snapshot cache is enabled, the dataset is loaded from its snapshot until the MTGJSON version changes.
+
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         A dict with card UUID as the key, MTGJSON 'PriceFormats' object as the value.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.AllPricesToday,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', [])
-        return {k: MTGJsonTypes.PriceFormats(**v) for k, v in _obj.items()}
+    return get_snapshot('AllPricesToday', lambda: get_data(
+        MTGJsonURL.BulkJSON.AllPricesToday, MTGJsonTypes.Price, mode=mode), mode=mode)
 
 
-@request_handler_mtgjson
-def get_set(card_set: str) -> MTGJsonTypes.Set:
+def get_set(
+    card_set: str,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> MTGJsonTypes.Set:
     """Get a target MTGJSON 'Set' resource.
 
     Args:
         card_set: The set to look for, e.g. MH2
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'Set' field names to keep, e.g. ['code', 'cards.name', 'cards.uuid']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
 
     Returns:
         MTGJson 'Set' object.
     """
-    with requests.get(
-        url=(MTGJsonURL.API / card_set.upper()).with_suffix('.json'),
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', {})
-        return MTGJsonTypes.Set(**_obj)
+    return get_data(
+        (MTGJsonURL.API / card_set.upper()).with_suffix('.json'), MTGJsonTypes.Set, mode=mode, fields=fields)
 
 
-@request_handler_mtgjson
-def get_set_list() -> list[MTGJsonTypes.SetList]:
+def get_set_list(mode: Optional[ValidationMode] = None) -> list[MTGJsonTypes.SetList]:
     """Get the current MTGJSON 'SetList' resource.
 
+    Notes:
+        If a snapshot cache is enabled, the dataset is loaded from its snapshot until the MTGJSON version changes.
+
+    Args:
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
     Returns:
         A list of MTGJSON 'SetList' objects.
     """
-    with requests.get(
-        url=MTGJsonURL.BulkJSON.SetList,
-        headers=request_header_default.copy()
-    ) as res:
-        res.raise_for_status()
-        _obj = res.json().get('data', [])
-        return [MTGJsonTypes.SetList(**n) for n in _obj]
+    return get_snapshot('SetList', lambda: get_data(
+        MTGJsonURL.BulkJSON.SetList, list[MTGJsonTypes.SetList], mode=mode), mode=mode)
+
+
+"""
+* Streaming JSON Assets
+"""
+
+
+@request_handler_mtgjson
+def get_stream(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> Response:
+    """Makes a streaming GET request to a MTGJSON resource using the proper rate limits.
+
+    Notes:
+        The content isn't loaded, read it from the Response's `raw` stream and close the Response when done.
+
+    Args:
+        url: MTGJSON API request URL.
+        header: Optional headers to include in the response.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The open Response, its raw stream decodes any transfer encoding.
+    """
+    session = session or get_session(url)
+    r = session.get(str(url), headers=header, stream=True)
+    try:
+        r.raise_for_status()
+    except requests.exceptions.HTTPError:
+        r.close()
+        raise
+    r.raw.decode_content = True
+    return r
+
+
+@contextmanager
+def open_data_file(path: Union[str, os.PathLike]) -> Iterator[BinaryIO]:
+    """Opens a locally saved MTGJSON file for streaming, decompressing it if necessary.
+
+    Args:
+        path: Path to the JSON file, may be compressed if it has a '.gz', '.bz2', or '.xz' suffix.
+
+    Yields:
+        A binary file-like object.
+    """
+    path = Path(path)
+    opener = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}.get(path.suffix, open)
+    with opener(path, 'rb') as f:
+        yield f
+
+
+def iter_data_object(
+    fp: BinaryIO,
+    schema: type[T],
+    keys: Optional[Iterable[str]] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[tuple[str, T]]:
+    """Streams the 'data' object of a MTGJSON file, yielding each key and its validated value as it is parsed.
+
+    Notes:
+        Only the raw JSON of the value currently being validated is held in memory. Values of keys
+        which aren't selected are skipped by the tokenizer without being captured or validated.
+
+    Args:
+        fp: Binary file-like object to read the MTGJSON file from.
+        schema: Schema model class or type annotation of each value, e.g. `MTGJsonTypes.Set`
+        keys: Optional keys to include, reading stops once every key has been found.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional field names to keep, e.g. ['name', 'identifiers.scryfallId'], see `get_projected_model`.
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        Tuple containing the key and its validated value.
+    """
+    schema = schema if fields is None else project(schema, fields)
+    mode = ValidationMode(mode or get_validation_mode())
+    keys = keys if keys is None else frozenset(keys)
+    for key, raw in iter_json_object(fp, path=('data',), keys=keys):
+        yield key, validate_json(schema, raw, mode=mode)
+
+
+def iter_all_printings(
+    sets: Optional[Iterable[str]] = None,
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[tuple[str, MTGJsonTypes.Set]]:
+    """Streams the MTGJSON 'AllPrintings' file, yielding each 'Set' object as it is parsed.
+
+    Notes:
+        Peak memory is roughly the size of one set, the file is never loaded as a whole.
+
+    Args:
+        sets: Optional set codes to include, e.g. ['MH2', 'LTR'], other sets are skipped without being parsed.
+        header: Optional headers to include in the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'Set' field names to keep, e.g. ['code', 'cards.name', 'cards.uuid']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        Tuple containing the set code and its MTGJSON 'Set' object.
+    """
+    with get_stream(MTGJsonURL.BulkJSON.AllPrintings, header=header) as r:
+        yield from iter_data_object(
+            r.raw, MTGJsonTypes.Set, mode=mode, fields=fields,
+            keys=None if sets is None else {n.upper() for n in sets})
+
+
+def iter_all_printings_file(
+    path: Union[str, os.PathLike],
+    sets: Optional[Iterable[str]] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[tuple[str, MTGJsonTypes.Set]]:
+    """Streams a locally saved MTGJSON 'AllPrintings' file, yielding each 'Set' object as it is parsed.
+
+    Args:
+        path: Path to the 'AllPrintings' JSON file, may be compressed if it has a '.gz', '.bz2', or '.xz' suffix.
+        sets: Optional set codes to include, e.g. ['MH2', 'LTR'], other sets are skipped without being parsed.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'Set' field names to keep, e.g. ['code', 'cards.name', 'cards.uuid']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        Tuple containing the set code and its MTGJSON 'Set' object.
+    """
+    with open_data_file(path) as f:
+        yield from iter_data_object(
+            f, MTGJsonTypes.Set, mode=mode, fields=fields,
+            keys=None if sets is None else {n.upper() for n in sets})
+
+
+def iter_cards_atomic_all(
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[tuple[str, list[MTGJsonTypes.CardAtomic]]]:
+    """Streams the MTGJSON 'AtomicCards' file, yielding the 'CardAtomic' objects of each card name as they are parsed.
+
+    Notes:
+        Unlike `get_cards_atomic_all`, neither the raw file nor every card is held in memory at once.
+
+    Args:
+        header: Optional headers to include in the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'CardAtomic' field names to keep, e.g. ['name', 'identifiers.scryfallOracleId']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        Tuple containing the card name and a list of its MTGJSON 'CardAtomic' objects (one for each face).
+    """
+    with get_stream(MTGJsonURL.BulkJSON.AtomicCards, header=header) as r:
+        yield from iter_data_object(r.raw, list[MTGJsonTypes.CardAtomic], mode=mode, fields=fields)
+
+
+def iter_cards_atomic_all_file(
+    path: Union[str, os.PathLike],
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[tuple[str, list[MTGJsonTypes.CardAtomic]]]:
+    """Streams a locally saved MTGJSON 'AtomicCards' file, yielding the 'CardAtomic' objects of each card name.
+
+    Args:
+        path: Path to the 'AtomicCards' JSON file, may be compressed if it has a '.gz', '.bz2', or '.xz' suffix.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'CardAtomic' field names to keep, e.g. ['name', 'identifiers.scryfallOracleId']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        Tuple containing the card name and a list of its MTGJSON 'CardAtomic' objects (one for each face).
+    """
+    with open_data_file(path) as f:
+        yield from iter_data_object(f, list[MTGJsonTypes.CardAtomic], mode=mode, fields=fields)
+
+
+def load_cards_atomic_all(
+    sink: MutableMapping[str, list[MTGJsonTypes.CardAtomic]],
+    path: Optional[Union[str, os.PathLike]] = None,
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> int:
+    """Streams every card name and its 'CardAtomic' objects from the MTGJSON 'AtomicCards' file into a sink.
+
+    Notes:
+        The sink can be any mapping keyed by card name, e.g. a dict, a `shelve` database, or an adapter
+        which writes each card to SQLite or an Arrow writer. Cards are handed over as they are parsed,
+        so only the sink decides how much is held in memory.
+
+    Args:
+        sink: Mapping to store each card name's list of 'CardAtomic' objects in.
+        path: Optional path to a locally saved 'AtomicCards' file, the file is streamed from MTGJSON if not provided.
+        header: Optional headers to include in the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional 'CardAtomic' field names to keep, e.g. ['name', 'identifiers.scryfallOracleId']
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Returns:
+        Number of card names stored.
+    """
+    cards = iter_cards_atomic_all_file(path, mode=mode, fields=fields) if path is not None else \
+        iter_cards_atomic_all(header=header, mode=mode, fields=fields)
+    total = 0
+    for name, faces in cards:
+        sink[name] = faces
+        total += 1
+    return total
 
 
 """
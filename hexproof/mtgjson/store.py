@@ -0,0 +1,79 @@
+"""
+* MTGJSON Card Database
+* Durable SQLite storage of MTGJSON 'CardSet' objects.
+"""
+# Standard Library Imports
+from typing import Iterable, Optional
+
+# Local Imports
+from hexproof.mtgjson import schema as MTGJsonTypes
+from hexproof.utils.store import SQLiteStore
+
+"""
+* Card Database
+"""
+
+
+class CardSetDatabase(SQLiteStore[MTGJsonTypes.CardSet]):
+    """An on-disk store of MTGJSON 'CardSet' objects, indexed by UUID, printing, name, and Scryfall IDs.
+
+    Notes:
+        Full text search covers the name, type, and rules text of each card, e.g.
+        `db.search('oracle_text:flying type_line:dragon')`
+    """
+    schema = MTGJsonTypes.CardSet
+    table = 'cards'
+    key = 'uuid'
+    columns = ('set_code', 'number', 'language', 'scryfall_id', 'scryfall_oracle_id')
+    indexes = (('set_code', 'number'), ('scryfall_id',), ('scryfall_oracle_id',))
+
+    """
+    * Card Rows
+    """
+
+    def get_columns(self, obj: MTGJsonTypes.CardSet) -> tuple[Optional[str], ...]:
+        return (
+            obj.setCode.upper(), obj.number, obj.language,
+            obj.identifiers.scryfallId, obj.identifiers.scryfallOracleId)
+
+    def get_text(self, obj: MTGJsonTypes.CardSet) -> tuple[str, str, str]:
+        return obj.name, obj.type, obj.text or ''
+
+    def get_names(self, obj: MTGJsonTypes.CardSet) -> set[str]:
+        return {n for n in (obj.name, obj.faceName) if n}
+
+    """
+    * Modifying the Database
+    """
+
+    def add_sets(self, sets: Iterable[MTGJsonTypes.Set]) -> int:
+        """Add the cards of any number of MTGJSON 'Set' objects to the database.
+
+        Args:
+            sets: MTGJSON 'Set' objects, e.g. from an 'AllPrintings' file.
+
+        Returns:
+            Number of cards added.
+        """
+        return self.update(card for s in sets for card in s.cards)
+
+    """
+    * Lookups
+    """
+
+    def get_by_number(self, set_code: str, number: str) -> list[MTGJsonTypes.CardSet]:
+        """Returns every card printed in a set with a given collector number, one for each face and language.
+
+        Args:
+            set_code: Set containing this card, e.g. MH2
+            number: Collector number of the card within the given set.
+        """
+        return self.find(set_code=set_code.upper(), number=number)
+
+    def get_by_scryfall_id(self, scryfall_id: str) -> list[MTGJsonTypes.CardSet]:
+        """Returns every card matching a Scryfall ID, one for each face.
+
+        Args:
+            scryfall_id: The unique Scryfall ID of the card.
+        """
+        return self.find(scryfall_id=scryfall_id)
@@ -9,15 +9,19 @@ import requests
 import yarl
 from backoff import expo, on_exception
 from omnitils.exceptions import return_on_exception
-from omnitils.fetch import request_header_default
-from ratelimit import sleep_and_retry, RateLimitDecorator
+from requests import Response, Session
+
+# Local Imports
+from hexproof.utils.cache import get_response_cache
+from hexproof.utils.limits import TokenBucket, call_rate_limited, is_throttled, set_rate_limiter
+from hexproof.utils.sessions import get_session
 
 """
 * MTGPics Request Handlers
 """
 
-# Rate limiter to safely limit Scryfall requests
-mtgp_rate_limit = RateLimitDecorator(calls=20, period=1)
+# Rate limiter to safely limit MTGPics requests, can be swapped using `set_rate_limiter('mtgpics', ...)`
+mtgp_rate_limit = set_rate_limiter('mtgpics', TokenBucket(rate=20))
 
 
 def request_handler_mtgpics(func: Callable) -> Callable:
@@ -30,11 +34,9 @@ def request_handler_mtgpics(func: Callable) -> Callable:
         Wrapped function.
     """
 
-    @sleep_and_retry
-    @mtgp_rate_limit
-    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1)
+    @on_exception(expo, requests.exceptions.RequestException, max_tries=2, max_time=1, giveup=is_throttled)
     def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
+        return call_rate_limited('mtgpics', func, *args, **kwargs)
     return wrapper
 
 
@@ -43,24 +45,58 @@ def request_handler_mtgpics(func: Callable) -> Callable:
 """
 
 
-@return_on_exception(None)
 @request_handler_mtgpics
-def get_page_html(url: str | yarl.URL, headers: Optional[dict[str, str]] = None) -> Optional[bytes]:
+def get_response(
+    url: str | yarl.URL,
+    headers: Optional[dict[str, str]] = None,
+    session: Optional[Session] = None
+) -> Response:
+    """Makes a GET request to a page on MTGPics using the appropriate rate limits.
+
+    Args:
+        url: URL to the page.
+        headers: Headers object to pass with request, uses default if not provided.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The Response, with its content loaded.
+    """
+    session = session or get_session(url)
+    with session.get(str(url), headers=headers) as r:
+        r.raise_for_status()
+        return r
+
+
+@return_on_exception(None)
+def get_page_html(
+    url: str | yarl.URL,
+    headers: Optional[dict[str, str]] = None,
+    session: Optional[Session] = None
+) -> Optional[bytes]:
     """Grab the HTML from a page on MTGPics.
 
+    Notes:
+        If a response cache is enabled, cached pages are used where possible. Fresh pages
+        are returned without making a request, so they don't count against the rate limit.
+
     Args:
         url: URL to the page.
         headers: Headers object to pass with request, uses default if not provided.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
 
     Returns:
         The page as bytes if successful, None otherwise.
     """
-    headers = request_header_default.copy() if headers is None else headers
-    with requests.get(url, headers=headers) as r:
-        r.raise_for_status()
+    if (cache := get_response_cache()) is not None:
+        content = cache.fetch(
+            url=url,
+            request=lambda h: get_response(url=url, headers=h, session=session),
+            header=headers)
+    else:
+        content = get_response(url=url, headers=headers, session=session).content
 
-        # Check known cases of invalid page returned
-        if "Wrong ref or number." not in r.text:
-            if "No card found." not in r.text:
-                return r.content
-        return None
+    # Check known cases of invalid page returned
+    if b"Wrong ref or number." not in content:
+        if b"No card found." not in content:
+            return content
+    return None
@@ -42,6 +42,7 @@ class ScryURL:
         class Cards:
             """Scryfall API 'Card' object endpoints."""
             Main = __SCRY_API__ / 'cards'
+            Collection = Main / 'collection'
             Named = Main / 'named'
             Search = Main / 'search'
 
@@ -72,6 +73,17 @@ class ScryURL:
             """Scryfall API bulk data endpoints."""
             All = __SCRY_API__ / 'bulk-data'
 
+        @dataclass
+        class Migrations:
+            """Scryfall API 'Migration' object endpoints."""
+            All = __SCRY_API__ / 'migrations'
+
+        @dataclass
+        class Symbology:
+            """Scryfall API 'CardSymbol' object endpoints."""
+            All = __SCRY_API__ / 'symbology'
+            ParseMana = All / 'parse-mana'
+
 
 """
 * Color Enums
@@ -262,3 +274,21 @@ class MigrationStrategy(StrConstant):
     """Migration strategies as defined by Scryfall."""
     Merge = 'merge'
     Delete = 'delete'
+
+
+"""
+* Bulk Data Enums
+"""
+
+
+class BulkDataType(StrConstant):
+    """Bulk data file types as defined by Scryfall.
+
+    Notes:
+        https://scryfall.com/docs/api/bulk-data
+    """
+    OracleCards = 'oracle_cards'
+    UniqueArtwork = 'unique_artwork'
+    DefaultCards = 'default_cards'
+    AllCards = 'all_cards'
+    Rulings = 'rulings'
@@ -1,25 +1,43 @@
 """
 * Scryfall Request Handling
 """
-# Third Party Imports
+# Standard Library Imports
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 # Third Party Imports
-import requests
 import yarl
-from omnitils.fetch import request_header_default, download_file
 from omnitils.strings import normalize_str
-from ratelimit import sleep_and_retry, RateLimitDecorator
 from backoff import on_exception, expo
-from requests import RequestException
+from requests import RequestException, Response, Session
 
 # Local Imports
-from hexproof.scryfall.enums import ScryURL
+from hexproof.scryfall.enums import BulkDataType, ScryURL
 from hexproof.scryfall import schema as ScrySchema
+from hexproof.scryfall.index import get_card_store
+from hexproof.scryfall.names import get_name_matcher
+from hexproof.utils.cache import get_response_cache
+from hexproof.utils.limits import TokenBucket, call_rate_limited, is_throttled, set_rate_limiter
+from hexproof.utils.projection import project
+from hexproof.utils.sessions import download_file, get_session
+from hexproof.utils.snapshots import get_snapshot_cache
+from hexproof.utils.streaming import iter_json_array
+from hexproof.utils.validation import ValidationMode, get_validation_mode, validate_json
+
+# Rate limiter to safely limit Scryfall requests, can be swapped using `set_rate_limiter('scryfall', ...)`
+scryfall_rate_limit = set_rate_limiter('scryfall', TokenBucket(rate=20))
+
+# Maximum number of identifiers accepted per `/cards/collection` request
+collection_chunk_size = 75
+
+# Minimum similarity score for a fuzzy name to be resolved locally by the name matcher
+fuzzy_min_score = 0.8
 
-# Rate limiter to safely limit MTGJSON requests
-scryfall_rate_limit = RateLimitDecorator(calls=20, period=1)
+# Minimum lead of the best local fuzzy match over the runner-up, closer matches are left to Scryfall
+fuzzy_min_margin = 0.1
 
 
 """
@@ -34,6 +52,7 @@ def request_handler_scryfall(func) -> Callable:
         Scryfall recommends a 5-10 millisecond delay between requests.
         We target the floor of this recommendation: 20 requests/second.
         Might consider dropping this to 10 requests/second in the future.
+        The limiter is looked up on each call, so a shared backend can be swapped in at any time.
         https://scryfall.com/docs/api
 
     Args:
@@ -42,11 +61,9 @@ def request_handler_scryfall(func) -> Callable:
     Returns:
         The wrapped function.
     """
-    @sleep_and_retry
-    @scryfall_rate_limit
-    @on_exception(expo, RequestException, max_tries=2, max_time=1)
+    @on_exception(expo, RequestException, max_tries=2, max_time=1, giveup=is_throttled)
     def decorator(*args, **kwargs):
-        return func(*args, **kwargs)
+        return call_rate_limited('scryfall', func, *args, **kwargs)
     return decorator
 
 
@@ -56,7 +73,12 @@ def request_handler_scryfall(func) -> Callable:
 
 
 @request_handler_scryfall
-def get_file(url: yarl.URL, path: Path, header: Optional[dict] = None) -> Optional[Path]:
+def get_file(
+    url: yarl.URL,
+    path: Path,
+    header: Optional[dict] = None,
+    session: Optional[Session] = None
+) -> Optional[Path]:
     """Download a file from Scryfall's CDN (jpeg, svg, etc) using the appropriate rate limits.
 
     Note:
@@ -66,6 +88,7 @@ def get_file(url: yarl.URL, path: Path, header: Optional[dict] = None) -> Option
         url: Scryfall CDN resource URL.
         path: Path to save the file.
         header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
 
     Returns:
         Path if the file is successfully downloaded.
@@ -74,23 +97,85 @@ def get_file(url: yarl.URL, path: Path, header: Optional[dict] = None) -> Option
         download_file(
             url=url,
             path=path,
-            header=header))
+            header=header,
+            session=session))
 
 
 @request_handler_scryfall
-def get_json(url: yarl.URL, header: Optional[dict] = None) -> dict:
+def get_response(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> Response:
+    """Makes a GET request to a Scryfall API endpoint using the appropriate rate limits.
+
+    Args:
+        url: Scryfall API request URL.
+        header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The Response, with its content loaded.
+    """
+    session = session or get_session(url)
+    with session.get(str(url), headers=header) as r:
+        r.raise_for_status()
+        return r
+
+
+def get_content(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> bytes:
+    """Retrieves the raw content of a Scryfall API request using the appropriate rate limits.
+
+    Notes:
+        If a response cache is enabled, cached responses are used where possible. Fresh responses
+        are returned without making a request, so they don't count against the rate limit.
+
+    Args:
+        url: Scryfall API request URL.
+        header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        The raw response body.
+    """
+    if (cache := get_response_cache()) is not None:
+        return cache.fetch(
+            url=url,
+            request=lambda h: get_response(url=url, header=h, session=session),
+            header=header)
+    return get_response(url=url, header=header, session=session).content
+
+
+def get_json(url: yarl.URL, header: Optional[dict] = None, session: Optional[Session] = None) -> dict:
     """Retrieves JSON results from a Scryfall API request using the appropriate rate limits.
 
     Args:
         url: Scryfall API request URL.
         header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
 
     Returns:
         Dict containing data from the JSON response.
     """
-    if header is None:
-        header = request_header_default.copy()
-    with requests.get(str(url), headers=header) as r:
+    return json.loads(get_content(url=url, header=header, session=session))
+
+
+@request_handler_scryfall
+def post_json(
+    url: yarl.URL,
+    data: dict,
+    header: Optional[dict] = None,
+    session: Optional[Session] = None
+) -> dict:
+    """Posts a JSON body to a Scryfall API endpoint and retrieves the JSON results using the appropriate rate limits.
+
+    Args:
+        url: Scryfall API request URL.
+        data: JSON serializable data to send as the request body.
+        header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+
+    Returns:
+        Dict containing data from the JSON response.
+    """
+    session = session or get_session(url)
+    with session.post(str(url), json=data, headers=header) as r:
         r.raise_for_status()
         return r.json()
 
@@ -98,7 +183,8 @@ def get_json(url: yarl.URL, header: Optional[dict] = None) -> dict:
 def get_paginated_list(
     url: yarl.URL,
     list_object: ScrySchema.ScryfallListSchema = ScrySchema.ListObject,
-    header: Optional[dict] = None
+    header: Optional[dict] = None,
+    session: Optional[Session] = None
 ) -> ScrySchema.ScryfallList:
     """Processes a Scryfall API request which returns paginated results, appending each page of results to
         the first ListObject gathered.
@@ -107,28 +193,67 @@ def get_paginated_list(
         url: Scryfall API request URL.
         list_object: Scryfall schema to use when processing the ListObject returned.
         header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
 
     Returns:
         A ListObject (CardList, SetList, etc) containing the results of all pages.
     """
+    obj = page = validate_json(list_object, get_content(url=url, header=header, session=session))
 
-    # Grab the first page
-    obj = list_object(
-        **get_json(
-            url=url,
-            header=header))
-
-    # Append the next page of results
-    if obj.has_more and obj.next_page:
-        obj.data.extend(
-            get_paginated_list(
-                url=yarl.URL(obj.next_page),
-                list_object=list_object,
-                header=header
-            ).data)
+    # Append each following page of results
+    while page.has_more and page.next_page:
+        page = validate_json(list_object, get_content(
+            url=yarl.URL(page.next_page), header=header, session=session))
+        obj.data.extend(page.data)
     return obj
 
 
+def iter_paginated_list(
+    url: yarl.URL,
+    list_object: ScrySchema.ScryfallListSchema = ScrySchema.ListObject,
+    header: Optional[dict] = None,
+    session: Optional[Session] = None,
+    prefetch: bool = True
+) -> Iterator:
+    """Processes a Scryfall API request which returns paginated results, yielding each object one page at a time.
+
+    Notes:
+        While the objects on one page are being consumed, the next page is requested in a background
+        thread. Closing the generator early stops any further pages from being requested.
+
+    Args:
+        url: Scryfall API request URL.
+        list_object: Scryfall schema to use when processing each ListObject returned.
+        header: Optional header to pass with the request.
+        session: Optional session to make the request with, uses the pooled session for this host if not provided.
+        prefetch: Whether to request the next page while the current page is being consumed.
+
+    Yields:
+        Each object contained in the 'data' of a ListObject (Card, Set, etc).
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = validate_json(list_object, get_content(url=url, header=header, session=session))
+        while True:
+
+            # Request the next page before yielding the current page
+            next_url = yarl.URL(page.next_page) if page.has_more and page.next_page else None
+            future = executor.submit(
+                get_content, url=next_url, header=header, session=session
+            ) if executor and next_url else None
+            yield from page.data
+
+            # Move on to the next page
+            if next_url is None:
+                return
+            page = validate_json(list_object, (
+                future.result() if future else
+                get_content(url=next_url, header=header, session=session)))
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 """
 * Request Object
 * Schema: Card
@@ -138,6 +263,9 @@ def get_paginated_list(
 def get_card_unique(uid: str, header: Optional[dict] = None) -> ScrySchema.Card:
     """Grabs a 'Card' object from Scryfall's `/cards/{uid}` endpoint.
 
+    Notes:
+        If a local card store is enabled, it is consulted before making a request.
+
     Args:
         uid: The unique Scryfall ID of the card.
         header: Optional header to pass with the request.
@@ -145,11 +273,10 @@ def get_card_unique(uid: str, header: Optional[dict] = None) -> ScrySchema.Card:
     Returns:
         A Scryfall 'Card' object.
     """
+    if (store := get_card_store()) is not None and (card := store.get_by_id(uid)):
+        return card
     url = ScryURL.API.Cards.Main / uid
-    return ScrySchema.Card(
-        **get_json(
-            url=url,
-            header=header))
+    return validate_json(ScrySchema.Card, get_content(url=url, header=header))
 
 
 def get_card_numbered(
@@ -160,6 +287,9 @@ def get_card_numbered(
 ) -> ScrySchema.Card:
     """Grabs a 'Card' object from Scryfall's `/cards/{set}/{num}/{lang}` endpoint.
 
+    Notes:
+        If a local card store is enabled, it is consulted before making a request.
+
     Args:
         set_code: Set containing this card.
         number: Collector number of the card within the given set.
@@ -169,15 +299,14 @@ def get_card_numbered(
     Returns:
         A Scryfall 'Card' object.
     """
+    if (store := get_card_store()) is not None and (card := store.get_by_number(set_code, number, lang)):
+        return card
     url = ScryURL.API.Cards.Main / set_code / number
     if lang:
         url = url / lang
 
     # Request data
-    return ScrySchema.Card(
-        **get_json(
-            url=url,
-            header=header))
+    return validate_json(ScrySchema.Card, get_content(url=url, header=header))
 
 
 def get_card_named(
@@ -188,6 +317,12 @@ def get_card_named(
 ) -> ScrySchema.Card:
     """Grabs a 'Card' object from Scryfall's `/cards/named/{name}` endpoint.
 
+    Notes:
+        If a name matcher is enabled, fuzzy names it matches confidently are resolved locally and looked
+        up as exact names, i.e. the best match scores at least `fuzzy_min_score` and leads the runner-up
+        by `fuzzy_min_margin`. Any other fuzzy name is sent to Scryfall.
+        If a local card store is enabled, it is consulted before making an exact name request.
+
     Args:
         name: The name of the card.
         set_code: Optionally limit the search to one set.
@@ -197,6 +332,15 @@ def get_card_named(
     Returns:
         A Scryfall 'Card' object.
     """
+    if not exact and (matcher := get_name_matcher()) is not None:
+        if name in matcher:
+            name, exact = matcher.match_best(name), True
+        elif (matches := matcher.match(name, limit=2)) and matches[0].score >= fuzzy_min_score and (
+            len(matches) == 1 or matches[0].score - matches[1].score >= fuzzy_min_margin
+        ):
+            name, exact = matches[0].name, True
+    if exact and (store := get_card_store()) is not None and (card := store.get_by_name(name, set_code)):
+        return card
 
     # Create the base query
     search_method = 'exact' if exact else 'fuzzy'
@@ -206,10 +350,7 @@ def get_card_named(
     url = ScryURL.API.Cards.Named.with_query(query)
 
     # Request data
-    return ScrySchema.Card(
-        **get_json(
-            url=url,
-            header=header))
+    return validate_json(ScrySchema.Card, get_content(url=url, header=header))
 
 
 """
@@ -231,10 +372,29 @@ def get_catalog(name: str, header: Optional[dict] = None) -> ScrySchema.Catalog:
     url = ScryURL.API.Catalogs.Main / name.lower()
 
     # Request data
-    return ScrySchema.Catalog(
-        **get_json(
-            url=url,
-            header=header))
+    return validate_json(ScrySchema.Catalog, get_content(url=url, header=header))
+
+
+"""
+* Request Object
+* Schema: ManaCost
+"""
+
+
+def get_mana_cost(cost: str, header: Optional[dict] = None) -> ScrySchema.ManaCost:
+    """Grabs a 'ManaCost' object from Scryfall's `/symbology/parse-mana` endpoint.
+
+    Args:
+        cost: The mana cost string to parse, e.g. {2}{W/U}{W/U}
+        header: Optional header to pass with the request.
+
+    Returns:
+        A Scryfall 'ManaCost' object.
+    """
+    url = ScryURL.API.Symbology.ParseMana.with_query({'cost': cost})
+
+    # Request data
+    return validate_json(ScrySchema.ManaCost, get_content(url=url, header=header))
 
 
 """
@@ -256,15 +416,34 @@ def get_set(set_code: str, header: Optional[dict] = None) -> ScrySchema.Set:
     url = ScryURL.API.Sets.All / set_code.lower()
 
     # Request data
-    return ScrySchema.Set(
-        **get_json(
-            url=url,
-            header=header))
+    return validate_json(ScrySchema.Set, get_content(url=url, header=header))
+
+
+"""
+* Request Object
+* Schema: BulkData
+"""
+
+
+def get_bulk_data(bulk_type: str, header: Optional[dict] = None) -> ScrySchema.BulkData:
+    """Grabs a 'BulkData' object from Scryfall's `/bulk-data/{type}` endpoint.
+
+    Args:
+        bulk_type: The type of bulk data file to look for, e.g. default_cards
+        header: Optional header to pass with the request.
+
+    Returns:
+        A Scryfall 'BulkData' object.
+    """
+    url = ScryURL.API.Bulk.All / bulk_type.lower()
+
+    # Request data
+    return validate_json(ScrySchema.BulkData, get_content(url=url, header=header))
 
 
 """
 * Request List of Objects
-* Schema: SetList, CardList, RulingList
+* Schema: SetList, CardList, RulingList, BulkDataList, CardSymbolList, CardMigrationList
 """
 
 
@@ -280,14 +459,10 @@ def get_card_rulings(set_code: str, number: str, header: Optional[dict] = None)
     Returns:
         A list of Scryfall 'Ruling' objects.
     """
-    url = ScryURL.API.Cards.Main / set_code.lower() / number / 'rulings'
-
-    # Request data
-    return get_paginated_list(
-        url=url,
-        list_object=ScrySchema.RulingList,
-        header=header
-    ).data
+    return list(iter_card_rulings(
+        set_code=set_code,
+        number=number,
+        header=header))
 
 
 def get_card_list(params: Optional[dict] = None, header: Optional[dict] = None) -> list[ScrySchema.Card]:
@@ -301,33 +476,405 @@ def get_card_list(params: Optional[dict] = None, header: Optional[dict] = None)
     Returns:
         A list of Scryfall 'Card' objects.
     """
+    return list(iter_card_list(
+        params=params,
+        header=header))
+
+
+def get_set_list(header: Optional[dict] = None) -> list[ScrySchema.Set]:
+    """Grab a 'SetList' object from Scryfall's `/sets/` endpoint and return the list of 'Set' objects.
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Returns:
+        A list of Scryfall 'Set' objects.
+    """
+    return list(iter_set_list(header=header))
+
+
+def iter_card_rulings(set_code: str, number: str, header: Optional[dict] = None) -> Iterator[ScrySchema.Ruling]:
+    """Yields each 'Ruling' object from Scryfall's `/cards/{code}/{number}/rulings` endpoint, one page at a time.
+
+    Args:
+        set_code: The set code of the card to look for, e.g. MH2
+        number: The collector number of the card to look for, as a string.
+        header: Optional header to pass with the request.
+
+    Yields:
+        A Scryfall 'Ruling' object.
+    """
+    url = ScryURL.API.Cards.Main / set_code.lower() / number / 'rulings'
+
+    # Request data
+    yield from iter_paginated_list(
+        url=url,
+        list_object=ScrySchema.RulingList,
+        header=header)
+
+
+def iter_card_list(params: Optional[dict] = None, header: Optional[dict] = None) -> Iterator[ScrySchema.Card]:
+    """Yields each 'Card' object from Scryfall's `/cards/search` endpoint matching a provided query,
+        one page at a time.
+
+    Args:
+        params: Search parameters to pass with request.
+        header: Optional header to pass with the request.
+
+    Yields:
+        A Scryfall 'Card' object.
+    """
     url = ScryURL.API.Cards.Search.with_query(params)
 
     # Request data
-    return get_paginated_list(
+    yield from iter_paginated_list(
         url=url,
         list_object=ScrySchema.CardList,
-        header=header
-    ).data
+        header=header)
 
 
-def get_set_list(header: Optional[dict] = None) -> list[ScrySchema.Set]:
-    """Grab a 'SetList' object from Scryfall's `/sets/` endpoint and return the list of 'Set' objects.
+def iter_set_list(header: Optional[dict] = None) -> Iterator[ScrySchema.Set]:
+    """Yields each 'Set' object from Scryfall's `/sets/` endpoint, one page at a time.
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Yields:
+        A Scryfall 'Set' object.
+    """
+    # Request data
+    yield from iter_paginated_list(
+        url=ScryURL.API.Sets.All,
+        list_object=ScrySchema.SetList,
+        header=header)
+
+
+def get_card_symbol_list(header: Optional[dict] = None) -> list[ScrySchema.CardSymbol]:
+    """Grab a 'CardSymbolList' object from Scryfall's `/symbology` endpoint and return the list of
+        'CardSymbol' objects.
 
     Args:
         header: Optional header to pass with the request.
 
     Returns:
-        A list of Scryfall 'Set' objects.
+        A list of Scryfall 'CardSymbol' objects.
+    """
+    return list(iter_card_symbol_list(header=header))
+
+
+def iter_card_symbol_list(header: Optional[dict] = None) -> Iterator[ScrySchema.CardSymbol]:
+    """Yields each 'CardSymbol' object from Scryfall's `/symbology` endpoint, one page at a time.
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Yields:
+        A Scryfall 'CardSymbol' object.
+    """
+    # Request data
+    yield from iter_paginated_list(
+        url=ScryURL.API.Symbology.All,
+        list_object=ScrySchema.CardSymbolList,
+        header=header)
+
+
+def get_migration_list(header: Optional[dict] = None) -> list[ScrySchema.CardMigration]:
+    """Grab a 'CardMigrationList' object from Scryfall's `/migrations` endpoint and return the list of
+        'CardMigration' objects.
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Returns:
+        A list of Scryfall 'CardMigration' objects.
+    """
+    return list(iter_migration_list(header=header))
+
+
+def iter_migration_list(header: Optional[dict] = None) -> Iterator[ScrySchema.CardMigration]:
+    """Yields each 'CardMigration' object from Scryfall's `/migrations` endpoint, one page at a time.
+
+    Notes:
+        Migrations are listed from most to least recently performed.
+        See docs: https://scryfall.com/docs/api/migrations
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Yields:
+        A Scryfall 'CardMigration' object.
+    """
+    # Request data
+    yield from iter_paginated_list(
+        url=ScryURL.API.Migrations.All,
+        list_object=ScrySchema.CardMigrationList,
+        header=header)
+
+
+def _get_identifier_key(ident: ScrySchema.CardIdentifiers) -> tuple[tuple[str, str], ...]:
+    """Returns a comparable key of a card identifier, names are normalized and other values lowercased."""
+    return tuple(sorted(
+        (k, normalize_str(v) if k == 'name' else str(v).lower())
+        for k, v in ident.model_dump(exclude_none=True).items()))
+
+
+def _get_card_identifier_keys(card: ScrySchema.Card) -> set[tuple[tuple[str, str], ...]]:
+    """Returns the key of every card identifier which could have matched a card, see `_get_identifier_key`."""
+    faces = card.card_faces or []
+    names = {normalize_str(card.name), *(normalize_str(f.name) for f in faces)}
+    values = {
+        'id': {card.id},
+        'mtgo_id': {card.mtgo_id},
+        'multiverse_id': set(card.multiverse_ids or []),
+        'oracle_id': {card.oracle_id, *(f.oracle_id for f in faces)},
+        'illustration_id': {card.illustration_id, *(f.illustration_id for f in faces)}}
+    keys = {((k, str(v).lower()),) for k, items in values.items() for v in items if v is not None}
+    card_set = card.set.lower()
+    keys.update(((('name', n),) for n in names))
+    keys.update(((('name', n), ('set', card_set)) for n in names))
+    keys.add((('collector_number', card.collector_number.lower()), ('set', card_set)))
+    return keys
+
+
+def get_card_collection(
+    identifiers: Iterable[Union[ScrySchema.CardIdentifiers, dict]],
+    header: Optional[dict] = None,
+    max_workers: int = 4
+) -> ScrySchema.CardCollection:
+    """Grab a 'CardCollection' object from Scryfall's `/cards/collection` endpoint matching any number of
+        card identifiers.
+
+    Notes:
+        Identifiers are sent in chunks of 75, the maximum accepted per request. Chunks are requested
+        concurrently within the Scryfall rate limit. Duplicate identifiers are only requested once,
+        but the results keep one entry per identifier provided, e.g. each copy of a card in a decklist.
+        See docs: https://scryfall.com/docs/api/cards/collection
+
+    Args:
+        identifiers: Card identifiers to look for, each must contain a valid combination of keys.
+        header: Optional header to pass with the request.
+        max_workers: Maximum number of chunks to request at once.
+
+    Returns:
+        A 'CardCollection' containing a matched card for each identifier in the order provided, and any
+            identifiers which didn't match a card.
+    """
+    identifiers = [
+        n if isinstance(n, ScrySchema.CardIdentifiers) else ScrySchema.CardIdentifiers(**n)
+        for n in identifiers]
+    keys = [_get_identifier_key(n) for n in identifiers]
+    unique: dict[tuple, ScrySchema.CardIdentifiers] = {}
+    for key, ident in zip(keys, identifiers):
+        unique.setdefault(key, ident)
+    unique = list(unique.values())
+    chunks = [
+        unique[i:i + collection_chunk_size]
+        for i in range(0, len(unique), collection_chunk_size)]
+
+    def _get_chunk(chunk: list[ScrySchema.CardIdentifiers]) -> ScrySchema.CardCollection:
+        return ScrySchema.CardCollection(
+            **post_json(
+                url=ScryURL.API.Cards.Collection,
+                data={'identifiers': [n.model_dump(exclude_none=True) for n in chunk]},
+                header=header))
+
+    # Request each chunk, then match each returned card back to the identifiers it satisfies
+    matched: dict[tuple, ScrySchema.Card] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        for chunk, result in zip(chunks, executor.map(_get_chunk, chunks)):
+            chunk_keys = [_get_identifier_key(n) for n in chunk]
+            missing = {_get_identifier_key(n) for n in result.not_found}
+            unclaimed = []
+            for card in result.data:
+                card_keys = _get_card_identifier_keys(card)
+                found = [k for k in chunk_keys if k in card_keys and k not in matched and k not in missing]
+                for key in found:
+                    matched[key] = card
+                if not found:
+                    unclaimed.append(card)
+
+            # Cards which couldn't be matched by key, e.g. a fuzzy name match, fill the remaining identifiers in order
+            unclaimed = iter(unclaimed)
+            for key in chunk_keys:
+                if key not in missing and key not in matched and (card := next(unclaimed, None)):
+                    matched[key] = card
+
+    # Expand the results back to one entry per identifier provided, any identifier without a card wasn't found
+    data, not_found = [], []
+    for ident, key in zip(identifiers, keys):
+        if (card := matched.get(key)) is not None:
+            data.append(card)
+        else:
+            not_found.append(ident)
+    return ScrySchema.CardCollection(
+        data=data,
+        has_more=False,
+        not_found=not_found,
+        total_cards=len(data))
+
+
+def get_bulk_data_list(header: Optional[dict] = None) -> list[ScrySchema.BulkData]:
+    """Grab a 'BulkDataList' object from Scryfall's `/bulk-data` endpoint and return the list of 'BulkData' objects.
+
+    Args:
+        header: Optional header to pass with the request.
+
+    Returns:
+        A list of Scryfall 'BulkData' objects.
     """
     # Request data
     return get_paginated_list(
-            url=ScryURL.API.Sets.All,
-            list_object=ScrySchema.SetList,
-            header=header
+        url=ScryURL.API.Bulk.All,
+        list_object=ScrySchema.BulkDataList,
+        header=header
     ).data
 
 
+"""
+* Streaming Bulk Data
+"""
+
+
+def iter_bulk_data(
+    bulk: Union[str, ScrySchema.BulkData] = BulkDataType.DefaultCards,
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[Union[ScrySchema.Card, ScrySchema.Ruling]]:
+    """Streams a Scryfall bulk data file, yielding each object as it is parsed.
+
+    Notes:
+        The download is decompressed and tokenized incrementally, only the raw JSON of the
+        object currently being validated is held in memory.
+        See docs: https://scryfall.com/docs/api/bulk-data
+
+    Args:
+        bulk: Type of bulk data file to stream, or a 'BulkData' object describing it.
+        header: Optional header to pass with the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional field names to keep, e.g. ['name', 'prices.usd'], see `get_projected_model`.
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        A Scryfall 'Ruling' object for the 'rulings' file, otherwise a Scryfall 'Card' object.
+    """
+    if not isinstance(bulk, ScrySchema.BulkData):
+        bulk = get_bulk_data(bulk, header=header)
+    schema = ScrySchema.Ruling if bulk.type == BulkDataType.Rulings else ScrySchema.Card
+    schema = schema if fields is None else project(schema, fields)
+    mode = ValidationMode(mode or get_validation_mode())
+
+    # Stream the file, decompress manually if not handled by the transfer encoding
+    with get_session(bulk.download_uri).get(bulk.download_uri, headers=header, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        fp = r.raw
+        if bulk.content_encoding == 'gzip' and 'gzip' not in r.headers.get('Content-Encoding', ''):
+            fp = gzip.GzipFile(fileobj=r.raw)
+        for raw in iter_json_array(fp):
+            yield validate_json(schema, raw, mode=mode)
+
+
+def iter_bulk_cards(
+    bulk_type: str = BulkDataType.DefaultCards,
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[ScrySchema.Card]:
+    """Streams a Scryfall bulk data file containing cards, yielding each 'Card' object as it is parsed.
+
+    Args:
+        bulk_type: Type of bulk data file to stream, e.g. default_cards, all_cards, oracle_cards
+        header: Optional header to pass with the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional field names to keep, e.g. ['name', 'prices.usd'], see `get_projected_model`.
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        A Scryfall 'Card' object.
+
+    Raises:
+        ValueError: If the bulk data type doesn't contain cards.
+    """
+    if bulk_type == BulkDataType.Rulings:
+        raise ValueError("Bulk data type 'rulings' doesn't contain 'Card' objects!")
+    yield from iter_bulk_data(bulk_type, header=header, mode=mode, fields=fields)
+
+
+def get_bulk_card_list(
+    bulk_type: str = BulkDataType.DefaultCards,
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None
+) -> list[ScrySchema.Card]:
+    """Get a list of every 'Card' object in a Scryfall bulk data file.
+
+    Notes:
+        If a snapshot cache is enabled, the list is loaded from its snapshot until the bulk data
+        file's 'updated_at' changes. Each validation mode has its own snapshot.
+
+    Args:
+        bulk_type: Type of bulk data file to load, e.g. default_cards, all_cards, oracle_cards
+        header: Optional header to pass with the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
+    Returns:
+        A list of Scryfall 'Card' objects.
+
+    Raises:
+        ValueError: If the bulk data type doesn't contain cards.
+    """
+    if bulk_type == BulkDataType.Rulings:
+        raise ValueError("Bulk data type 'rulings' doesn't contain 'Card' objects!")
+    bulk, mode = get_bulk_data(bulk_type, header=header), ValidationMode(mode or get_validation_mode())
+    if (cache := get_snapshot_cache()) is None:
+        return list(iter_bulk_data(bulk, header=header, mode=mode))
+    return cache.fetch(
+        name=f'scryfall_{bulk.type}_{mode}',
+        version=str(bulk.updated_at),
+        load=lambda: list(iter_bulk_data(bulk, header=header, mode=mode)))
+
+
+def iter_bulk_rulings(
+    header: Optional[dict] = None,
+    mode: Optional[ValidationMode] = None
+) -> Iterator[ScrySchema.Ruling]:
+    """Streams the Scryfall 'rulings' bulk data file, yielding each 'Ruling' object as it is parsed.
+
+    Args:
+        header: Optional header to pass with the request.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+
+    Yields:
+        A Scryfall 'Ruling' object.
+    """
+    yield from iter_bulk_data(BulkDataType.Rulings, header=header, mode=mode)
+
+
+def iter_bulk_file(
+    path: Path,
+    schema: Union[type[ScrySchema.Card], type[ScrySchema.Ruling]] = ScrySchema.Card,
+    mode: Optional[ValidationMode] = None,
+    fields: Optional[Iterable[str]] = None
+) -> Iterator[Union[ScrySchema.Card, ScrySchema.Ruling]]:
+    """Streams a locally saved Scryfall bulk data file, yielding each object as it is parsed.
+
+    Args:
+        path: Path to the bulk data JSON file, may be gzip compressed if it has a '.gz' suffix.
+        schema: Scryfall schema to validate each object with.
+        mode: Validation mode to use, e.g. 'construct' or 'strict', uses the global validation mode if not provided.
+        fields: Optional field names to keep, e.g. ['name', 'prices.usd'], see `get_projected_model`.
+            If provided, objects of the projected model are returned, which aren't instances of the full schema.
+
+    Yields:
+        A Scryfall object matching the provided schema.
+    """
+    schema = schema if fields is None else project(schema, fields)
+    mode = ValidationMode(mode or get_validation_mode())
+    with (gzip.open(path, 'rb') if path.suffix == '.gz' else open(path, 'rb')) as f:
+        for raw in iter_json_array(f):
+            yield validate_json(schema, raw, mode=mode)
+
+
 """
 * Downloading JSON Assets
 """
@@ -0,0 +1,449 @@
+"""
+* Scryfall Async Request Handling
+* Requires the optional 'async' dependencies: pip install hexproof[async]
+"""
+# Standard Library Imports
+import asyncio
+from pathlib import Path
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
+
+# Third Party Imports
+import aiohttp
+import yarl
+from backoff import on_exception, expo
+from omnitils.fetch import request_header_default, chunk_size_default
+from omnitils.strings import normalize_str
+
+# Local Imports
+from hexproof.scryfall.enums import ScryURL
+from hexproof.scryfall import schema as ScrySchema
+from hexproof.utils.limits import AsyncTokenBucket, parse_retry_after, throttle_status_codes
+
+# Rate limiter shared by every coroutine making Scryfall requests
+scryfall_async_rate_limit = AsyncTokenBucket(rate=20)
+
+# Maximum number of throttled attempts before a request gives up
+max_throttled = 5
+
+# Sessions created for each running event loop
+_sessions: WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession] = WeakKeyDictionary()
+
+"""
+* Handlers
+"""
+
+
+def request_handler_scryfall(func) -> Callable:
+    """Wrapper for an async Scryfall request function to handle retries and rate limits.
+
+    Notes:
+        Every wrapped coroutine draws from the same token bucket, so any number of requests can
+        be awaited concurrently while the overall request rate stays within Scryfall's limits.
+        Throttled requests slow the bucket down and are retried after the server's 'Retry-After' delay.
+        https://scryfall.com/docs/api
+
+    Args:
+        func: Scryfall request coroutine function to wrap.
+
+    Returns:
+        The wrapped coroutine function.
+    """
+    @on_exception(expo, aiohttp.ClientError, max_tries=2, max_time=1, giveup=is_throttled)
+    async def decorator(*args, **kwargs):
+        attempt = 0
+        while True:
+            await scryfall_async_rate_limit.acquire()
+            try:
+                result = await func(*args, **kwargs)
+            except aiohttp.ClientResponseError as e:
+                attempt += 1
+                if not is_throttled(e) or attempt >= max_throttled:
+                    raise
+                scryfall_async_rate_limit.throttle(get_retry_after(e))
+                continue
+            scryfall_async_rate_limit.recover()
+            return result
+    return decorator
+
+
+def is_throttled(error: aiohttp.ClientError) -> bool:
+    """Whether a request failed because Scryfall is throttling the client.
+
+    Args:
+        error: Exception raised by a failed request.
+    """
+    return isinstance(error, aiohttp.ClientResponseError) and error.status in throttle_status_codes
+
+
+def get_retry_after(error: aiohttp.ClientResponseError) -> Optional[float]:
+    """Returns the number of seconds a throttled response asked the client to wait.
+
+    Args:
+        error: Exception raised by a failed request.
+
+    Returns:
+        Seconds to wait parsed from the 'Retry-After' header, or None if the header is missing or invalid.
+    """
+    return parse_retry_after(error.status, error.headers)
+
+
+"""
+* Session Utilities
+"""
+
+
+def get_session(limit: int = 100) -> aiohttp.ClientSession:
+    """Returns the shared client session for the running event loop, creating it if necessary.
+
+    Args:
+        limit: Maximum number of simultaneous connections the session can open.
+
+    Returns:
+        A pooled aiohttp client session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit),
+            headers=request_header_default.copy())
+        _sessions[loop] = session
+    return session
+
+
+async def close_session() -> None:
+    """Close the shared client session for the running event loop, if one was created."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+"""
+* Request Utilities
+"""
+
+
+@request_handler_scryfall
+async def get_file(
+    url: yarl.URL,
+    path: Path,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> Optional[Path]:
+    """Download a file from Scryfall's CDN (jpeg, svg, etc) using the appropriate rate limits.
+
+    Note:
+        See docs: https://scryfall.com/docs/api/images
+
+    Args:
+        url: Scryfall CDN resource URL.
+        path: Path to save the file.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        Path if the file is successfully downloaded.
+    """
+    session = session or get_session()
+    async with session.get(str(url), headers=header) as r:
+        r.raise_for_status()
+
+        # Open, write, and close the file in worker threads, so disk I/O never blocks the event loop
+        f = await asyncio.to_thread(open, path, 'wb')
+        try:
+            async for chunk in r.content.iter_chunked(chunk_size_default):
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    return Path(path)
+
+
+@request_handler_scryfall
+async def get_json(
+    url: yarl.URL,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> dict:
+    """Retrieves JSON results from a Scryfall API request using the appropriate rate limits.
+
+    Args:
+        url: Scryfall API request URL.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        Dict containing data from the JSON response.
+    """
+    session = session or get_session()
+    async with session.get(str(url), headers=header) as r:
+        r.raise_for_status()
+        return await r.json()
+
+
+async def get_paginated_list(
+    url: yarl.URL,
+    list_object: ScrySchema.ScryfallListSchema = ScrySchema.ListObject,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.ScryfallList:
+    """Processes a Scryfall API request which returns paginated results, appending each page of results to
+        the first ListObject gathered.
+
+    Args:
+        url: Scryfall API request URL.
+        list_object: Scryfall schema to use when processing the ListObject returned.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A ListObject (CardList, SetList, etc) containing the results of all pages.
+    """
+    obj = page = list_object(**await get_json(url=url, header=header, session=session))
+
+    # Append each following page of results
+    while page.has_more and page.next_page:
+        page = list_object(**await get_json(url=yarl.URL(page.next_page), header=header, session=session))
+        obj.data.extend(page.data)
+    return obj
+
+
+"""
+* Request Object
+* Schema: Card
+"""
+
+
+async def get_card_unique(
+    uid: str,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.Card:
+    """Grabs a 'Card' object from Scryfall's `/cards/{uid}` endpoint.
+
+    Args:
+        uid: The unique Scryfall ID of the card.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A Scryfall 'Card' object.
+    """
+    url = ScryURL.API.Cards.Main / uid
+    return ScrySchema.Card(
+        **await get_json(
+            url=url,
+            header=header,
+            session=session))
+
+
+async def get_card_numbered(
+    set_code: str,
+    number: str,
+    lang: Optional[str] = None,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.Card:
+    """Grabs a 'Card' object from Scryfall's `/cards/{set}/{num}/{lang}` endpoint.
+
+    Args:
+        set_code: Set containing this card.
+        number: Collector number of the card within the given set.
+        lang: Optional language printing to retrieve.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A Scryfall 'Card' object.
+    """
+    url = ScryURL.API.Cards.Main / set_code / number
+    if lang:
+        url = url / lang
+
+    # Request data
+    return ScrySchema.Card(
+        **await get_json(
+            url=url,
+            header=header,
+            session=session))
+
+
+async def get_card_named(
+    name: str,
+    set_code: Optional[str] = None,
+    exact: bool = True,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.Card:
+    """Grabs a 'Card' object from Scryfall's `/cards/named/{name}` endpoint.
+
+    Args:
+        name: The name of the card.
+        set_code: Optionally limit the search to one set.
+        exact: Whether to use exact name search or fuzzy.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A Scryfall 'Card' object.
+    """
+
+    # Create the base query
+    search_method = 'exact' if exact else 'fuzzy'
+    query = {search_method: normalize_str(name)}
+    if set_code is not None:
+        query['set'] = set_code.lower()
+    url = ScryURL.API.Cards.Named.with_query(query)
+
+    # Request data
+    return ScrySchema.Card(
+        **await get_json(
+            url=url,
+            header=header,
+            session=session))
+
+
+"""
+* Request Object
+* Schema: Catalog
+"""
+
+
+async def get_catalog(
+    name: str,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.Catalog:
+    """Grabs a 'Catalog' object from Scryfall's `/catalogs/{name}` endpoint.
+
+    Args:
+        name: Name of the catalog to look for.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A Scryfall 'Catalog' object.
+    """
+    url = ScryURL.API.Catalogs.Main / name.lower()
+
+    # Request data
+    return ScrySchema.Catalog(
+        **await get_json(
+            url=url,
+            header=header,
+            session=session))
+
+
+"""
+* Request Object
+* Schema: Set
+"""
+
+
+async def get_set(
+    set_code: str,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> ScrySchema.Set:
+    """Grabs a 'Set' object from Scryfall's `/sets/{code}` endpoint.
+
+    Args:
+        set_code: The set to look for, e.g. MH2
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A Scryfall 'Set' object.
+    """
+    url = ScryURL.API.Sets.All / set_code.lower()
+
+    # Request data
+    return ScrySchema.Set(
+        **await get_json(
+            url=url,
+            header=header,
+            session=session))
+
+
+"""
+* Request List of Objects
+* Schema: SetList, CardList, RulingList
+"""
+
+
+async def get_card_rulings(
+    set_code: str,
+    number: str,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> list[ScrySchema.Ruling]:
+    """Grab a 'RulingList' object from Scryfall's `/cards/{code}/{number}/rulings` endpoint and
+        return the list of 'Ruling' objects.
+
+    Args:
+        set_code: The set code of the card to look for, e.g. MH2
+        number: The collector number of the card to look for, as a string.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A list of Scryfall 'Ruling' objects.
+    """
+    url = ScryURL.API.Cards.Main / set_code.lower() / number / 'rulings'
+
+    # Request data
+    return (await get_paginated_list(
+        url=url,
+        list_object=ScrySchema.RulingList,
+        header=header,
+        session=session
+    )).data
+
+
+async def get_card_list(
+    params: Optional[dict] = None,
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> list[ScrySchema.Card]:
+    """Grab a 'CardList' object from Scryfall's `/cards/search` endpoint matching a provided query
+        and return the list of 'Card' objects.
+
+    Args:
+        params: Search parameters to pass with request.
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A list of Scryfall 'Card' objects.
+    """
+    url = ScryURL.API.Cards.Search.with_query(params)
+
+    # Request data
+    return (await get_paginated_list(
+        url=url,
+        list_object=ScrySchema.CardList,
+        header=header,
+        session=session
+    )).data
+
+
+async def get_set_list(
+    header: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None
+) -> list[ScrySchema.Set]:
+    """Grab a 'SetList' object from Scryfall's `/sets/` endpoint and return the list of 'Set' objects.
+
+    Args:
+        header: Optional header to pass with the request.
+        session: Optional client session to make the request with, uses the shared session if not provided.
+
+    Returns:
+        A list of Scryfall 'Set' objects.
+    """
+    # Request data
+    return (await get_paginated_list(
+        url=ScryURL.API.Sets.All,
+        list_object=ScrySchema.SetList,
+        header=header,
+        session=session
+    )).data
@@ -0,0 +1,346 @@
+"""
+* Scryfall Bulk Image Downloads
+* Concurrent, resumable downloads of card images from Scryfall's CDN.
+"""
+# Standard Library Imports
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+# Third Party Imports
+import yarl
+from loguru import logger
+from omnitils.fetch import chunk_size_default
+from requests import RequestException
+
+# Local Imports
+from hexproof.scryfall import schema as ScrySchema
+from hexproof.utils.sessions import get_session
+
+"""
+* Download Objects
+"""
+
+
+@dataclass(frozen=True)
+class ImageTask:
+    """A single image to download.
+
+    Attributes:
+        key: Unique key for the image, its illustration ID (or URL if unavailable) and size.
+        url: CDN URL of the image.
+        path: Path the image is saved to.
+    """
+    key: tuple[str, str]
+    url: str
+    path: Path
+
+
+@dataclass
+class ImageDownloadStats:
+    """Running totals for a bulk image download."""
+    queued: int = 0
+    downloaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def completed(self) -> int:
+        """Number of images processed so far, whether downloaded, skipped, or failed."""
+        return self.downloaded + self.skipped + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the download started."""
+        return time.monotonic() - self.started
+
+    @property
+    def images_per_second(self) -> float:
+        """Average number of images downloaded per second."""
+        return self.downloaded / max(self.elapsed, 1e-9)
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average number of bytes downloaded per second."""
+        return self.bytes / max(self.elapsed, 1e-9)
+
+
+"""
+* Image Downloader
+"""
+
+
+class ImageDownloader:
+    """Downloads card images from Scryfall's CDN using a bounded pool of worker threads.
+
+    Notes:
+        Images are deduplicated by illustration ID and size. Completed downloads are recorded in a
+        manifest alongside their size, so a repeated or interrupted run skips images which are already
+        present. Partially downloaded images are resumed with a ranged request.
+        See docs: https://scryfall.com/docs/api/images
+    """
+    manifest_name = 'manifest.jsonl'
+
+    def __init__(
+        self,
+        directory: Path,
+        sizes: Iterable[str] = ('png',),
+        max_workers: int = 8,
+        header: Optional[dict] = None,
+        on_progress: Optional[Callable[[ImageDownloadStats], None]] = None,
+        progress_interval: float = 5.0
+    ):
+        """Initialize the downloader.
+
+        Args:
+            directory: Directory to save images to, each size is saved to its own subdirectory.
+            sizes: Image sizes to download, as named in 'image_uris', e.g. png, large, art_crop
+            max_workers: Maximum number of images to download at once.
+            header: Optional header to pass with each request.
+            on_progress: Callback executed periodically with the current stats, logs progress if not provided.
+            progress_interval: Minimum number of seconds between progress reports.
+        """
+        self.directory = directory
+        self.sizes = tuple(sizes)
+        self.max_workers = max_workers
+        self.header = header
+        self.on_progress = on_progress or self.log_progress
+        self.progress_interval = progress_interval
+        self._lock = threading.Lock()
+        self._manifest: dict[str, int] = {}
+
+    @property
+    def path_manifest(self) -> Path:
+        """Path to the manifest of completed downloads."""
+        return self.directory / self.manifest_name
+
+    """
+    * Planning Downloads
+    """
+
+    def get_tasks(
+        self,
+        objects: Iterable[Union[ScrySchema.Card, ScrySchema.CardFace]],
+        seen: Optional[set[tuple[str, str]]] = None
+    ) -> Iterator[ImageTask]:
+        """Yields a download task for each unique image found on a stream of cards or card faces.
+
+        Args:
+            objects: Scryfall 'Card' or 'CardFace' objects, the faces of each card are included.
+            seen: Optional set of image keys which have already been yielded.
+
+        Yields:
+            A task for each image which hasn't been seen yet.
+        """
+        seen = set() if seen is None else seen
+        for obj in objects:
+            faces = [obj, *(getattr(obj, 'card_faces', None) or [])]
+            for face in faces:
+                if not face.image_uris:
+                    continue
+                for size in self.sizes:
+                    url = getattr(face.image_uris, size, None)
+                    if not url:
+                        continue
+                    _url = yarl.URL(url)
+                    key = (face.illustration_id or str(_url.with_query(None)), size)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    name = face.illustration_id or _url.stem
+                    yield ImageTask(
+                        key=key,
+                        url=url,
+                        path=self.directory / size / f'{name}{_url.suffix}')
+
+    """
+    * Manifest
+    """
+
+    def load_manifest(self) -> dict[str, int]:
+        """Load the manifest of completed downloads, mapping each file path to its size in bytes."""
+        self._manifest = {}
+        if self.path_manifest.is_file():
+            with open(self.path_manifest, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._manifest[entry['path']] = entry['size']
+                    except (ValueError, KeyError):
+                        continue
+        return self._manifest
+
+    def _record(self, path: Path, size: int) -> None:
+        """Record a completed download in the manifest."""
+        rel = path.relative_to(self.directory).as_posix()
+        with self._lock:
+            self._manifest[rel] = size
+            with open(self.path_manifest, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'path': rel, 'size': size}) + '\n')
+
+    def is_complete(self, task: ImageTask) -> bool:
+        """Whether an image was already downloaded and its file size matches the recorded size.
+
+        Notes:
+            Downloads are only moved into place once finished, so an existing non-empty image which
+            isn't in the manifest, e.g. copied from another directory, is complete and gets recorded.
+
+        Args:
+            task: Image download task.
+        """
+        size = self._manifest.get(task.path.relative_to(self.directory).as_posix())
+        if not task.path.is_file():
+            return False
+        actual = task.path.stat().st_size
+        if size is None and actual > 0:
+            self._record(task.path, actual)
+            return True
+        return actual == size
+
+    """
+    * Downloading
+    """
+
+    def download_image(self, task: ImageTask) -> int:
+        """Download a single image, resuming a partial download if one exists.
+
+        Args:
+            task: Image download task.
+
+        Returns:
+            Number of bytes downloaded.
+        """
+        task.path.parent.mkdir(parents=True, exist_ok=True)
+        part = task.path.with_name(task.path.name + '.part')
+        header = dict(self.header or {})
+        offset = part.stat().st_size if part.is_file() else 0
+        if offset:
+            header['Range'] = f'bytes={offset}-'
+
+        # Stream the image, appending if the server honored the range
+        written = 0
+        with get_session(task.url).get(task.url, headers=header, stream=True) as r:
+            if r.status_code == 416:
+                part.unlink(missing_ok=True)
+                return self.download_image(task)
+            r.raise_for_status()
+            mode = 'ab' if offset and r.status_code == 206 else 'wb'
+            with open(part, mode) as f:
+                for chunk in r.iter_content(chunk_size=chunk_size_default):
+                    f.write(chunk)
+                    written += len(chunk)
+        os.replace(part, task.path)
+        self._record(task.path, task.path.stat().st_size)
+        return written
+
+    def download(
+        self,
+        objects: Iterable[Union[ScrySchema.Card, ScrySchema.CardFace]]
+    ) -> ImageDownloadStats:
+        """Download every unique image found on a stream of cards or card faces.
+
+        Args:
+            objects: Scryfall 'Card' or 'CardFace' objects, the faces of each card are included.
+
+        Returns:
+            Totals for the completed download.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.load_manifest()
+        stats = ImageDownloadStats()
+        futures: dict[Future, ImageTask] = {}
+        last_report = time.monotonic()
+
+        # Keep a bounded number of downloads in flight while consuming the stream
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for task in self.get_tasks(objects):
+                stats.queued += 1
+                if self.is_complete(task):
+                    stats.skipped += 1
+                    continue
+                futures[executor.submit(self.download_image, task)] = task
+                if len(futures) < self.max_workers * 2:
+                    continue
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                self._collect(done, futures, stats)
+                if time.monotonic() - last_report >= self.progress_interval:
+                    last_report = time.monotonic()
+                    self.on_progress(stats)
+
+            # Wait for the remaining downloads
+            for future in as_completed(list(futures)):
+                self._collect([future], futures, stats)
+                if time.monotonic() - last_report >= self.progress_interval:
+                    last_report = time.monotonic()
+                    self.on_progress(stats)
+        self.on_progress(stats)
+        return stats
+
+    @staticmethod
+    def _collect(done: Iterable[Future], futures: dict[Future, ImageTask], stats: ImageDownloadStats) -> None:
+        """Add the results of finished downloads to the running totals.
+
+        Args:
+            done: Finished download futures.
+            futures: Mapping of in-flight download futures to their tasks.
+            stats: Running download totals.
+        """
+        for future in done:
+            task = futures.pop(future)
+            try:
+                stats.bytes += future.result()
+                stats.downloaded += 1
+            except (RequestException, OSError) as e:
+                stats.failed += 1
+                logger.warning(f'Failed to download image: {task.url} ({e})')
+
+    @staticmethod
+    def log_progress(stats: ImageDownloadStats) -> None:
+        """Log the current stats of a bulk image download.
+
+        Args:
+            stats: Current download totals.
+        """
+        logger.info(
+            f'Images: {stats.downloaded} downloaded, {stats.skipped} skipped, {stats.failed} failed '
+            f'of {stats.queued} queued | {stats.images_per_second:.1f} images/s, '
+            f'{stats.bytes_per_second / 1024 / 1024:.2f} MB/s')
+
+
+"""
+* Download Funcs
+"""
+
+
+def download_card_images(
+    cards: Iterable[Union[ScrySchema.Card, ScrySchema.CardFace]],
+    directory: Path,
+    sizes: Iterable[str] = ('png',),
+    max_workers: int = 8,
+    header: Optional[dict] = None
+) -> ImageDownloadStats:
+    """Download every unique image found on a stream of cards from Scryfall's CDN.
+
+    Args:
+        cards: Scryfall 'Card' or 'CardFace' objects, e.g. from a bulk data stream.
+        directory: Directory to save images to, each size is saved to its own subdirectory.
+        sizes: Image sizes to download, as named in 'image_uris', e.g. png, large, art_crop
+        max_workers: Maximum number of images to download at once.
+        header: Optional header to pass with each request.
+
+    Returns:
+        Totals for the completed download.
+    """
+    return ImageDownloader(
+        directory=directory,
+        sizes=sizes,
+        max_workers=max_workers,
+        header=header
+    ).download(cards)
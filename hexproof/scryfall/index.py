@@ -0,0 +1,208 @@
+"""
+* Scryfall Offline Card Index
+* In-memory card lookups built from Scryfall bulk data.
+"""
+# Standard Library Imports
+from typing import Iterable, Iterator, Optional, Protocol
+
+# Third Party Imports
+from omnitils.strings import normalize_str
+
+# Local Imports
+from hexproof.scryfall import schema as ScrySchema
+
+"""
+* Types
+"""
+
+
+class CardStore(Protocol):
+    """A local source of Scryfall 'Card' objects which can be consulted before making a request."""
+
+    def get_by_id(self, uid: str) -> Optional[ScrySchema.Card]:
+        ...
+
+    def get_by_number(self, set_code: str, number: str, lang: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        ...
+
+    def get_by_name(self, name: str, set_code: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        ...
+
+
+class MutableCardStore(CardStore, Protocol):
+    """A local card store which can be kept up to date with Scryfall bulk data."""
+
+    def add(self, card: ScrySchema.Card) -> None:
+        ...
+
+    def remove(self, uid: str) -> Optional[ScrySchema.Card]:
+        ...
+
+
+"""
+* Card Index
+"""
+
+
+class CardIndex:
+    """An in-memory store of Scryfall 'Card' objects with hash indexes on their common lookup keys.
+
+    Notes:
+        Build an index from any stream of cards, e.g. `CardIndex(iter_bulk_cards('default_cards'))`.
+        Cards are indexed by ID, by (set, collector number, language), by exact name (including the
+        name of each face), and by oracle ID.
+    """
+
+    def __init__(self, cards: Iterable[ScrySchema.Card] = ()):
+        """Initialize the index.
+
+        Args:
+            cards: Scryfall 'Card' objects to add to the index.
+        """
+        self._by_id: dict[str, ScrySchema.Card] = {}
+        self._by_number: dict[tuple[str, str, str], str] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._by_oracle_id: dict[str, list[str]] = {}
+        self.update(cards)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._by_id
+
+    def __iter__(self) -> Iterator[ScrySchema.Card]:
+        return iter(self._by_id.values())
+
+    """
+    * Index Keys
+    """
+
+    @staticmethod
+    def get_number_key(set_code: str, number: str, lang: Optional[str] = None) -> tuple[str, str, str]:
+        """Returns the key used to index a card by its set, collector number, and language."""
+        return set_code.lower(), number, (lang or 'en').lower()
+
+    @staticmethod
+    def get_names(card: ScrySchema.Card) -> set[str]:
+        """Returns the normalized names a card can be looked up by, including the name of each face."""
+        names = {normalize_str(card.name)}
+        names.update(normalize_str(face.name) for face in card.card_faces or [])
+        return names
+
+    """
+    * Modifying the Index
+    """
+
+    def add(self, card: ScrySchema.Card) -> None:
+        """Add a card to the index, replacing any card with the same ID.
+
+        Args:
+            card: Scryfall 'Card' object.
+        """
+        if card.id in self._by_id:
+            self.remove(card.id)
+        self._by_id[card.id] = card
+        self._by_number[self.get_number_key(card.set, card.collector_number, card.lang)] = card.id
+        for name in self.get_names(card):
+            self._by_name.setdefault(name, []).append(card.id)
+        if card.oracle_id:
+            self._by_oracle_id.setdefault(card.oracle_id, []).append(card.id)
+
+    def update(self, cards: Iterable[ScrySchema.Card]) -> None:
+        """Add multiple cards to the index.
+
+        Args:
+            cards: Scryfall 'Card' objects.
+        """
+        for card in cards:
+            self.add(card)
+
+    def remove(self, uid: str) -> Optional[ScrySchema.Card]:
+        """Remove a card from the index.
+
+        Args:
+            uid: The unique Scryfall ID of the card.
+
+        Returns:
+            The card removed, or None if it wasn't in the index.
+        """
+        card = self._by_id.pop(uid, None)
+        if card is None:
+            return None
+        key = self.get_number_key(card.set, card.collector_number, card.lang)
+        if self._by_number.get(key) == uid:
+            del self._by_number[key]
+        for index, keys in ((self._by_name, self.get_names(card)), (self._by_oracle_id, {card.oracle_id})):
+            for key in keys:
+                if uid in (ids := index.get(key, [])):
+                    ids.remove(uid)
+                    if not ids:
+                        del index[key]
+        return card
+
+    """
+    * Lookups
+    """
+
+    def get_by_id(self, uid: str) -> Optional[ScrySchema.Card]:
+        """Returns the card with a given Scryfall ID.
+
+        Args:
+            uid: The unique Scryfall ID of the card.
+        """
+        return self._by_id.get(uid)
+
+    def get_by_number(self, set_code: str, number: str, lang: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        """Returns the card printed in a set with a given collector number.
+
+        Args:
+            set_code: Set containing this card.
+            number: Collector number of the card within the given set.
+            lang: Language of the printing, defaults to English.
+        """
+        uid = self._by_number.get(self.get_number_key(set_code, number, lang))
+        return self._by_id.get(uid) if uid else None
+
+    def get_by_name(self, name: str, set_code: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        """Returns the most recently released card with an exact name.
+
+        Args:
+            name: The name of the card, or one of its faces. Compared after normalizing.
+            set_code: Optionally limit the search to one set.
+        """
+        cards = [self._by_id[n] for n in self._by_name.get(normalize_str(name), [])]
+        if set_code is not None:
+            cards = [n for n in cards if n.set == set_code.lower()]
+        return max(cards, key=lambda n: str(n.released_at), default=None)
+
+    def get_by_oracle_id(self, oracle_id: str) -> list[ScrySchema.Card]:
+        """Returns every printing of a card sharing an oracle ID.
+
+        Args:
+            oracle_id: The Scryfall oracle ID of the card.
+        """
+        return [self._by_id[n] for n in self._by_oracle_id.get(oracle_id, [])]
+
+
+"""
+* Default Card Store
+"""
+
+# Card store consulted by the card request functions, disabled unless one is provided
+_card_store: Optional[CardStore] = None
+
+
+def get_card_store() -> Optional[CardStore]:
+    """Returns the local card store consulted by the card request functions, if one is enabled."""
+    return _card_store
+
+
+def set_card_store(store: Optional[CardStore]) -> None:
+    """Set the local card store consulted by the card request functions.
+
+    Args:
+        store: Card store to consult before making a request, or None to always make requests.
+    """
+    global _card_store
+    _card_store = store
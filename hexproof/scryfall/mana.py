@@ -0,0 +1,201 @@
+"""
+* Scryfall Mana Cost Parsing
+* Local equivalent of Scryfall's `/symbology/parse-mana` endpoint.
+"""
+# Standard Library Imports
+import re
+from typing import Iterable, Optional
+
+# Local Imports
+from hexproof.scryfall.enums import ManaColor
+from hexproof.scryfall.fetch import get_card_symbol_list
+from hexproof.scryfall import schema as ScrySchema
+
+# Mana symbols in a cost: braced symbols, or loose numbers and single characters
+_symbol_pattern = re.compile(r'\{([^{}]+)}|(\d+)|([^\s{}/])')
+
+# Colors in the order Scryfall lists them
+_color_order: tuple[ManaColor, ...] = (
+    ManaColor.White, ManaColor.Blue, ManaColor.Black, ManaColor.Red, ManaColor.Green)
+_color_bits: dict[str, int] = {str(n): 1 << i for i, n in enumerate(_color_order)}
+_color_lists: dict[int, list[ManaColor]] = {
+    bits: [n for i, n in enumerate(_color_order) if bits & (1 << i)] for bits in range(32)}
+
+# Variable symbols, listed before any other symbol in a cost
+_variable_order: dict[str, int] = {'{X}': 0, '{Y}': 1, '{Z}': 2}
+
+"""
+* Mana Parser
+"""
+
+
+class ManaParser:
+    """Parses mana cost strings into Scryfall 'ManaCost' objects using a table of 'CardSymbol' objects.
+
+    Notes:
+        Accepts braced symbols in any case, e.g. {2}{w/u}{W/P}, as well as loose costs, e.g. 2WU.
+        Transposable hybrid symbols may be written in either order, e.g. {U/W} is read as {W/U}.
+        Hybrid, phyrexian, and snow symbols use the mana value and colors listed in the symbol table.
+        Like the endpoint, symbols are put in canonical order and generic amounts are added together,
+        e.g. 'RUX' is parsed as {X}{U}{R} and '2G2' as {4}{G}. The canonical order is X/Y/Z, then
+        generic mana, then other colorless symbols, e.g. {C} or {S}, then colored symbols in WUBRG
+        order, with hybrid symbols after the single colored symbols.
+        Parsed costs are memoized, so repeated costs are only parsed once.
+        See docs: https://scryfall.com/docs/api/card-symbols/parse-mana
+    """
+
+    def __init__(self, symbols: Iterable[ScrySchema.CardSymbol], max_cached: int = 65536):
+        """Initialize the parser.
+
+        Args:
+            symbols: Scryfall 'CardSymbol' objects, e.g. from `get_card_symbol_list`.
+            max_cached: Maximum number of parsed costs to memoize.
+        """
+        self.max_cached = max_cached
+        self._parsed: dict[str, ScrySchema.ManaCost] = {}
+        self._symbols: dict[str, tuple[str, float, int]] = {}
+        for symbol in symbols:
+            if not symbol.appears_in_mana_costs:
+                continue
+            value = (
+                symbol.symbol,
+                symbol.mana_value or 0.0,
+                sum(_color_bits.get(str(n), 0) for n in symbol.colors))
+            self._symbols[symbol.symbol.upper()] = value
+            if symbol.transposable and len(parts := symbol.symbol[1:-1].split('/')) > 1:
+                parts[0], parts[1] = parts[1], parts[0]
+                self._symbols['{' + '/'.join(parts).upper() + '}'] = value
+
+    def get_symbol(self, symbol: str) -> tuple[str, float, int]:
+        """Returns the canonical symbol, mana value, and color bits of a mana symbol.
+
+        Args:
+            symbol: Braced mana symbol, e.g. {W/U}
+
+        Raises:
+            ValueError: If the symbol isn't a recognized mana symbol.
+        """
+        if (value := self._symbols.get(symbol.upper())) is not None:
+            return value
+        if symbol[1:-1].isdigit():
+            return f'{{{int(symbol[1:-1])}}}', float(symbol[1:-1]), 0
+        raise ValueError(f"Unrecognized mana symbol: '{symbol}'")
+
+    def parse(self, cost: str) -> ScrySchema.ManaCost:
+        """Returns the parsed 'ManaCost' object of a mana cost string.
+
+        Args:
+            cost: Mana cost string, e.g. {2}{W/U}{W/U} or 2WU
+
+        Raises:
+            ValueError: If the cost contains an unrecognized mana symbol.
+        """
+        if (parsed := self._parsed.get(cost)) is not None:
+            return parsed
+
+        # Total the mana value and colors of each symbol, grouping the symbols by their canonical position
+        variable, generic, colorless, colored, cmc, bits = [], None, [], [], 0.0, 0
+        for braced, number, char in _symbol_pattern.findall(cost):
+            name = braced or number or char
+            symbol, value, colors = self.get_symbol(f'{{{name}}}')
+            cmc += value
+            bits |= colors
+            if name.isdigit():
+                generic = (generic or 0) + int(name)
+            elif symbol in _variable_order:
+                variable.append(symbol)
+            elif colors:
+                colored.append(((colors.bit_count() > 1, (colors & -colors).bit_length(), colors), symbol))
+            else:
+                colorless.append(symbol)
+
+        # Sort each group, keeping generic mana only if it's non-zero or the whole cost
+        symbols = sorted(variable, key=_variable_order.get)
+        if generic is not None and (generic or not (variable or colorless or colored)):
+            symbols.append(f'{{{generic}}}')
+        symbols.extend(colorless)
+        symbols.extend(n[1] for n in sorted(colored, key=lambda n: n[0]))
+
+        # Build the object without validation, every value is already well-formed
+        colors = _color_lists[bits]
+        parsed = ScrySchema.ManaCost.model_construct(
+            cost=''.join(symbols),
+            cmc=cmc,
+            colors=colors,
+            colorless=not colors,
+            monocolored=len(colors) == 1,
+            multicolored=len(colors) > 1)
+        if len(self._parsed) >= self.max_cached:
+            self._parsed.clear()
+        self._parsed[cost] = parsed
+        return parsed
+
+    def parse_many(self, costs: Iterable[str]) -> list[ScrySchema.ManaCost]:
+        """Returns the parsed 'ManaCost' object of each mana cost string.
+
+        Notes:
+            Identical costs share the same 'ManaCost' object, so the results shouldn't be modified.
+
+        Args:
+            costs: Mana cost strings, e.g. the 'mana_cost' of each card in a bulk data file.
+
+        Raises:
+            ValueError: If a cost contains an unrecognized mana symbol.
+        """
+        parsed, parse = self._parsed, self.parse
+        return [parsed.get(n) or parse(n) for n in costs]
+
+
+"""
+* Default Mana Parser
+"""
+
+# Mana parser used by the parsing functions, built from Scryfall's symbol table on first use
+_mana_parser: Optional[ManaParser] = None
+
+
+def get_mana_parser() -> ManaParser:
+    """Returns the mana parser used by the parsing functions, requesting Scryfall's symbol table on first use."""
+    global _mana_parser
+    if _mana_parser is None:
+        _mana_parser = ManaParser(get_card_symbol_list())
+    return _mana_parser
+
+
+def set_mana_parser(parser: Optional[ManaParser]) -> None:
+    """Set the mana parser used by the parsing functions.
+
+    Args:
+        parser: Mana parser to use, or None to rebuild it from Scryfall's symbol table on next use.
+    """
+    global _mana_parser
+    _mana_parser = parser
+
+
+"""
+* Parsing Funcs
+"""
+
+
+def parse_mana_cost(cost: str) -> ScrySchema.ManaCost:
+    """Parse a mana cost string without making a request, once the symbol table is cached.
+
+    Args:
+        cost: Mana cost string, e.g. {2}{W/U}{W/U} or 2WU
+
+    Returns:
+        A Scryfall 'ManaCost' object.
+    """
+    return get_mana_parser().parse(cost)
+
+
+def parse_mana_costs(costs: Iterable[str]) -> list[ScrySchema.ManaCost]:
+    """Parse any number of mana cost strings without making a request, once the symbol table is cached.
+
+    Args:
+        costs: Mana cost strings.
+
+    Returns:
+        A list of Scryfall 'ManaCost' objects.
+    """
+    return get_mana_parser().parse_many(costs)
@@ -9,6 +9,7 @@ from typing import Union
 from .bulk_data import BulkData, BulkDataList
 from .card import (
     Card,
+    CardCollection,
     CardFace,
     CardIdentifiers,
     CardImageURIs,
@@ -32,6 +33,7 @@ from .set import Set, SetList
 
 ScryfallList = Union[
     BulkDataList,
+    CardCollection,
     CardList,
     CardMigrationList,
     CardSymbolList,
@@ -42,6 +44,7 @@ ScryfallList = Union[
 
 ScryfallListSchema = Union[
     type[BulkDataList],
+    type[CardCollection],
     type[CardList],
     type[CardMigrationList],
     type[CardSymbolList],
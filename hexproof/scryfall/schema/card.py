@@ -257,3 +257,14 @@ class CardList(ListObject):
     """
     data: list[Card]
     total_cards: Optional[int] = None
+
+
+class CardCollection(CardList):
+    """Represents a sequence of Card objects matching a list of identifiers.
+
+    Notes:
+        Returned from the `/cards/collection` endpoint, identifiers that didn't match a card are
+        listed under 'not_found'.
+        See docs: https://scryfall.com/docs/api/cards/collection
+    """
+    not_found: list[CardIdentifiers] = []
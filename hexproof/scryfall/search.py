@@ -0,0 +1,343 @@
+"""
+* Scryfall Offline Search
+* Evaluates a subset of Scryfall search syntax against local card data.
+"""
+# Standard Library Imports
+import operator
+import re
+from typing import Callable, Iterable, Iterator
+
+# Local Imports
+from hexproof.scryfall import schema as ScrySchema
+
+"""
+* Search Syntax
+"""
+
+# Tokens: parentheses, negation, and terms with an optional keyword, comparison, and (quoted) value
+_token_pattern = re.compile(
+    r'\s*(?:(?P<paren>[()])|(?P<neg>-)(?=\S)|'
+    r'(?:(?P<key>[a-z]+)(?P<op>:|!=|<=|>=|=|<|>))?(?P<value>"[^"]*"|[^\s()]+))',
+    re.IGNORECASE)
+
+# Comparison operators, ':' is resolved per keyword
+_operators: dict[str, Callable] = {
+    '=': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge}
+
+# Keyword aliases mapped to their canonical keyword
+_keywords: dict[str, str] = {
+    't': 'type', 'type': 'type',
+    'o': 'oracle', 'oracle': 'oracle',
+    'c': 'color', 'color': 'color',
+    'id': 'identity', 'identity': 'identity', 'ci': 'identity',
+    'cmc': 'cmc', 'mv': 'cmc', 'manavalue': 'cmc',
+    's': 'set', 'e': 'set', 'set': 'set', 'edition': 'set',
+    'r': 'rarity', 'rarity': 'rarity',
+    'f': 'format', 'format': 'format', 'legal': 'format',
+    'banned': 'banned', 'restricted': 'restricted',
+    'name': 'name'}
+
+# Color bits, names, and rarity order
+_color_bits: dict[str, int] = {'w': 1, 'u': 2, 'b': 4, 'r': 8, 'g': 16}
+_color_names: dict[str, str] = {
+    'white': 'w', 'blue': 'u', 'black': 'b', 'red': 'r', 'green': 'g',
+    'azorius': 'wu', 'dimir': 'ub', 'rakdos': 'br', 'gruul': 'rg', 'selesnya': 'gw',
+    'orzhov': 'wb', 'izzet': 'ur', 'golgari': 'bg', 'boros': 'rw', 'simic': 'gu',
+    'bant': 'gwu', 'esper': 'wub', 'grixis': 'ubr', 'jund': 'brg', 'naya': 'rgw',
+    'abzan': 'wbg', 'jeskai': 'urw', 'sultai': 'bgu', 'mardu': 'rwb', 'temur': 'gur',
+    'colorless': '', 'c': ''}
+_rarity_order: dict[str, int] = {
+    'common': 0, 'uncommon': 1, 'rare': 2, 'special': 3, 'mythic': 4, 'bonus': 5}
+_rarity_aliases: dict[str, str] = {
+    'c': 'common', 'u': 'uncommon', 'r': 'rare', 's': 'special', 'm': 'mythic', 'b': 'bonus'}
+
+
+def parse_colors(value: str) -> int:
+    """Returns the color bitmask of a color search value, e.g. 'wu', 'azorius', 'colorless'.
+
+    Args:
+        value: Color letters or a named color combination.
+
+    Raises:
+        ValueError: If the value isn't a recognized color.
+    """
+    value = _color_names.get(value.lower(), value.lower())
+    if any(n not in _color_bits for n in value):
+        raise ValueError(f"Unrecognized color in search query: '{value}'")
+    return sum(_color_bits[n] for n in set(value))
+
+
+"""
+* Search Index
+"""
+
+
+class CardSearchIndex:
+    """A columnar, in-memory index of Scryfall 'Card' objects which can be searched with Scryfall syntax.
+
+    Notes:
+        Supported syntax: bare words and 'name:' (name contains), 't:' (type line), 'o:' (oracle text,
+        '~' matches the card's name), 'c:' and 'id:' (colors and color identity, compared as sets),
+        'cmc:'/'mv:' (mana value), 'set:'/'s:'/'e:', 'r:' (rarity, comparable), 'f:' (legal in a format),
+        'banned:' and 'restricted:'. Terms can be quoted, negated with '-', grouped with parentheses,
+        and combined with 'and' (implied between terms) and 'or'.
+        Each term is evaluated to a bitmask of matching rows, so boolean combinations are integer operations.
+        See docs: https://scryfall.com/docs/syntax
+    """
+
+    def __init__(self, cards: Iterable[ScrySchema.Card] = ()):
+        """Initialize the index.
+
+        Args:
+            cards: Scryfall 'Card' objects to index, e.g. from a bulk data stream.
+        """
+        self.cards: list[ScrySchema.Card] = []
+        self._names: list[str] = []
+        self._types: list[str] = []
+        self._oracle: list[str] = []
+        self._colors: list[int] = []
+        self._identity: list[int] = []
+        self._cmc: list[float] = []
+        self._sets: list[str] = []
+        self._rarities: list[int] = []
+        self._legalities: dict[str, list[str]] = {n: [] for n in ScrySchema.CardLegalities.model_fields}
+        self._masks: dict[tuple[str, str], int] = {}
+        for card in cards:
+            self.add(card)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    @property
+    def all(self) -> int:
+        """Bitmask matching every row in the index."""
+        return (1 << len(self.cards)) - 1
+
+    """
+    * Building the Index
+    """
+
+    def add(self, card: ScrySchema.Card) -> None:
+        """Add a card to the index.
+
+        Args:
+            card: Scryfall 'Card' object.
+        """
+        faces = card.card_faces or []
+        colors = card.colors if card.colors is not None else [c for f in faces for c in f.colors or []]
+        oracle = card.oracle_text if card.oracle_text is not None else '\n'.join(
+            f.oracle_text or '' for f in faces)
+
+        # Row columns
+        self.cards.append(card)
+        self._names.append(card.name.lower())
+        self._types.append(card.type_line.lower())
+        self._oracle.append(oracle.lower())
+        self._colors.append(sum(_color_bits.get(n.lower(), 0) for n in set(colors)))
+        self._identity.append(sum(_color_bits.get(n.lower(), 0) for n in set(card.color_identity)))
+        self._cmc.append(card.cmc)
+        self._sets.append(card.set.lower())
+        self._rarities.append(_rarity_order.get(card.rarity, -1))
+        for fmt, column in self._legalities.items():
+            column.append(getattr(card.legalities, fmt))
+        self._masks.clear()
+
+    def _get_value_mask(self, column: str, value: str) -> int:
+        """Returns the bitmask of rows where a categorical column equals a value, cached until a card is added.
+
+        Args:
+            column: Name of a categorical column, 'set' or the name of a format.
+            value: Value to compare against.
+        """
+        key = (column, value)
+        if key not in self._masks:
+            values = self._sets if column == 'set' else self._legalities.get(column, [])
+            self._masks[key] = self._to_mask(n == value for n in values)
+        return self._masks[key]
+
+    """
+    * Searching
+    """
+
+    def search(self, query: str) -> list[ScrySchema.Card]:
+        """Returns every card matching a search query, in the order they were indexed.
+
+        Args:
+            query: Scryfall search query, e.g. 't:goblin c:r cmc<=2 f:modern'
+
+        Raises:
+            ValueError: If the query can't be parsed.
+        """
+        return [self.cards[n] for n in self._iter_rows(self.get_mask(query))]
+
+    def count(self, query: str) -> int:
+        """Returns the number of cards matching a search query.
+
+        Args:
+            query: Scryfall search query.
+        """
+        return self.get_mask(query).bit_count()
+
+    def get_mask(self, query: str) -> int:
+        """Returns the bitmask of rows matching a search query.
+
+        Args:
+            query: Scryfall search query.
+
+        Raises:
+            ValueError: If the query can't be parsed.
+        """
+        tokens = self._tokenize(query)
+        mask = self._parse_or(tokens)
+        if tokens:
+            raise ValueError(f"Unexpected token in search query: '{tokens[-1][0]}'")
+        return mask
+
+    @staticmethod
+    def _iter_rows(mask: int) -> Iterator[int]:
+        """Yields the row numbers set in a bitmask."""
+        bits = bin(mask)[:1:-1]
+        row = bits.find('1')
+        while row != -1:
+            yield row
+            row = bits.find('1', row + 1)
+
+    @staticmethod
+    def _to_mask(flags: Iterable[bool]) -> int:
+        """Returns a bitmask with a bit set for each true flag, the first flag being the lowest bit."""
+        return int(''.join('1' if f else '0' for f in flags)[::-1] or '0', 2)
+
+    """
+    * Parsing
+    """
+
+    @staticmethod
+    def _tokenize(query: str) -> list[tuple[str, ...]]:
+        """Split a query into tokens, returned in reverse order so they can be popped."""
+        tokens, pos, query = [], 0, query.strip()
+        while pos < len(query):
+            match = _token_pattern.match(query, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"Unable to parse search query at: '{query[pos:]}'")
+            pos = match.end()
+            if match['paren'] or match['neg']:
+                tokens.append((match['paren'] or match['neg'],))
+                continue
+            value = match['value'].strip('"')
+            if match['key'] is None and value.lower() in ('and', 'or'):
+                tokens.append((value.lower(),))
+                continue
+            tokens.append(('term', (match['key'] or 'name').lower(), match['op'] or ':', value))
+        return tokens[::-1]
+
+    def _parse_or(self, tokens: list[tuple[str, ...]]) -> int:
+        """Parse terms separated by 'or'."""
+        mask = self._parse_and(tokens)
+        while tokens and tokens[-1][0] == 'or':
+            tokens.pop()
+            mask |= self._parse_and(tokens)
+        return mask
+
+    def _parse_and(self, tokens: list[tuple[str, ...]]) -> int:
+        """Parse terms separated by 'and', or by nothing at all."""
+        mask = self._parse_unary(tokens)
+        while tokens and tokens[-1][0] not in ('or', ')'):
+            if tokens[-1][0] == 'and':
+                tokens.pop()
+            mask &= self._parse_unary(tokens)
+        return mask
+
+    def _parse_unary(self, tokens: list[tuple[str, ...]]) -> int:
+        """Parse a negated term, a parenthesized group, or a single term."""
+        if not tokens:
+            raise ValueError('Search query ended unexpectedly!')
+        token = tokens.pop()
+        if token[0] == '-':
+            return self.all & ~self._parse_unary(tokens)
+        if token[0] == '(':
+            mask = self._parse_or(tokens)
+            if not tokens or tokens.pop()[0] != ')':
+                raise ValueError("Search query is missing a closing ')'!")
+            return mask
+        if token[0] == 'term':
+            return self._evaluate(*token[1:])
+        raise ValueError(f"Unexpected token in search query: '{token[0]}'")
+
+    """
+    * Evaluating Terms
+    """
+
+    def _evaluate(self, key: str, op: str, value: str) -> int:
+        """Returns the bitmask of rows matching a single search term.
+
+        Args:
+            key: Search keyword, e.g. 't', 'cmc'
+            op: Comparison operator.
+            value: Value to compare against.
+
+        Raises:
+            ValueError: If the keyword, operator, or value isn't supported.
+        """
+        keyword = _keywords.get(key)
+        if keyword is None:
+            raise ValueError(f"Unsupported search keyword: '{key}'")
+        value = value.lower()
+
+        # Text columns
+        if keyword in ('name', 'type', 'oracle'):
+            if op != ':':
+                raise ValueError(f"Unsupported comparison for '{key}': '{op}'")
+            if keyword == 'oracle' and '~' in value:
+                return self._to_mask(value.replace('~', n) in o for n, o in zip(self._names, self._oracle))
+            column = {'name': self._names, 'type': self._types, 'oracle': self._oracle}[keyword]
+            return self._to_mask(value in n for n in column)
+
+        # Color columns, compared as sets
+        if keyword in ('color', 'identity'):
+            column = self._colors if keyword == 'color' else self._identity
+            if value in ('m', 'multicolor'):
+                return self._to_mask(n.bit_count() > 1 for n in column)
+            if value.isdigit():
+                compare = _operators['=' if op == ':' else op]
+                return self._to_mask(compare(n.bit_count(), int(value)) for n in column)
+            colors = parse_colors(value)
+            if op == ':':
+                # Colorless only matches colorless cards, rather than every card containing no colors
+                op = '=' if colors == 0 else '>=' if keyword == 'color' else '<='
+            compare = {
+                '=': lambda n: n == colors, '!=': lambda n: n != colors,
+                '>=': lambda n: n & colors == colors, '>': lambda n: n & colors == colors and n != colors,
+                '<=': lambda n: n & ~colors == 0, '<': lambda n: n & ~colors == 0 and n != colors
+            }[op]
+            return self._to_mask(compare(n) for n in column)
+
+        # Numeric columns
+        if keyword == 'cmc':
+            try:
+                target = float(value)
+            except ValueError:
+                raise ValueError(f"Mana value must be a number: '{value}'")
+            compare = _operators['=' if op == ':' else op]
+            return self._to_mask(compare(n, target) for n in self._cmc)
+
+        # Categorical columns
+        if keyword == 'set':
+            if op not in (':', '=', '!='):
+                raise ValueError(f"Unsupported comparison for '{key}': '{op}'")
+            mask = self._get_value_mask('set', value)
+            return self.all & ~mask if op == '!=' else mask
+        if keyword == 'rarity':
+            value = _rarity_aliases.get(value, value)
+            if value not in _rarity_order:
+                raise ValueError(f"Unrecognized rarity in search query: '{value}'")
+            compare, target = _operators['=' if op == ':' else op], _rarity_order[value]
+            return self._to_mask(n != -1 and compare(n, target) for n in self._rarities)
+        if op not in (':', '='):
+            raise ValueError(f"Unsupported comparison for '{key}': '{op}'")
+        if value not in self._legalities:
+            raise ValueError(f"Unrecognized format in search query: '{value}'")
+        if keyword == 'format':
+            return self._get_value_mask(value, 'legal') | self._get_value_mask(value, 'restricted')
+        return self._get_value_mask(value, keyword)
@@ -0,0 +1,89 @@
+"""
+* Scryfall Card Database
+* Durable SQLite storage of Scryfall 'Card' objects.
+"""
+# Standard Library Imports
+from typing import Optional
+
+# Local Imports
+from hexproof.scryfall import schema as ScrySchema
+from hexproof.utils.store import SQLiteStore
+
+"""
+* Card Database
+"""
+
+
+class CardDatabase(SQLiteStore[ScrySchema.Card]):
+    """An on-disk store of Scryfall 'Card' objects, indexed by ID, printing, name, and oracle ID.
+
+    Notes:
+        Implements the same lookups as `CardIndex`, so it can be enabled with `set_card_store` or kept
+        up to date with `BulkSync` without loading every card into memory. Full text search covers
+        the name, type line, and oracle text of each card and its faces, e.g.
+        `db.search('oracle_text:"draw a card" type_line:instant')`
+    """
+    schema = ScrySchema.Card
+    table = 'cards'
+    key = 'id'
+    columns = ('oracle_id', 'set_code', 'number', 'lang', 'released_at')
+    indexes = (('set_code', 'number', 'lang'), ('oracle_id',))
+
+    """
+    * Card Rows
+    """
+
+    def get_columns(self, obj: ScrySchema.Card) -> tuple[Optional[str], ...]:
+        return obj.oracle_id, obj.set.lower(), obj.collector_number, obj.lang.lower(), str(obj.released_at)
+
+    def get_text(self, obj: ScrySchema.Card) -> tuple[str, str, str]:
+        faces = obj.card_faces or []
+        return (
+            obj.name,
+            obj.type_line,
+            '\n'.join(n for n in [obj.oracle_text, *(f.oracle_text for f in faces)] if n))
+
+    def get_names(self, obj: ScrySchema.Card) -> set[str]:
+        return {obj.name, *(f.name for f in obj.card_faces or [])}
+
+    """
+    * Lookups
+    """
+
+    def get_by_id(self, uid: str) -> Optional[ScrySchema.Card]:
+        """Returns the card with a given Scryfall ID.
+
+        Args:
+            uid: The unique Scryfall ID of the card.
+        """
+        return self.get(uid)
+
+    def get_by_number(self, set_code: str, number: str, lang: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        """Returns the card printed in a set with a given collector number.
+
+        Args:
+            set_code: Set containing this card.
+            number: Collector number of the card within the given set.
+            lang: Language of the printing, defaults to English.
+        """
+        cards = self.find(limit=1, set_code=set_code.lower(), number=number, lang=(lang or 'en').lower())
+        return cards[0] if cards else None
+
+    def get_by_name(self, name: str, set_code: Optional[str] = None) -> Optional[ScrySchema.Card]:
+        """Returns the most recently released card with an exact name.
+
+        Args:
+            name: The name of the card, or one of its faces. Compared after normalizing.
+            set_code: Optionally limit the search to one set.
+        """
+        columns = {'set_code': set_code.lower()} if set_code is not None else {}
+        cards = self.find_named(name, order_by='-released_at', **columns)
+        return cards[0] if cards else None
+
+    def get_by_oracle_id(self, oracle_id: str) -> list[ScrySchema.Card]:
+        """Returns every printing of a card sharing an oracle ID.
+
+        Args:
+            oracle_id: The Scryfall oracle ID of the card.
+        """
+        return self.find(oracle_id=oracle_id)
@@ -0,0 +1,252 @@
+"""
+* Scryfall Bulk Data Sync
+* Incrementally keeps a local card store up to date with Scryfall bulk data.
+"""
+# Standard Library Imports
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+# Local Imports
+from hexproof.scryfall.enums import BulkDataType
+from hexproof.scryfall.fetch import get_bulk_data, iter_bulk_data, iter_migration_list
+from hexproof.scryfall.index import MutableCardStore
+from hexproof.scryfall import schema as ScrySchema
+
+"""
+* Sync Objects
+"""
+
+
+@dataclass
+class BulkSyncResult:
+    """The changes found by syncing a bulk data file.
+
+    Attributes:
+        bulk_type: Type of bulk data file synced, e.g. default_cards
+        updated_at: Time the synced bulk data file was last updated by Scryfall.
+        skipped: Whether the file was unchanged since the last sync, so it wasn't downloaded.
+        added: IDs of cards which weren't present in the last sync.
+        changed: IDs of cards whose content changed since the last sync.
+        removed: IDs of cards which are no longer present, or were removed by a migration.
+        migrations: Migrations applied during this sync, least recent first.
+    """
+    bulk_type: str
+    updated_at: Optional[str] = None
+    skipped: bool = False
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    migrations: list[ScrySchema.CardMigration] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any card was added, changed, or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+"""
+* Bulk Sync
+"""
+
+
+class BulkSync:
+    """Tracks the state of synced Scryfall bulk data files in an SQLite database.
+
+    Notes:
+        The 'updated_at' time of each synced file is recorded, so unchanged files are skipped without
+        being downloaded. When a file has changed, each card's content hash is compared against the
+        last sync to find the cards which were added, changed, or removed, and only those are passed
+        to the card store. Card migrations are applied before each sync, removing merged and deleted
+        cards from the store; the replacement for a merged card arrives with the bulk data.
+        See docs: https://scryfall.com/docs/api/bulk-data, https://scryfall.com/docs/api/migrations
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        store: Optional[MutableCardStore] = None,
+        ignore: Iterable[str] = ()
+    ):
+        """Initialize the sync state, creating the database if necessary.
+
+        Args:
+            path: Path to the SQLite database file.
+            store: Optional card store to add changed cards to and remove deleted cards from.
+            ignore: Card fields excluded from the content hash, e.g. ('prices',) to ignore daily price changes.
+        """
+        self.path = Path(path)
+        self.store = store
+        self.ignore = set(ignore)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS bulk_state ('
+            'type TEXT PRIMARY KEY, updated_at TEXT NOT NULL, synced_at REAL NOT NULL)')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS card_hashes ('
+            'type TEXT NOT NULL, id TEXT NOT NULL, hash TEXT NOT NULL, '
+            'PRIMARY KEY (type, id)) WITHOUT ROWID')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS migrations ('
+            'id TEXT PRIMARY KEY, performed_at TEXT NOT NULL, applied_at REAL NOT NULL)')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    """
+    * Sync State
+    """
+
+    def get_updated_at(self, bulk_type: str) -> Optional[str]:
+        """Returns the 'updated_at' time of a bulk data file when it was last synced.
+
+        Args:
+            bulk_type: Type of bulk data file, e.g. default_cards
+        """
+        with self._lock:
+            row = self._db.execute('SELECT updated_at FROM bulk_state WHERE type = ?', (bulk_type,)).fetchone()
+        return row[0] if row else None
+
+    def get_hashes(self, bulk_type: str) -> dict[str, str]:
+        """Returns the content hash of each card recorded for a bulk data file, mapped to its card ID.
+
+        Args:
+            bulk_type: Type of bulk data file, e.g. default_cards
+        """
+        with self._lock:
+            return dict(self._db.execute('SELECT id, hash FROM card_hashes WHERE type = ?', (bulk_type,)))
+
+    def get_hash(self, card: ScrySchema.Card) -> str:
+        """Returns the content hash of a card, excluding any ignored fields.
+
+        Args:
+            card: Scryfall 'Card' object.
+        """
+        return hashlib.blake2b(
+            card.model_dump_json(exclude=self.ignore).encode('utf-8'),
+            digest_size=16).hexdigest()
+
+    """
+    * Syncing
+    """
+
+    def apply_migrations(self, header: Optional[dict] = None) -> list[ScrySchema.CardMigration]:
+        """Apply each card migration performed since the last sync.
+
+        Notes:
+            Migrations are read newest first until one which was already applied is found. On the first
+            sync only the newest migration is recorded, since a store built from current bulk data
+            already reflects every earlier migration.
+
+        Args:
+            header: Optional header to pass with the request.
+
+        Returns:
+            The migrations applied, least recent first.
+        """
+        with self._lock:
+            applied = {n for n, in self._db.execute('SELECT id FROM migrations')}
+        pending: list[ScrySchema.CardMigration] = []
+        for migration in iter_migration_list(header=header):
+            if migration.id in applied:
+                break
+            pending.append(migration)
+            if not applied:
+                break
+        pending.reverse()
+
+        # Merged and deleted cards are both removed, a merged card's replacement arrives with the bulk data
+        applying = pending if applied else []
+        if self.store is not None:
+            for migration in applying:
+                self.store.remove(migration.old_scryfall_id)
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.executemany(
+                    'DELETE FROM card_hashes WHERE id = ?',
+                    [(n.old_scryfall_id,) for n in applying])
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO migrations VALUES (?, ?, ?)',
+                    [(n.id, str(n.performed_at), time.time()) for n in pending])
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return applying
+
+    def sync(
+        self,
+        bulk_type: str = BulkDataType.DefaultCards,
+        header: Optional[dict] = None,
+        force: bool = False
+    ) -> BulkSyncResult:
+        """Sync a bulk data file, passing only new and changed cards to the card store.
+
+        Args:
+            bulk_type: Type of bulk data file to sync, e.g. default_cards
+            header: Optional header to pass with each request.
+            force: Whether to download the file even if it hasn't been updated since the last sync.
+
+        Returns:
+            The changes found since the last sync.
+
+        Raises:
+            ValueError: If the bulk data type doesn't contain 'Card' objects.
+        """
+        if bulk_type == BulkDataType.Rulings:
+            raise ValueError("Bulk data type 'rulings' doesn't contain 'Card' objects!")
+        migrations = self.apply_migrations(header=header)
+        bulk = get_bulk_data(bulk_type, header=header)
+        result = BulkSyncResult(
+            bulk_type=bulk.type,
+            updated_at=str(bulk.updated_at),
+            migrations=migrations,
+            removed=[n.old_scryfall_id for n in migrations])
+        if not force and result.updated_at == self.get_updated_at(bulk.type):
+            result.skipped = True
+            return result
+
+        # Compare each card against its hash from the last sync
+        previous, rows = self.get_hashes(bulk.type), []
+        for card in iter_bulk_data(bulk, header=header):
+            digest, last = self.get_hash(card), previous.pop(card.id, None)
+            if digest == last:
+                continue
+            (result.added if last is None else result.changed).append(card.id)
+            rows.append((bulk.type, card.id, digest))
+            if self.store is not None:
+                self.store.add(card)
+
+        # Any card not found in the file was removed
+        for uid in previous:
+            result.removed.append(uid)
+            if self.store is not None:
+                self.store.remove(uid)
+
+        # Record the new state in a single transaction
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.executemany('INSERT OR REPLACE INTO card_hashes VALUES (?, ?, ?)', rows)
+                self._db.executemany(
+                    'DELETE FROM card_hashes WHERE type = ? AND id = ?',
+                    [(bulk.type, n) for n in previous])
+                self._db.execute(
+                    'INSERT OR REPLACE INTO bulk_state VALUES (?, ?, ?)',
+                    (bulk.type, result.updated_at, time.time()))
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return result
@@ -0,0 +1,4 @@
+"""
+* Hexproof Utilities
+* Shared utilities used by each data source module.
+"""
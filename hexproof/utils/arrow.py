@@ -0,0 +1,240 @@
+"""
+* Arrow Export Utilities
+* Requires the optional 'arrow' dependencies: pip install hexproof[arrow]
+"""
+# Standard Library Imports
+import datetime
+import json
+import os
+import types
+from functools import cache
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Union, get_args, get_origin
+
+# Third Party Imports
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+"""
+* Arrow Schemas
+"""
+
+
+def _get_union_args(annotation: Any) -> Optional[tuple]:
+    """Returns the non-null members of a Union or Optional annotation, or None if it isn't a union."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        return tuple(n for n in get_args(annotation) if n is not type(None))
+    return None
+
+
+def get_arrow_type(annotation: Any) -> pa.DataType:
+    """Returns the Arrow type used to store values of a schema field annotation.
+
+    Notes:
+        Nested schemas become struct columns, lists become list columns, and dicts become map columns.
+        Strings, string constants, dates, and unions of them are stored as strings. Any other union or
+        untyped value is stored as a JSON encoded string.
+
+    Args:
+        annotation: Type annotation of a schema field.
+    """
+    if (args := _get_union_args(annotation)) is not None:
+        if len(args) == 1:
+            return get_arrow_type(args[0])
+        arrow_types = {get_arrow_type(n) for n in args}
+        return arrow_types.pop() if len(arrow_types) == 1 else pa.string()
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return get_arrow_type(type(get_args(annotation)[0]))
+    if origin in (list, tuple, set):
+        return pa.list_(get_arrow_type(get_args(annotation)[0]))
+    if origin is dict:
+        return pa.map_(pa.string(), get_arrow_type(get_args(annotation)[1]))
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return pa.struct([
+                pa.field(name, get_arrow_type(field.annotation))
+                for name, field in annotation.model_fields.items()])
+        if issubclass(annotation, bool):
+            return pa.bool_()
+        if issubclass(annotation, int):
+            return pa.int64()
+        if issubclass(annotation, float):
+            return pa.float64()
+        if issubclass(annotation, (str, datetime.date)):
+            return pa.string()
+    return pa.string()
+
+
+@cache
+def get_arrow_schema(schema: type[BaseModel]) -> pa.Schema:
+    """Returns the Arrow schema of a schema model, with one column for each field in their defined order.
+
+    Args:
+        schema: Schema model class, e.g. `ScrySchema.Card`
+    """
+    return pa.schema([
+        pa.field(name, get_arrow_type(field.annotation))
+        for name, field in schema.model_fields.items()])
+
+
+"""
+* Converting Values
+"""
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Returns a value JSON encoded, unless it is null or already a string."""
+    return value if value is None or isinstance(value, str) else json.dumps(value)
+
+
+def _get_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Returns a function converting a JSON dumped value to its Arrow value, or None if no conversion is needed."""
+    if (args := _get_union_args(annotation)) is not None:
+        if len(args) == 1:
+            return _get_converter(args[0])
+        return None if len({get_arrow_type(n) for n in args}) == 1 else _to_json
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return None
+    if origin in (list, tuple, set):
+        if (item := _get_converter(get_args(annotation)[0])) is not None:
+            return lambda v: v if v is None else [item(n) for n in v]
+        return None
+    if origin is dict:
+        if (item := _get_converter(get_args(annotation)[1])) is not None:
+            return lambda v: v if v is None else {k: item(n) for k, n in v.items()}
+        return None
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _get_model_converter(annotation)
+        if issubclass(annotation, (bool, int, float, str, datetime.date)):
+            return None
+    return _to_json
+
+
+@cache
+def _get_model_converter(schema: type[BaseModel]) -> Optional[Callable[[dict], dict]]:
+    """Returns a function converting the JSON dumped fields of a model, or None if no conversion is needed."""
+    fields = {
+        name: converter for name, field in schema.model_fields.items()
+        if (converter := _get_converter(field.annotation)) is not None}
+    if not fields:
+        return None
+
+    def convert(obj: Optional[dict]) -> Optional[dict]:
+        if obj is None:
+            return None
+        for name, func in fields.items():
+            obj[name] = func(obj.get(name))
+        return obj
+    return convert
+
+
+"""
+* Record Batches
+"""
+
+
+def iter_record_batches(
+    objects: Iterable[BaseModel],
+    schema: Optional[type[BaseModel]] = None,
+    batch_size: int = 10000
+) -> Iterator[pa.RecordBatch]:
+    """Converts a stream of schema objects into Arrow record batches.
+
+    Args:
+        objects: Schema objects, e.g. Scryfall 'Card' objects from a bulk data stream.
+        schema: Schema model of the objects, taken from the first object if not provided.
+        batch_size: Maximum number of objects in each record batch.
+
+    Yields:
+        An Arrow record batch using the schema model's Arrow schema.
+    """
+    objects = iter(objects)
+    if schema is None:
+        if (first := next(objects, None)) is None:
+            return
+        schema, objects = type(first), chain([first], objects)
+    arrow_schema, convert = get_arrow_schema(schema), _get_model_converter(schema)
+    while batch := list(islice(objects, batch_size)):
+        rows = [n.model_dump(mode='json') for n in batch]
+        if convert is not None:
+            rows = [convert(n) for n in rows]
+        yield pa.RecordBatch.from_pylist(rows, schema=arrow_schema)
+
+
+"""
+* Export Funcs
+"""
+
+
+def export_parquet(
+    objects: Iterable[BaseModel],
+    path: Union[str, os.PathLike],
+    schema: Optional[type[BaseModel]] = None,
+    batch_size: int = 10000,
+    compression: str = 'zstd'
+) -> int:
+    """Streams schema objects into a Parquet file, one row group per batch.
+
+    Args:
+        objects: Schema objects, e.g. Scryfall 'Card' objects from a bulk data stream.
+        path: Path to save the Parquet file.
+        schema: Schema model of the objects, taken from the first object if not provided.
+        batch_size: Maximum number of objects in each row group.
+        compression: Parquet compression codec.
+
+    Returns:
+        Number of rows written.
+    """
+    total, writer = 0, None
+    try:
+        for batch in iter_record_batches(objects, schema=schema, batch_size=batch_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+            writer.write_batch(batch)
+            total += batch.num_rows
+
+        # Write an empty file if the schema is known
+        if writer is None and schema is not None:
+            writer = pq.ParquetWriter(path, get_arrow_schema(schema), compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return total
+
+
+def export_arrow(
+    objects: Iterable[BaseModel],
+    path: Union[str, os.PathLike],
+    schema: Optional[type[BaseModel]] = None,
+    batch_size: int = 10000
+) -> int:
+    """Streams schema objects into an Arrow IPC file, one record batch per batch.
+
+    Args:
+        objects: Schema objects, e.g. Scryfall 'Card' objects from a bulk data stream.
+        path: Path to save the Arrow IPC file.
+        schema: Schema model of the objects, taken from the first object if not provided.
+        batch_size: Maximum number of objects in each record batch.
+
+    Returns:
+        Number of rows written.
+    """
+    total, writer = 0, None
+    try:
+        for batch in iter_record_batches(objects, schema=schema, batch_size=batch_size):
+            if writer is None:
+                writer = pa.ipc.new_file(path, batch.schema)
+            writer.write_batch(batch)
+            total += batch.num_rows
+
+        # Write an empty file if the schema is known
+        if writer is None and schema is not None:
+            writer = pa.ipc.new_file(path, get_arrow_schema(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    return total
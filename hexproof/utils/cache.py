@@ -0,0 +1,224 @@
+"""
+* Response Cache Utilities
+* Persistent HTTP response cache with conditional revalidation, shared by each data source module.
+"""
+# Standard Library Imports
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+# Third Party Imports
+import yarl
+from requests import Response
+
+"""
+* Cache Objects
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A response body stored in the cache, along with its validators."""
+    url: str
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the response can be used without revalidating it with the server.
+
+        Args:
+            ttl: Number of seconds a response is considered fresh after it was stored or revalidated.
+        """
+        return (time.time() - self.stored_at) < ttl
+
+
+class ResponseCache:
+    """An on-disk SQLite cache of HTTP response bodies.
+
+    Notes:
+        Fresh responses are returned without making a request. Stale responses are revalidated with a
+        conditional request using their ETag and Last-Modified validators, and reused if the server
+        responds with '304 Not Modified'. The least recently used responses are evicted once the total
+        size of the cache exceeds its limit.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        ttl: float = 3600,
+        max_size: int = 1024 * 1024 * 1024
+    ):
+        """Initialize the cache, creating the database if necessary.
+
+        Args:
+            path: Path to the SQLite database file.
+            ttl: Number of seconds a response is considered fresh after it was stored or revalidated.
+            max_size: Maximum total size in bytes of the cached response bodies.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, content BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+            'stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+
+    """
+    * Cache Entries
+    """
+
+    def get(self, url: Union[str, yarl.URL]) -> Optional[CachedResponse]:
+        """Returns a cached response for a URL if one exists.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            The cached response, or None if the URL isn't cached.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT url, content, etag, last_modified, stored_at FROM responses WHERE url = ?',
+                (str(url),)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), str(url)))
+        return CachedResponse(*row)
+
+    def set(
+        self,
+        url: Union[str, yarl.URL],
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a response for a URL, evicting the least recently used responses if the cache is full.
+
+        Args:
+            url: Request URL.
+            content: Response body.
+            etag: Value of the response's ETag header.
+            last_modified: Value of the response's Last-Modified header.
+        """
+        if len(content) > self.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (str(url), content, etag, last_modified, now, now, len(content)))
+            self._evict()
+
+    def touch(self, url: Union[str, yarl.URL]) -> None:
+        """Mark a cached response as fresh after it was successfully revalidated.
+
+        Args:
+            url: Request URL.
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?',
+                (now, now, str(url)))
+
+    def _evict(self) -> None:
+        """Remove the least recently used responses until the total size is within the limit."""
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_size:
+            return
+        for url, size in self._db.execute(
+            'SELECT url, size FROM responses ORDER BY accessed_at'
+        ).fetchall():
+            self._db.execute('DELETE FROM responses WHERE url = ?', (url,))
+            total -= size
+            if total <= self.max_size:
+                return
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    """
+    * Requests
+    """
+
+    def fetch(
+        self,
+        url: Union[str, yarl.URL],
+        request: Callable[[dict], Response],
+        header: Optional[dict] = None
+    ) -> bytes:
+        """Returns the response body for a URL, using the cache where possible.
+
+        Args:
+            url: Request URL, used as the cache key.
+            request: Function which makes the request when the cache can't be used. Passed the headers
+                to send, including any conditional headers, and returns the Response.
+            header: Optional header to pass with the request.
+
+        Returns:
+            The response body.
+        """
+        cached = self.get(url)
+        if cached is not None and cached.is_fresh(self.ttl):
+            return cached.content
+
+        # Revalidate a stale response
+        header = dict(header or {})
+        if cached is not None:
+            if cached.etag:
+                header['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                header['If-Modified-Since'] = cached.last_modified
+        r = request(header)
+        if cached is not None and r.status_code == 304:
+            self.touch(url)
+            return cached.content
+
+        # Store the new response
+        self.set(
+            url=url,
+            content=r.content,
+            etag=r.headers.get('ETag'),
+            last_modified=r.headers.get('Last-Modified'))
+        return r.content
+
+
+"""
+* Default Cache
+"""
+
+# Cache used by each data source module, disabled unless one is provided
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Returns the response cache used by each data source module, if one is enabled."""
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Set the response cache used by each data source module.
+
+    Args:
+        cache: Response cache to use, or None to disable caching.
+    """
+    global _response_cache
+    _response_cache = cache
@@ -0,0 +1,502 @@
+"""
+* Price History Utilities
+* Append-only store of MTGJSON price series, compressed with delta and run-length encoding.
+* Requires the optional 'prices' dependencies: pip install hexproof[prices]
+"""
+# Standard Library Imports
+import os
+import sqlite3
+import struct
+import threading
+from pathlib import Path
+from typing import Iterator, Mapping, NamedTuple, Optional, Union
+
+# Third Party Imports
+import numpy as np
+import yarl
+
+# Local Imports
+from hexproof.mtgjson import schema as MTGJsonTypes
+from hexproof.mtgjson.enums import MTGJsonURL
+from hexproof.utils.prices import PriceTable, get_price_table, get_price_table_file
+
+# Header of an encoded block: number of points, date runs, and price runs
+_block_header = struct.Struct('<iii')
+
+# Prices are stored as whole numbers of 1/10000ths, so sub-cent MTGO prices, e.g. 0.005, are kept exactly
+_price_scale = 10_000
+
+"""
+* Price Series
+"""
+
+
+class PriceSeriesKey(NamedTuple):
+    """Identifies a single price series of a card."""
+    uuid: str
+    game_format: str
+    provider: str
+    list_type: str
+    finish: str
+
+
+"""
+* Block Encoding
+"""
+
+
+def _get_runs(values: np.ndarray, starts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run-length encode a column containing any number of series.
+
+    Args:
+        values: Values of every series, each series stored contiguously.
+        starts: Whether each row is the first row of a series.
+
+    Returns:
+        A tuple containing the value and length of each run, and the index of the first run of each series.
+    """
+    run_starts = starts.copy()
+    run_starts[1:] |= values[1:] != values[:-1]
+    positions = np.flatnonzero(run_starts)
+    lengths = np.diff(np.append(positions, len(values))).astype(np.int32)
+    return values[positions], lengths, np.flatnonzero(starts[positions])
+
+
+def _get_deltas(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Delta encode a column containing any number of series, the first value of each series is kept as is."""
+    deltas = np.empty_like(values)
+    deltas[0:1] = values[0:1]
+    deltas[1:] = values[1:] - values[:-1]
+    deltas[starts] = values[starts]
+    return deltas
+
+
+def encode_blocks(days: np.ndarray, units: np.ndarray, starts: np.ndarray) -> list[bytes]:
+    """Encode any number of price series into blocks, one per series, in a single vectorized pass.
+
+    Notes:
+        Dates and prices are each delta encoded, then run-length encoded. Daily prices which don't
+        change, or change by the same amount, collapse into a single run, as do consecutive dates.
+
+    Args:
+        days: Date of each point as days since the epoch, each series stored contiguously in date order.
+        units: Price of each point in 1/10000ths.
+        starts: Whether each row is the first row of a series.
+
+    Returns:
+        The encoded block of each series.
+    """
+    if not len(days):
+        return []
+    series = np.flatnonzero(starts)
+    counts = np.diff(np.append(series, len(days)))
+    date_values, date_lengths, date_series = _get_runs(_get_deltas(days, starts), starts)
+    price_values, price_lengths, price_series = _get_runs(_get_deltas(units, starts), starts)
+    date_bounds = np.append(date_series, len(date_values)).tolist()
+    price_bounds = np.append(price_series, len(price_values)).tolist()
+    date_values, date_lengths = date_values.astype('<i8').tobytes(), date_lengths.astype('<i4').tobytes()
+    price_values, price_lengths = price_values.astype('<i8').tobytes(), price_lengths.astype('<i4').tobytes()
+
+    # Slice the runs of each series out of the encoded columns
+    blocks = []
+    for i, n in enumerate(counts.tolist()):
+        d0, d1, p0, p1 = date_bounds[i], date_bounds[i + 1], price_bounds[i], price_bounds[i + 1]
+        blocks.append(b''.join((
+            _block_header.pack(n, d1 - d0, p1 - p0),
+            date_values[d0 * 8:d1 * 8], date_lengths[d0 * 4:d1 * 4],
+            price_values[p0 * 8:p1 * 8], price_lengths[p0 * 4:p1 * 4])))
+    return blocks
+
+
+def decode_block(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a block of a single price series.
+
+    Args:
+        data: Encoded block.
+
+    Returns:
+        A tuple containing the date of each point as days since the epoch, and its price in 1/10000ths.
+    """
+    _, date_runs, price_runs = _block_header.unpack_from(data)
+    offset, arrays = _block_header.size, []
+    for runs in (date_runs, price_runs):
+        values = np.frombuffer(data, dtype='<i8', count=runs, offset=offset)
+        lengths = np.frombuffer(data, dtype='<i4', count=runs, offset=offset + runs * 8)
+        arrays.append(np.cumsum(np.repeat(values, lengths)))
+        offset += runs * 12
+    return arrays[0], arrays[1]
+
+
+"""
+* Price History
+"""
+
+
+class PriceHistory:
+    """An on-disk SQLite store of MTGJSON price series, appended to as new prices are published.
+
+    Notes:
+        Each card, game format, provider, price list, and finish has its own price series. A series is
+        stored as blocks of points, each delta and run-length encoded, along with the date range they
+        cover. Points are never replaced, a point is only added if its series has no point on that day,
+        so a daily 'AllPricesToday' feed and an overlapping 'AllPrices' backfill can both be appended
+        in any order. Range queries only read and decode the blocks of the requested series which
+        overlap the range. Each append adds a block per series, use `compact` to merge them into
+        larger blocks.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], block_size: int = 366):
+        """Initialize the store, creating the database if necessary.
+
+        Args:
+            path: Path to the SQLite database file.
+            block_size: Maximum number of points in a block written by `compact`.
+        """
+        self.path = Path(path)
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS series (
+                id INTEGER PRIMARY KEY, uuid TEXT NOT NULL, game_format TEXT NOT NULL, provider TEXT NOT NULL,
+                list_type TEXT NOT NULL, finish TEXT NOT NULL, currency TEXT, last_day INTEGER NOT NULL,
+                UNIQUE (uuid, game_format, provider, list_type, finish));
+            CREATE TABLE IF NOT EXISTS blocks (
+                series_id INTEGER NOT NULL, start_day INTEGER NOT NULL, end_day INTEGER NOT NULL,
+                count INTEGER NOT NULL, data BLOB NOT NULL);
+            CREATE INDEX IF NOT EXISTS blocks_series ON blocks (series_id, end_day);
+        """)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM series').fetchone()[0]
+
+    """
+    * Appending Prices
+    """
+
+    def append(self, table: PriceTable) -> int:
+        """Append every price point in a price table whose series has no point stored on that day.
+
+        Notes:
+            Points newer than a series' last stored day are appended without reading the series. Older
+            points, e.g. from an 'AllPrices' backfill, are checked against the days already stored.
+
+        Args:
+            table: Price table, e.g. from `get_price_table` or `PriceTable.from_prices`
+
+        Returns:
+            Number of points appended.
+        """
+        if not len(table):
+            return 0
+
+        # Order the rows by series and date
+        order = np.lexsort((
+            table.date, table.finish, table.list_type, table.provider, table.game_format, table.uuid_index))
+        columns = [np.asarray(getattr(table, n))[order] for n in (
+            'uuid_index', 'game_format', 'provider', 'list_type', 'finish')]
+        days = np.asarray(table.date)[order].astype('datetime64[D]').astype(np.int64)
+        units = np.rint(np.asarray(table.price)[order] * _price_scale).astype(np.int64)
+        currency = np.asarray(table.currency)[order]
+        starts = np.zeros(len(days), dtype=bool)
+        starts[0] = True
+        for column in columns:
+            starts[1:] |= column[1:] != column[:-1]
+
+        # Look up each series, noting the new ones
+        first = np.flatnonzero(starts)
+        names = [np.array(table.categories[n], dtype=object) for n in (
+            'game_format', 'provider', 'list_type', 'finish')]
+        keys = list(zip(
+            np.asarray(table.uuids)[columns[0][first]].tolist(),
+            *(names[i][columns[i + 1][first]].tolist() for i in range(4))))
+        currencies = np.array(table.categories['currency'], dtype=object)[currency[first]].tolist()
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                stored = self._get_series(keys)
+                new = [(*k, c, -1) for k, c in zip(keys, currencies) if k not in stored]
+                if new:
+                    self._db.executemany(
+                        'INSERT INTO series (uuid, game_format, provider, list_type, finish, currency, last_day) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?)', new)
+                    stored.update(self._get_series([n[:5] for n in new]))
+
+                # Skip points on days already stored, which can only be on or before each series' last day
+                ids = np.array([stored[k][0] for k in keys], dtype=np.int64)
+                last = np.array([stored[k][1] for k in keys], dtype=np.int64)
+                counts = np.diff(np.append(first, len(days)))
+                row_ids, keep = np.repeat(ids, counts), np.ones(len(days), dtype=bool)
+                older = days <= np.repeat(last, counts)
+                if older.any():
+                    stored_ids, stored_days, _ = self._read_blocks(np.unique(row_ids[older]).tolist())
+                    keep[older] = ~np.isin(
+                        row_ids[older] * (1 << 32) + days[older], stored_ids * (1 << 32) + stored_days)
+                row_ids, days, units = row_ids[keep], days[keep], units[keep]
+                if not len(days):
+                    self._db.execute('COMMIT')
+                    return 0
+                starts = np.ones(len(days), dtype=bool)
+                starts[1:] = row_ids[1:] != row_ids[:-1]
+                self._insert_blocks(row_ids, days, units, starts)
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return len(days)
+
+    def append_prices(self, prices: Mapping[str, Union[MTGJsonTypes.PriceFormats, dict]]) -> int:
+        """Append MTGJSON price data, e.g. the 'data' of an 'AllPricesToday' or 'AllPrices' file.
+
+        Args:
+            prices: Card UUIDs mapped to their MTGJSON 'PriceFormats' objects or raw price dicts.
+
+        Returns:
+            Number of points appended.
+        """
+        return self.append(PriceTable.from_prices(prices))
+
+    def append_url(
+        self,
+        url: yarl.URL = MTGJsonURL.BulkJSON.AllPricesToday,
+        header: Optional[dict] = None
+    ) -> int:
+        """Download and append an MTGJSON price file, streamed straight into a price table.
+
+        Args:
+            url: MTGJSON price file URL, 'AllPricesToday' for a daily feed or 'AllPrices' to backfill
+                the last 90 days.
+            header: Optional request header object.
+
+        Returns:
+            Number of points appended.
+        """
+        return self.append(get_price_table(url=url, header=header))
+
+    def append_file(self, path: Union[str, os.PathLike]) -> int:
+        """Append a locally saved MTGJSON 'AllPricesToday' or 'AllPrices' file.
+
+        Args:
+            path: Path to the JSON file, may be compressed if it has a '.gz', '.bz2', or '.xz' suffix.
+
+        Returns:
+            Number of points appended.
+        """
+        return self.append(get_price_table_file(path))
+
+    def _get_series(self, keys: list[tuple]) -> dict[tuple, tuple[int, int]]:
+        """Returns the ID and last stored day of each stored series among the given keys."""
+        found, keys = {}, set(keys)
+        uuids = sorted({k[0] for k in keys})
+        for i in range(0, len(uuids), 900):
+            chunk = uuids[i:i + 900]
+            rows = self._db.execute(
+                'SELECT uuid, game_format, provider, list_type, finish, id, last_day FROM series '
+                f'WHERE uuid IN ({", ".join("?" * len(chunk))})', chunk).fetchall()
+            found.update({tuple(r[:5]): (r[5], r[6]) for r in rows if tuple(r[:5]) in keys})
+        return found
+
+    def _read_blocks(self, ids: list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the series ID, day, and price of every point stored in a list of series, ordered by series
+            and day."""
+        decoded, row_ids = [], []
+        for i in range(0, len(ids), 900):
+            chunk = ids[i:i + 900]
+            for series_id, data in self._db.execute(
+                'SELECT series_id, data FROM blocks '
+                f'WHERE series_id IN ({", ".join("?" * len(chunk))})', chunk
+            ):
+                decoded.append(decode_block(data))
+                row_ids.append(series_id)
+        if not decoded:
+            return (np.empty(0, dtype=np.int64),) * 3
+        days = np.concatenate([n[0] for n in decoded])
+        units = np.concatenate([n[1] for n in decoded])
+        row_ids = np.repeat(np.array(row_ids, dtype=np.int64), [len(n[0]) for n in decoded])
+        order = np.lexsort((days, row_ids))
+        return row_ids[order], days[order], units[order]
+
+    def _insert_blocks(self, ids: np.ndarray, days: np.ndarray, units: np.ndarray, starts: np.ndarray) -> None:
+        """Encode and insert a block for each series, then move each series' last stored day forward."""
+        first = np.flatnonzero(starts)
+        bounds = np.append(first, len(days))
+        blocks = encode_blocks(days, units, starts)
+        self._db.executemany('INSERT INTO blocks VALUES (?, ?, ?, ?, ?)', zip(
+            ids[first].tolist(), days[first].tolist(), days[bounds[1:] - 1].tolist(),
+            np.diff(bounds).tolist(), blocks))
+        self._db.executemany('UPDATE series SET last_day = MAX(last_day, ?) WHERE id = ?', zip(
+            days[bounds[1:] - 1].tolist(), ids[first].tolist()))
+
+    def compact(self) -> int:
+        """Merge the blocks of each series into as few blocks as possible, up to `block_size` points each.
+
+        Returns:
+            Number of series compacted.
+        """
+        with self._lock:
+            ids = [r[0] for r in self._db.execute(
+                'SELECT series_id FROM blocks GROUP BY series_id '
+                'HAVING COUNT(*) > (SUM(count) + ? - 1) / ?', (self.block_size, self.block_size))]
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                for i in range(0, len(ids), 900):
+                    chunk = ids[i:i + 900]
+                    row_ids, days, units = self._read_blocks(chunk)
+
+                    # Start a new block at each series and after every `block_size` points
+                    series = np.flatnonzero(np.append(True, row_ids[1:] != row_ids[:-1]))
+                    position = np.arange(len(days)) - np.repeat(series, np.diff(np.append(series, len(days))))
+                    self._db.executemany('DELETE FROM blocks WHERE series_id = ?', ((n,) for n in chunk))
+                    self._insert_blocks(row_ids, days, units, position % self.block_size == 0)
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return len(ids)
+
+    """
+    * Range Queries
+    """
+
+    def _read_series(
+        self,
+        series_id: int,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the days and prices of a series, decoding only the blocks which overlap a range of days.
+            Blocks backfilled with older points can overlap, so the points are put back in date order."""
+        rows = self._db.execute(
+            'SELECT data FROM blocks WHERE series_id = ? AND end_day >= ? AND start_day <= ? ORDER BY start_day',
+            (series_id, -(2 ** 62) if start is None else start, 2 ** 62 if end is None else end)).fetchall()
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        decoded = [decode_block(r[0]) for r in rows]
+        days = np.concatenate([n[0] for n in decoded])
+        units = np.concatenate([n[1] for n in decoded])
+        if len(decoded) > 1:
+            order = np.argsort(days, kind='stable')
+            days, units = days[order], units[order]
+        mask = np.ones(len(days), dtype=bool)
+        if start is not None:
+            mask &= days >= start
+        if end is not None:
+            mask &= days <= end
+        return days[mask], units[mask]
+
+    def get_series(
+        self,
+        uuid: str,
+        provider: str,
+        finish: str = 'normal',
+        list_type: str = 'retail',
+        game_format: str = 'paper',
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the dates and prices of a price series, in date order.
+
+        Args:
+            uuid: Card UUID.
+            provider: Price provider, e.g. 'tcgplayer'
+            finish: Finish, e.g. 'foil'
+            list_type: Price list, 'retail' or 'buylist'
+            game_format: Game format, 'paper' or 'mtgo'
+            start: Optional first date to include as YYYY-MM-DD.
+            end: Optional last date to include as YYYY-MM-DD.
+
+        Returns:
+            A tuple containing a datetime64 array of dates and a float array of prices, empty if the
+                series isn't stored.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT id FROM series WHERE uuid = ? AND game_format = ? AND provider = ? '
+                'AND list_type = ? AND finish = ?', (uuid, game_format, provider, list_type, finish)).fetchone()
+            if row is None:
+                return np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.float64)
+            days, units = self._read_series(
+                row[0],
+                start=None if start is None else int(np.datetime64(start, 'D').astype(np.int64)),
+                end=None if end is None else int(np.datetime64(end, 'D').astype(np.int64)))
+        return days.astype('datetime64[D]'), units / _price_scale
+
+    def get_series_keys(self, uuid: str) -> list[PriceSeriesKey]:
+        """Returns the key of each price series stored for a card.
+
+        Args:
+            uuid: Card UUID.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT uuid, game_format, provider, list_type, finish FROM series WHERE uuid = ? '
+                'ORDER BY game_format, provider, list_type, finish', (uuid,)).fetchall()
+        return [PriceSeriesKey(*n) for n in rows]
+
+    def iter_series(self, uuid: str, **kwargs) -> Iterator[tuple[PriceSeriesKey, np.ndarray, np.ndarray]]:
+        """Yields every price series stored for a card.
+
+        Args:
+            uuid: Card UUID.
+            **kwargs: Optional 'start' and 'end' dates as YYYY-MM-DD.
+
+        Yields:
+            Tuple containing the series key, its dates, and its prices.
+        """
+        for key in self.get_series_keys(uuid):
+            yield (key, *self.get_series(
+                uuid, key.provider, finish=key.finish, list_type=key.list_type,
+                game_format=key.game_format, **kwargs))
+
+    def rolling(
+        self,
+        uuid: str,
+        provider: str,
+        window: int = 7,
+        func: str = 'mean',
+        finish: str = 'normal',
+        list_type: str = 'retail',
+        game_format: str = 'paper',
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns a rolling statistic of a price series.
+
+        Args:
+            uuid: Card UUID.
+            provider: Price provider, e.g. 'tcgplayer'
+            window: Number of points in each window.
+            func: Statistic to compute over each window: 'mean', 'median', 'min', 'max', or 'std'.
+            finish: Finish, e.g. 'foil'
+            list_type: Price list, 'retail' or 'buylist'
+            game_format: Game format, 'paper' or 'mtgo'
+            start: Optional first date to include as YYYY-MM-DD.
+            end: Optional last date to include as YYYY-MM-DD.
+
+        Returns:
+            A tuple containing the last date of each full window and the statistic over that window.
+
+        Raises:
+            ValueError: If the statistic isn't supported.
+        """
+        funcs = {'mean': np.mean, 'median': np.median, 'min': np.min, 'max': np.max, 'std': np.std}
+        if func not in funcs:
+            raise ValueError(f"Unsupported rolling statistic: '{func}'")
+        dates, prices = self.get_series(
+            uuid, provider, finish=finish, list_type=list_type, game_format=game_format, start=start, end=end)
+        if len(prices) < window:
+            return dates[:0], prices[:0]
+        if func == 'mean':
+            sums = np.cumsum(np.insert(prices, 0, 0.0))
+            return dates[window - 1:], (sums[window:] - sums[:-window]) / window
+        windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+        return dates[window - 1:], funcs[func](windows, axis=1)
@@ -0,0 +1,427 @@
+"""
+* Rate Limiting Utilities
+* Token bucket rate limiters shared by request handlers.
+"""
+# Standard Library Imports
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Mapping, Optional, TypeVar, Union
+
+# Third Party Imports
+from requests import RequestException
+
+# Generic return type of a rate limited request
+T = TypeVar('T')
+
+# HTTP status codes indicating the client is being throttled
+throttle_status_codes = (429, 503)
+
+"""
+* Rate Limiters
+"""
+
+
+class TokenBucket:
+    """A thread-safe token bucket rate limiter, shared by every thread in a process.
+
+    Notes:
+        This is the default rate limiter backend. Subclasses can share the bucket more widely
+        by overriding `_reserve`, see `SQLiteTokenBucket`.
+
+        The rate adapts to throttling: each throttled response multiplies the rate by `backoff_factor`
+        and pauses the bucket for the duration the server asked for. Each successful request then
+        raises the rate by `recovery_step` until it's back to the configured rate. Throttled responses
+        arriving while the bucket is already paused, e.g. a burst of concurrent requests, only lower
+        the rate once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        backoff_factor: float = 0.5,
+        recovery_step: Optional[float] = None
+    ):
+        """Initialize the bucket.
+
+        Args:
+            rate: Number of tokens added to the bucket per second.
+            capacity: Maximum number of tokens the bucket can hold, allowing short bursts. Defaults to `rate`.
+            min_rate: Lowest rate the bucket can be lowered to when throttled. Defaults to a tenth of `rate`.
+            backoff_factor: Multiplier applied to the current rate each time a request is throttled.
+            recovery_step: Amount the rate is raised after each successful request. Defaults to 2% of `rate`.
+        """
+        self.rate = self.max_rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self.min_rate = rate / 10 if min_rate is None else min_rate
+        self.backoff_factor = backoff_factor
+        self.recovery_step = rate / 50 if recovery_step is None else recovery_step
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.RLock()
+
+    def _reserve(self, tokens: float, drain: bool = False) -> float:
+        """Reserve tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to reserve.
+            drain: Whether to discard any tokens available before reserving, so the wait
+                is measured from now.
+
+        Returns:
+            Number of seconds to wait before the reserved tokens are available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            if drain:
+                self._tokens = min(self._tokens, 0)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def throttle(self, delay: Optional[float] = None) -> None:
+        """Lower the rate and pause the bucket after the server throttled a request.
+
+        Args:
+            delay: Number of seconds the server asked to wait, waits one second if not provided.
+        """
+        with self._lock:
+            self.rate, self._paused_until, tokens, drain = self._get_throttled(
+                self.rate, self._paused_until, time.monotonic(), max(delay or 1.0, 0.0))
+            if tokens or drain:
+                self._reserve(tokens, drain=drain)
+
+    def recover(self) -> None:
+        """Raise the rate back toward its configured value after a successful request."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def _get_throttled(
+        self,
+        rate: float,
+        paused_until: float,
+        now: float,
+        delay: float
+    ) -> tuple[float, float, float, bool]:
+        """Returns the state of the bucket after a throttled response.
+
+        Notes:
+            A throttled response arriving while the bucket is already paused is merged into the pause,
+            only extending it if the server asked for longer, and doesn't lower the rate again.
+
+        Args:
+            rate: Current rate of the bucket.
+            paused_until: Time the current pause ends, if any.
+            now: Current time, on the same clock as `paused_until`.
+            delay: Number of seconds the server asked to wait.
+
+        Returns:
+            A tuple containing the new rate, the time the pause ends, the number of tokens to reserve,
+                and whether to drain the bucket before reserving them.
+        """
+        if now < paused_until:
+            if now + delay > paused_until:
+                return rate, now + delay, (now + delay - paused_until) * rate, False
+            return rate, paused_until, 0.0, False
+        rate = max(self.min_rate, rate * self.backoff_factor)
+        return rate, now + delay, delay * rate, True
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until the requested number of tokens are available.
+
+        Args:
+            tokens: Number of tokens to consume.
+        """
+        if delay := self._reserve(tokens):
+            time.sleep(delay)
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """A token bucket rate limiter stored in an SQLite database, shared by every process on a host.
+
+    Notes:
+        Each reservation is made in an exclusive transaction, so any number of worker processes
+        pointed at the same database file draw from one bucket. Multiple buckets can share a
+        database file by using different names. Each process opens its own connection on first use,
+        so a bucket created before a server forks its workers never shares a connection between them.
+        The adapted rate and any pause are stored in the bucket's row, so throttling seen by one process
+        slows down every process sharing the bucket.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        name: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        **kwargs
+    ):
+        """Initialize the bucket, creating the database if necessary.
+
+        Args:
+            path: Path to the SQLite database file shared by each process.
+            name: Name of the bucket within the database.
+            rate: Number of tokens added to the bucket per second.
+            capacity: Maximum number of tokens the bucket can hold, allowing short bursts. Defaults to `rate`.
+            **kwargs: Rate adaptation settings, see `TokenBucket`.
+        """
+        super().__init__(rate=rate, capacity=capacity, **kwargs)
+        self.path = Path(path)
+        self.name = name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        with self._lock:
+            self._get_db()
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Returns this process' connection to the database, opening a new connection after a fork."""
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=60, check_same_thread=False, isolation_level=None)
+            self._pid = os.getpid()
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL NOT NULL, '
+                'updated REAL NOT NULL, rate REAL, paused_until REAL NOT NULL DEFAULT 0)')
+
+            # Add the adaptive rate columns to a database created before they existed
+            columns = {r[1] for r in self._connection.execute('PRAGMA table_info(buckets)')}
+            if 'rate' not in columns:
+                self._connection.execute('ALTER TABLE buckets ADD COLUMN rate REAL')
+                self._connection.execute('ALTER TABLE buckets ADD COLUMN paused_until REAL NOT NULL DEFAULT 0')
+            self._connection.execute(
+                'INSERT OR IGNORE INTO buckets (name, tokens, updated, rate) VALUES (?, ?, ?, ?)',
+                (self.name, self.capacity, time.time(), self.rate))
+        return self._connection
+
+    def _transaction(self, func: Callable[[float, float, float, float], tuple[float, float, float, T]]) -> T:
+        """Update the shared state of the bucket in an exclusive transaction.
+
+        Args:
+            func: Function called with the tokens available after refilling the bucket, its rate, the
+                time its pause ends, and the current time. Returns the new tokens, rate, and pause end,
+                along with a result.
+
+        Returns:
+            The result of the function.
+        """
+        with self._lock:
+            db = self._get_db()
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                current, updated, rate, paused_until = db.execute(
+                    'SELECT tokens, updated, COALESCE(rate, ?), paused_until FROM buckets WHERE name = ?',
+                    (self.max_rate, self.name)).fetchone()
+                now = time.time()
+                current = min(self.capacity, current + max(0.0, now - updated) * rate)
+                current, rate, paused_until, result = func(current, rate, paused_until, now)
+                db.execute(
+                    'UPDATE buckets SET tokens = ?, updated = ?, rate = ?, paused_until = ? WHERE name = ?',
+                    (current, now, rate, paused_until, self.name))
+                db.execute('COMMIT')
+            except BaseException:
+                if db.in_transaction:
+                    db.execute('ROLLBACK')
+                raise
+            self.rate = rate
+        return result
+
+    def _reserve(self, tokens: float, drain: bool = False) -> float:
+        """Reserve tokens from the shared bucket.
+
+        Args:
+            tokens: Number of tokens to reserve.
+            drain: Whether to discard any tokens available before reserving, so the wait
+                is measured from now.
+
+        Returns:
+            Number of seconds to wait before the reserved tokens are available.
+        """
+        def reserve(current: float, rate: float, paused_until: float, now: float) -> tuple:
+            current = (min(current, 0) if drain else current) - tokens
+            return current, rate, paused_until, max(0.0, -current / rate)
+        return self._transaction(reserve)
+
+    def throttle(self, delay: Optional[float] = None) -> None:
+        """Lower the shared rate and pause the shared bucket after the server throttled a request.
+
+        Args:
+            delay: Number of seconds the server asked to wait, waits one second if not provided.
+        """
+        def throttle(current: float, rate: float, paused_until: float, now: float) -> tuple:
+            rate, paused_until, tokens, drain = self._get_throttled(
+                rate, paused_until, now, max(delay or 1.0, 0.0))
+            return (min(current, 0) if drain else current) - tokens, rate, paused_until, None
+        self._transaction(throttle)
+
+    def recover(self) -> None:
+        """Raise the shared rate back toward its configured value after a successful request."""
+        if self.rate >= self.max_rate:
+            return
+        self._transaction(lambda current, rate, paused_until, now: (
+            current, min(self.max_rate, rate + self.recovery_step), paused_until, None))
+
+
+"""
+* Throttling
+"""
+
+
+def parse_retry_after(status: Optional[int], headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Returns the number of seconds a throttled response asked the client to wait.
+
+    Notes:
+        Shared by the sync and async request handlers. The 'Retry-After' header can either be
+        a number of seconds or an HTTP date.
+
+    Args:
+        status: HTTP status code of the response.
+        headers: Headers of the response.
+
+    Returns:
+        Seconds to wait parsed from the 'Retry-After' header, or None if the response wasn't throttled,
+            or the header is missing or invalid.
+    """
+    if status not in throttle_status_codes or headers is None:
+        return None
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_retry_after(error: RequestException) -> Optional[float]:
+    """Returns the number of seconds a throttled response asked the client to wait.
+
+    Args:
+        error: Exception raised by a failed request.
+
+    Returns:
+        Seconds to wait parsed from the 'Retry-After' header, or None if the header is missing or invalid.
+    """
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    return parse_retry_after(response.status_code, response.headers)
+
+
+def is_throttled(error: RequestException) -> bool:
+    """Whether a request failed because the server is throttling the client.
+
+    Args:
+        error: Exception raised by a failed request.
+    """
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code in throttle_status_codes
+
+
+def call_rate_limited(name: str, func: Callable[..., T], *args, max_throttled: int = 5, **kwargs) -> T:
+    """Call a request function under a data source's rate limiter, adapting the rate to throttled responses.
+
+    Notes:
+        When a request is throttled, the limiter is slowed down and paused for the duration given
+        by the server's 'Retry-After' header, then the request is tried again. Other failures are raised.
+
+    Args:
+        name: Name of the data source whose rate limiter to use, e.g. scryfall
+        func: Request function to call.
+        *args: Positional arguments to pass to the function.
+        max_throttled: Maximum number of throttled attempts before giving up.
+        **kwargs: Keyword arguments to pass to the function.
+
+    Returns:
+        The return value of the request function.
+
+    Raises:
+        RequestException: If the request fails for another reason, or is throttled too many times.
+    """
+    attempt = 0
+    while True:
+        limiter = get_rate_limiter(name)
+        limiter.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except RequestException as e:
+            attempt += 1
+            if not is_throttled(e) or attempt >= max_throttled:
+                raise
+            limiter.throttle(get_retry_after(e))
+            continue
+        limiter.recover()
+        return result
+
+
+"""
+* Rate Limiter Registry
+"""
+
+# Rate limiters used by each data source's request handlers, keyed by source name
+_rate_limiters: dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(name: str) -> TokenBucket:
+    """Returns the rate limiter used by a data source's request handlers.
+
+    Args:
+        name: Name of the data source, e.g. scryfall, mtgjson, mtgpics
+
+    Returns:
+        The rate limiter currently in use.
+    """
+    return _rate_limiters[name]
+
+
+def set_rate_limiter(name: str, limiter: TokenBucket) -> TokenBucket:
+    """Swap the rate limiter used by a data source's request handlers, e.g. to share one
+        limit across several worker processes.
+
+    Args:
+        name: Name of the data source, e.g. scryfall, mtgjson, mtgpics
+        limiter: Rate limiter to use.
+
+    Returns:
+        The rate limiter provided.
+    """
+    _rate_limiters[name] = limiter
+    return limiter
+
+
+"""
+* Async Rate Limiters
+"""
+
+
+class AsyncTokenBucket(TokenBucket):
+    """A token bucket rate limiter for coroutines running in an event loop.
+
+    Notes:
+        Tokens are reserved synchronously before awaiting, so concurrent coroutines queue up in
+        the order they call `acquire` without needing a lock bound to any particular event loop.
+    """
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until the requested number of tokens are available.
+
+        Args:
+            tokens: Number of tokens to consume.
+        """
+        if delay := self._reserve(tokens):
+            await asyncio.sleep(delay)
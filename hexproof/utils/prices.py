@@ -0,0 +1,578 @@
+"""
+* Price Array Utilities
+* Requires the optional 'prices' dependencies: pip install hexproof[prices]
+"""
+# Standard Library Imports
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Mapping, NamedTuple, Optional, Union
+
+# Third Party Imports
+import numpy as np
+import yarl
+
+# Local Imports
+from hexproof.mtgjson import schema as MTGJsonTypes
+from hexproof.mtgjson.enums import MTGJsonURL
+from hexproof.mtgjson.fetch import get_stream, open_data_file
+from hexproof.utils.streaming import iter_json_object
+from hexproof.scryfall import schema as ScrySchema
+
+"""
+* Price Objects
+"""
+
+
+class PriceMove(NamedTuple):
+    """The change in a card's price between two price arrays.
+
+    Attributes:
+        id: Card ID (Scryfall ID or MTGJSON UUID).
+        old: Previous price.
+        new: Current price.
+        change: Difference between the prices, as an amount or a fraction of the previous price.
+    """
+    id: str
+    old: float
+    new: float
+    change: float
+
+
+@dataclass
+class PriceArrays:
+    """Aligned arrays of card prices, one float array per price column with NaN for missing prices.
+
+    Attributes:
+        ids: Card ID of each row (Scryfall ID or MTGJSON UUID).
+        prices: Price column names mapped to their price arrays, e.g. 'usd', 'tcgplayer_retail_foil'
+        keys: Optional grouping columns mapped to their key arrays, e.g. 'set', 'rarity'
+    """
+    ids: np.ndarray
+    prices: dict[str, np.ndarray]
+    keys: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.prices[column]
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the price columns."""
+        return list(self.prices)
+
+    """
+    * Aggregations
+    """
+
+    def group_by(
+        self,
+        column: str,
+        by: Union[str, np.ndarray],
+        func: str = 'median'
+    ) -> dict[str, float]:
+        """Aggregate a price column over each distinct key, ignoring missing prices.
+
+        Args:
+            column: Price column to aggregate, e.g. 'usd'
+            by: Grouping column name, e.g. 'set', or an array of keys aligned with the rows.
+            func: Aggregation to apply: 'count', 'sum', 'mean', 'median', 'min', or 'max'.
+
+        Returns:
+            A dict with each key mapped to its aggregated price, NaN if the key has no prices.
+
+        Raises:
+            ValueError: If the aggregation isn't supported.
+        """
+        keys = self.keys[by] if isinstance(by, str) else np.asarray(by)
+        values = self.prices[column]
+        groups, inverse = np.unique(keys, return_inverse=True)
+        valid = ~np.isnan(values)
+        count = np.bincount(inverse[valid], minlength=len(groups)).astype(np.float64)
+
+        # Aggregate each group in a single pass where possible
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if func == 'count':
+                result = count
+            elif func in ('sum', 'mean'):
+                result = np.bincount(inverse[valid], weights=values[valid], minlength=len(groups))
+                result = result if func == 'sum' else result / count
+            elif func in ('min', 'max'):
+                result = np.full(len(groups), np.inf if func == 'min' else -np.inf)
+                (np.minimum if func == 'min' else np.maximum).at(result, inverse[valid], values[valid])
+                result[count == 0] = np.nan
+            elif func == 'median':
+                order = np.lexsort((values[valid], inverse[valid]))
+                sorted_values, bounds = values[valid][order], np.cumsum(count).astype(np.int64)
+                starts = bounds - count.astype(np.int64)
+                result = np.array([
+                    np.median(sorted_values[s:e]) if e > s else np.nan
+                    for s, e in zip(starts, bounds)])
+            else:
+                raise ValueError(f"Unsupported price aggregation: '{func}'")
+        return dict(zip(groups.tolist(), result.tolist()))
+
+    def by_set(self, column: str, func: str = 'median') -> dict[str, float]:
+        """Aggregate a price column over each set.
+
+        Args:
+            column: Price column to aggregate, e.g. 'usd'
+            func: Aggregation to apply: 'count', 'sum', 'mean', 'median', 'min', or 'max'.
+        """
+        return self.group_by(column, 'set', func)
+
+    def by_rarity(self, column: str, func: str = 'median') -> dict[str, float]:
+        """Aggregate a price column over each rarity.
+
+        Args:
+            column: Price column to aggregate, e.g. 'usd'
+            func: Aggregation to apply: 'count', 'sum', 'mean', 'median', 'min', or 'max'.
+        """
+        return self.group_by(column, 'rarity', func)
+
+    def top(self, column: str, n: int = 10) -> list[tuple[str, float]]:
+        """Returns the most expensive cards in a price column.
+
+        Args:
+            column: Price column to rank, e.g. 'usd'
+            n: Number of cards to return.
+
+        Returns:
+            A list of card IDs and prices, most expensive first.
+        """
+        values = self.prices[column]
+        rows = np.flatnonzero(~np.isnan(values))
+        rows = rows[np.argsort(values[rows])[::-1][:n]]
+        return list(zip(self.ids[rows].tolist(), values[rows].tolist()))
+
+    def top_movers(
+        self,
+        previous: 'PriceArrays',
+        column: str,
+        n: int = 10,
+        relative: bool = False
+    ) -> list[PriceMove]:
+        """Returns the cards whose price changed the most since a previous set of price arrays.
+
+        Args:
+            previous: Price arrays from an earlier date.
+            column: Price column to compare, e.g. 'usd'
+            n: Number of cards to return.
+            relative: Whether to rank by the change as a fraction of the previous price.
+
+        Returns:
+            A list of price changes, largest absolute change first.
+        """
+        _, rows, prev_rows = np.intersect1d(self.ids, previous.ids, assume_unique=True, return_indices=True)
+        new, old = self.prices[column][rows], previous.prices[column][prev_rows]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            change = (new - old) / old if relative else new - old
+        valid = np.flatnonzero(np.isfinite(change))
+        valid = valid[np.argsort(np.abs(change[valid]))[::-1][:n]]
+        return [
+            PriceMove(*n) for n in zip(
+                self.ids[rows[valid]].tolist(), old[valid].tolist(),
+                new[valid].tolist(), change[valid].tolist())]
+
+
+"""
+* Extracting Prices
+"""
+
+
+def _to_float_array(values: list[Optional[str]]) -> np.ndarray:
+    """Converts price strings to a float array in a single pass, with NaN for missing prices."""
+    return np.array([n or 'nan' for n in values]).astype(np.float64)
+
+
+def get_card_price_arrays(cards: Iterable[ScrySchema.Card]) -> PriceArrays:
+    """Extract the prices of Scryfall 'Card' objects into aligned arrays.
+
+    Args:
+        cards: Scryfall 'Card' objects, e.g. from a bulk data stream.
+
+    Returns:
+        Price arrays with a column for each currency and finish in 'CardPrices', e.g. 'usd', 'usd_foil',
+            grouped by 'set' and 'rarity'.
+    """
+    columns = tuple(ScrySchema.CardPrices.model_fields)
+    ids, sets, rarities, values = [], [], [], {n: [] for n in columns}
+    for card in cards:
+        ids.append(card.id)
+        sets.append(card.set)
+        rarities.append(str(card.rarity))
+        for name in columns:
+            values[name].append(getattr(card.prices, name))
+    return PriceArrays(
+        ids=np.array(ids, dtype=object),
+        prices={n: _to_float_array(values[n]) for n in columns},
+        keys={'set': np.array(sets, dtype=object), 'rarity': np.array(rarities, dtype=object)})
+
+
+def get_mtgjson_price_arrays(
+    prices: Mapping[str, Union[MTGJsonTypes.PriceFormats, dict]],
+    date: Optional[str] = None,
+    game_format: str = 'paper'
+) -> PriceArrays:
+    """Extract MTGJSON prices for a single date into aligned arrays.
+
+    Args:
+        prices: Card UUIDs mapped to their MTGJSON 'PriceFormats' objects, or the raw 'data' of
+            an 'AllPricesToday' or 'AllPrices' file.
+        date: Date of the prices to extract as YYYY-MM-DD, uses the latest date of each price if not provided.
+        game_format: Game format to extract prices for, 'paper' or 'mtgo'.
+
+    Returns:
+        Price arrays with a column for each provider, price list, and finish,
+            e.g. 'tcgplayer_retail_normal', 'cardkingdom_buylist_foil'
+    """
+    ids, values = [], {}
+    for row, (uuid, formats) in enumerate(prices.items()):
+        if isinstance(formats, MTGJsonTypes.PriceFormats):
+            formats = formats.model_dump(exclude_none=True)
+        ids.append(uuid)
+        for provider, price_list in (formats.get(game_format) or {}).items():
+            for list_type in ('retail', 'buylist'):
+                for finish, points in ((price_list or {}).get(list_type) or {}).items():
+                    if not points:
+                        continue
+                    price = points.get(date if date else max(points))
+                    if price is not None:
+                        values.setdefault(f'{provider}_{list_type}_{finish}', {})[row] = price
+
+    # Scatter the prices of each column into an aligned array
+    arrays = {}
+    for name, column in sorted(values.items()):
+        arrays[name] = np.full(len(ids), np.nan)
+        arrays[name][np.fromiter(column.keys(), dtype=np.int64, count=len(column))] = np.fromiter(
+            column.values(), dtype=np.float64, count=len(column))
+    return PriceArrays(ids=np.array(ids, dtype=object), prices=arrays)
+
+
+"""
+* Price Table
+"""
+
+# Number of price points buffered as Python objects before they're converted to arrays
+_chunk_rows = 1 << 20
+
+# Categorical columns of a price table, in the order their codes are nested in MTGJSON price data
+_price_categories = ('game_format', 'provider', 'list_type', 'finish', 'currency')
+
+
+@dataclass
+class PriceTable:
+    """Flattened MTGJSON price points stored as columns, one row per card, provider, price list, finish, and date.
+
+    Notes:
+        Rows are sorted by card UUID, then by each categorical column, then by date, so every price
+        series is contiguous and in date order. Card UUIDs are sorted and each card's rows are
+        located with `offsets`, so lookups never scan the table. Categorical columns store small
+        integer codes indexing into `categories`. The table can be saved as a directory of '.npy'
+        files and loaded memory-mapped, so only the pages that are read are loaded from disk.
+
+    Attributes:
+        uuids: Sorted card UUIDs.
+        offsets: Start row of each card UUID, followed by the total number of rows.
+        uuid_index: Index into `uuids` of each row.
+        game_format: Code of each row's game format, e.g. 'paper'
+        provider: Code of each row's price provider, e.g. 'tcgplayer'
+        list_type: Code of each row's price list, e.g. 'retail'
+        finish: Code of each row's finish, e.g. 'foil'
+        currency: Code of each row's currency, e.g. 'USD'
+        date: Date of each price point.
+        price: Each price point.
+        categories: Names of each categorical column mapped to the value of each code.
+    """
+    uuids: np.ndarray
+    offsets: np.ndarray
+    uuid_index: np.ndarray
+    game_format: np.ndarray
+    provider: np.ndarray
+    list_type: np.ndarray
+    finish: np.ndarray
+    currency: np.ndarray
+    date: np.ndarray
+    price: np.ndarray
+    categories: dict[str, tuple[str, ...]]
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    """
+    * Building Tables
+    """
+
+    @classmethod
+    def from_prices(
+        cls,
+        prices: Union[Mapping[str, Union[MTGJsonTypes.PriceFormats, dict]], Iterable[tuple[str, dict]]]
+    ) -> 'PriceTable':
+        """Flatten MTGJSON price data into a price table.
+
+        Args:
+            prices: Card UUIDs mapped to their MTGJSON 'PriceFormats' objects or raw price dicts, e.g. the
+                'data' of an 'AllPricesToday' or 'AllPrices' file, or an iterable of UUID and price dict pairs.
+
+        Returns:
+            A price table containing every price point.
+        """
+        items = prices.items() if isinstance(prices, Mapping) else prices
+        codes: dict[str, dict[str, int]] = {n: {} for n in _price_categories}
+        series, dates, values, chunks = [], [], [], []
+
+        def _flush() -> None:
+            """Convert the buffered series and points to arrays, so at most one chunk is held as Python objects."""
+            chunks.append((
+                np.array([n[0] for n in series], dtype=str),
+                np.array([n[1:6] for n in series], dtype=np.uint8).reshape(-1, 5),
+                np.fromiter((n[6] for n in series), dtype=np.int64, count=len(series)),
+                np.array(dates, dtype='datetime64[D]'),
+                np.array(values, dtype=np.float64)))
+            series.clear(), dates.clear(), values.clear()
+
+        # Record the codes and number of points of each price series, and collect the points in chunks
+        for uuid, formats in items:
+            if isinstance(formats, MTGJsonTypes.PriceFormats):
+                formats = formats.model_dump(exclude_none=True)
+            for game_format, providers in (formats or {}).items():
+                for provider, price_list in (providers or {}).items():
+                    currency = price_list.get('currency') or ''
+                    for list_type in ('retail', 'buylist'):
+                        for finish, points in (price_list.get(list_type) or {}).items():
+                            if not points:
+                                continue
+                            series.append((
+                                uuid,
+                                codes['game_format'].setdefault(game_format, len(codes['game_format'])),
+                                codes['provider'].setdefault(provider, len(codes['provider'])),
+                                codes['list_type'].setdefault(list_type, len(codes['list_type'])),
+                                codes['finish'].setdefault(finish, len(codes['finish'])),
+                                codes['currency'].setdefault(currency, len(codes['currency'])),
+                                len(points)))
+                            dates.extend(points.keys())
+                            values.extend(points.values())
+            if len(dates) >= _chunk_rows:
+                _flush()
+        _flush()
+
+        # Expand each series' codes to its rows
+        uuids, uuid_index = np.unique(np.concatenate([n[0] for n in chunks]), return_inverse=True)
+        series_codes = np.concatenate([n[1] for n in chunks])
+        counts = np.concatenate([n[2] for n in chunks])
+        columns = {
+            name: np.repeat(series_codes[:, i], counts) for i, name in enumerate(_price_categories)}
+        table = cls(
+            uuids=uuids,
+            offsets=np.zeros(len(uuids) + 1, dtype=np.int64),
+            uuid_index=np.repeat(uuid_index.astype(np.int32), counts),
+            date=np.concatenate([n[3] for n in chunks]),
+            price=np.concatenate([n[4] for n in chunks]),
+            categories={k: tuple(v) for k, v in codes.items()},
+            **columns)
+        return table._sorted()
+
+    def _sorted(self) -> 'PriceTable':
+        """Sorts the rows into price series in date order and computes the offset of each card UUID."""
+        order = np.lexsort((
+            self.date, self.currency, self.finish, self.list_type,
+            self.provider, self.game_format, self.uuid_index))
+        for name in ('uuid_index', 'date', 'price', *_price_categories):
+            setattr(self, name, getattr(self, name)[order])
+        self.offsets = np.concatenate((
+            [0], np.cumsum(np.bincount(self.uuid_index, minlength=len(self.uuids))))).astype(np.int64)
+        return self
+
+    """
+    * Lookups
+    """
+
+    def get_code(self, category: str, value: str) -> int:
+        """Returns the code of a categorical value, or -1 if it doesn't appear in the table.
+
+        Args:
+            category: Categorical column, e.g. 'provider'
+            value: Value to look up, e.g. 'tcgplayer'
+        """
+        values = self.categories[category]
+        return values.index(value) if value in values else -1
+
+    def get_rows(self, uuids: Union[str, Iterable[str]]) -> np.ndarray:
+        """Returns the rows of one or more card UUIDs.
+
+        Args:
+            uuids: Card UUID or UUIDs to look up, UUIDs which aren't in the table are ignored.
+
+        Returns:
+            An array of row indexes, grouped by card UUID in the order given.
+        """
+        uuids = np.atleast_1d(np.asarray(list(uuids) if not isinstance(uuids, str) else uuids, dtype=str))
+        if not len(self.uuids) or not len(uuids):
+            return np.empty(0, dtype=np.int64)
+        idx = np.searchsorted(self.uuids, uuids)
+        idx = idx[(idx < len(self.uuids)) & (self.uuids[np.minimum(idx, len(self.uuids) - 1)] == uuids)]
+
+        # Concatenate the row ranges of each card without a Python loop
+        starts = self.offsets[idx]
+        lengths = self.offsets[idx + 1] - starts
+        return np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + \
+            np.arange(lengths.sum())
+
+    def find(
+        self,
+        uuids: Optional[Union[str, Iterable[str]]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        game_format: Optional[str] = None,
+        provider: Optional[str] = None,
+        list_type: Optional[str] = None,
+        finish: Optional[str] = None
+    ) -> np.ndarray:
+        """Returns the rows matching every given filter.
+
+        Args:
+            uuids: Optional card UUID or UUIDs to include.
+            start: Optional first date to include as YYYY-MM-DD.
+            end: Optional last date to include as YYYY-MM-DD.
+            game_format: Optional game format to include, e.g. 'paper'
+            provider: Optional price provider to include, e.g. 'tcgplayer'
+            list_type: Optional price list to include, 'retail' or 'buylist'
+            finish: Optional finish to include, e.g. 'foil'
+
+        Returns:
+            An array of row indexes.
+        """
+        rows = self.get_rows(uuids) if uuids is not None else None
+        mask = None
+        for category, value in (
+            ('game_format', game_format), ('provider', provider),
+            ('list_type', list_type), ('finish', finish)
+        ):
+            if value is not None:
+                column = getattr(self, category) if rows is None else getattr(self, category)[rows]
+                mask = (column == self.get_code(category, value)) if mask is None else \
+                    mask & (column == self.get_code(category, value))
+        if start is not None or end is not None:
+            dates = self.date if rows is None else self.date[rows]
+            if start is not None:
+                mask = (dates >= np.datetime64(start)) if mask is None else mask & (dates >= np.datetime64(start))
+            if end is not None:
+                mask = (dates <= np.datetime64(end)) if mask is None else mask & (dates <= np.datetime64(end))
+        if rows is None:
+            return np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        return rows if mask is None else rows[mask]
+
+    def get_series(
+        self,
+        uuid: str,
+        provider: str,
+        finish: str = 'normal',
+        list_type: str = 'retail',
+        game_format: str = 'paper'
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the dates and prices of a single price series, in date order.
+
+        Args:
+            uuid: Card UUID.
+            provider: Price provider, e.g. 'tcgplayer'
+            finish: Finish, e.g. 'foil'
+            list_type: Price list, 'retail' or 'buylist'
+            game_format: Game format, 'paper' or 'mtgo'
+        """
+        rows = self.find(uuid, game_format=game_format, provider=provider, list_type=list_type, finish=finish)
+        return self.date[rows], self.price[rows]
+
+    def get_values(self, category: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the values of a categorical column, e.g. provider names, for the given rows.
+
+        Args:
+            category: Categorical column, e.g. 'provider'
+            rows: Optional row indexes, every row is used if not provided.
+        """
+        codes = getattr(self, category) if rows is None else getattr(self, category)[rows]
+        return np.array(self.categories[category], dtype=str)[codes]
+
+    """
+    * Saving and Loading
+    """
+
+    def save(self, path: Union[str, os.PathLike]) -> Path:
+        """Save the table as a directory of '.npy' files.
+
+        Args:
+            path: Directory to save the table in, created if necessary.
+
+        Returns:
+            Path to the directory.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in ('uuids', 'offsets', 'uuid_index', 'date', 'price', *_price_categories):
+            np.save(path / f'{name}.npy', getattr(self, name), allow_pickle=False)
+        with open(path / 'categories.json', 'w', encoding='utf-8') as f:
+            json.dump(self.categories, f)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap: bool = True) -> 'PriceTable':
+        """Load a table saved with `save`.
+
+        Args:
+            path: Directory the table was saved in.
+            mmap: Whether to memory-map the arrays instead of reading them into memory.
+
+        Returns:
+            The loaded price table, its arrays are read-only if memory-mapped.
+        """
+        path = Path(path)
+        with open(path / 'categories.json', encoding='utf-8') as f:
+            categories = {k: tuple(v) for k, v in json.load(f).items()}
+        return cls(
+            categories=categories,
+            **{
+                name: np.load(path / f'{name}.npy', mmap_mode='r' if mmap else None, allow_pickle=False)
+                for name in ('uuids', 'offsets', 'uuid_index', 'date', 'price', *_price_categories)})
+
+
+"""
+* Loading Price Tables
+"""
+
+
+def _iter_price_data(fp: BinaryIO) -> Iterator[tuple[str, dict]]:
+    """Yields each card UUID and its raw price dict from the 'data' of a MTGJSON price file stream."""
+    yield from iter_json_object(fp, path=('data',), decode=True)
+
+
+def get_price_table(
+    url: yarl.URL = MTGJsonURL.BulkJSON.AllPricesToday,
+    header: Optional[dict] = None
+) -> PriceTable:
+    """Stream a MTGJSON price file into a price table, without building any schema objects.
+
+    Args:
+        url: URL of the MTGJSON price file, 'AllPricesToday' or 'AllPrices'
+        header: Optional headers to include in the request.
+
+    Returns:
+        A price table containing every price point in the file.
+    """
+    with get_stream(url, header=header) as r:
+        return PriceTable.from_prices(_iter_price_data(r.raw))
+
+
+def get_price_table_file(path: Union[str, os.PathLike]) -> PriceTable:
+    """Stream a locally saved MTGJSON price file into a price table, without building any schema objects.
+
+    Args:
+        path: Path to the 'AllPricesToday' or 'AllPrices' JSON file, may be compressed if it
+            has a '.gz', '.bz2', or '.xz' suffix.
+
+    Returns:
+        A price table containing every price point in the file.
+    """
+    with open_data_file(path) as f:
+        return PriceTable.from_prices(_iter_price_data(f))
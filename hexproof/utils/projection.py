@@ -0,0 +1,130 @@
+"""
+* Field Projection Utilities
+* Slim schema models containing only the fields a caller needs.
+"""
+# Standard Library Imports
+import copy
+import types
+from functools import cache
+from typing import Any, ClassVar, Iterable, Optional, Union, get_args, get_origin
+
+# Third Party Imports
+from omnitils.schema import Schema
+from pydantic import BaseModel, create_model
+
+"""
+* Projected Models
+"""
+
+
+class ProjectedSchema(Schema):
+    """Base class of projected models, remembering the schema and fields they were created from.
+
+    Notes:
+        Projected models are created at runtime, so objects are pickled with a reference to their
+        original schema and fields instead of their class, and rebuilt with a cached projected model.
+    """
+    __projected_schema__: ClassVar[type[BaseModel]]
+    __projected_fields__: ClassVar[frozenset[str]]
+
+    def __reduce__(self) -> tuple:
+        return _rebuild_projected, (self.__projected_schema__, self.__projected_fields__, self.__getstate__())
+
+
+def _rebuild_projected(schema: type[BaseModel], fields: frozenset[str], state: dict) -> BaseModel:
+    """Rebuilds a pickled object of a projected model."""
+    model = _get_projected_model(schema, fields)
+    obj = model.__new__(model)
+    obj.__setstate__(state)
+    return obj
+
+
+def _get_field_tree(fields: Iterable[str]) -> dict[str, Optional[frozenset[str]]]:
+    """Groups dotted field paths by their first field, e.g. ['name', 'identifiers.scryfallId'] becomes
+        {'name': None, 'identifiers': {'scryfallId'}}. A field selected in full is mapped to None."""
+    tree: dict[str, Optional[set[str]]] = {}
+    for path in fields:
+        name, _, rest = path.partition('.')
+        if not rest or tree.get(name, set()) is None:
+            tree[name] = None
+        else:
+            tree.setdefault(name, set()).add(rest)
+    return {k: v if v is None else frozenset(v) for k, v in tree.items()}
+
+
+@cache
+def _get_projected_model(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Creates the projected model of a schema, see `get_projected_model`."""
+    tree = _get_field_tree(fields)
+    names = {(f.alias or n): n for n, f in schema.model_fields.items()}
+    unknown = [n for n in tree if n not in schema.model_fields and n not in names]
+    if unknown:
+        raise ValueError(f"Schema '{schema.__name__}' has no fields: {', '.join(unknown)}")
+
+    # Keep each selected field in the schema's order, projecting any nested selection
+    selected = {names.get(k, k): v for k, v in tree.items()}
+    projected = {}
+    for name, field in schema.model_fields.items():
+        if name not in selected:
+            continue
+        annotation = field.annotation
+        if (nested := selected[name]) is not None:
+            annotation = project(annotation, nested)
+        projected[name] = (annotation, copy.copy(field))
+    model = create_model(
+        f'{schema.__name__}[{",".join(n for n in schema.model_fields if n in selected)}]',
+        __base__=ProjectedSchema,
+        __module__=schema.__module__,
+        __doc__=schema.__doc__,
+        **projected)
+    model.__projected_schema__, model.__projected_fields__ = schema, fields
+    return model
+
+
+def get_projected_model(schema: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """Returns a cached copy of a schema model containing only the selected fields.
+
+    Notes:
+        Validating with a projected model skips every field that wasn't selected, so unselected
+        subtrees, e.g. 'foreignData' or 'legalities', are never built into Python objects.
+        Nested fields can be selected with a dotted path, which projects the nested schema
+        as well, including schemas inside lists and dicts, e.g. 'foreignData.name'
+
+    Args:
+        schema: Schema model class, e.g. `MTGJsonTypes.CardSet`
+        fields: Field names or aliases to keep, e.g. ['name', 'uuid', 'identifiers.scryfallId']
+
+    Returns:
+        A schema model class containing only the selected fields, named after the schema and its fields,
+            e.g. 'CardAtomic[name,identifiers]'. It isn't a subclass of the schema.
+
+    Raises:
+        ValueError: If a field isn't defined on the schema.
+    """
+    return _get_projected_model(schema, frozenset(fields))
+
+
+def project(annotation: Any, fields: Iterable[str]) -> Any:
+    """Returns a type annotation with each schema model inside it replaced by its projected model.
+
+    Args:
+        annotation: Schema model class or type annotation, e.g. `dict[str, list[MTGJsonTypes.CardAtomic]]`
+        fields: Field names or aliases to keep, e.g. ['name', 'uuid', 'identifiers.scryfallId']
+
+    Returns:
+        The projected schema model class or type annotation.
+
+    Raises:
+        ValueError: If a field isn't defined on the schema.
+    """
+    fields = frozenset(fields)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (Union, types.UnionType):
+        return Union[tuple(project(n, fields) if n is not type(None) else n for n in args)]
+    if origin in (list, tuple, set):
+        return origin[tuple(n if n is Ellipsis else project(n, fields) for n in args)] if args else annotation
+    if origin is dict:
+        return dict[args[0], project(args[1], fields)] if args else annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _get_projected_model(annotation, fields)
+    return annotation
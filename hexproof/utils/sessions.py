@@ -0,0 +1,255 @@
+"""
+* HTTP Session Utilities
+* Pooled, keep-alive sessions shared by each data source module.
+"""
+# Standard Library Imports
+import os
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+
+# Third Party Imports
+import yarl
+from omnitils.fetch import request_header_default, download_file_from_response, chunk_size_default
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+"""
+* Configuration
+"""
+
+
+@dataclass
+class SessionConfig:
+    """Connection pool and keep-alive settings used when creating sessions for a host.
+
+    Attributes:
+        pool_connections: Number of connection pools to cache, one is used per scheme and port.
+        pool_maxsize: Maximum number of connections kept open in each pool, should match the
+            number of threads making requests concurrently.
+        pool_block: Whether to block when every connection in a pool is in use, rather than
+            opening a temporary connection that is discarded afterward.
+        keep_alive: Whether to request persistent connections and enable TCP keep-alive probes.
+        keep_alive_idle: Seconds a connection can sit idle before TCP keep-alive probes are sent.
+        headers: Default headers to send with every request, uses the default header if not provided.
+    """
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    pool_block: bool = False
+    keep_alive: bool = True
+    keep_alive_idle: int = 60
+    headers: dict[str, str] = field(default_factory=lambda: request_header_default.copy())
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter which enables TCP keep-alive probes on every pooled connection."""
+
+    def __init__(self, keep_alive_idle: int = 60, **kwargs):
+        self._keep_alive_idle = keep_alive_idle
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Adds TCP keep-alive socket options to the pool manager."""
+        options = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self._keep_alive_idle))
+        kwargs['socket_options'] = options
+        super().init_poolmanager(*args, **kwargs)
+
+
+"""
+* Session Pool
+"""
+
+
+class SessionPool:
+    """A thread-safe registry of pooled sessions, keyed by host.
+
+    Notes:
+        Each host is given a single connection pool which is shared by every thread. Sessions
+        themselves are created per-thread, since cookies and other session state aren't thread-safe.
+    """
+
+    def __init__(self, config: Optional[SessionConfig] = None):
+        """Initialize the pool.
+
+        Args:
+            config: Default settings used for any host which isn't configured explicitly.
+        """
+        self.config = config or SessionConfig()
+        self._configs: dict[str, SessionConfig] = {}
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._injected: dict[str, Session] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @staticmethod
+    def get_host(url: Union[str, yarl.URL]) -> str:
+        """Returns the host name of a URL, or the string itself if it's already a host name."""
+        return yarl.URL(str(url)).host or str(url)
+
+    def configure(self, host: str, config: SessionConfig) -> None:
+        """Set the pool settings used for a host, replacing any existing connection pool.
+
+        Args:
+            host: Host name, or a URL on that host.
+            config: Settings to use for this host.
+        """
+        host = self.get_host(host)
+        with self._lock:
+            self._configs[host] = config
+            if adapter := self._adapters.pop(host, None):
+                adapter.close()
+            self._generation += 1
+
+    def set_session(self, host: str, session: Optional[Session]) -> None:
+        """Inject a session to use for every request made to a host.
+
+        Args:
+            host: Host name, or a URL on that host.
+            session: Session to use, or None to go back to using pooled sessions.
+        """
+        host = self.get_host(host)
+        with self._lock:
+            if session is None:
+                self._injected.pop(host, None)
+            else:
+                self._injected[host] = session
+
+    def get_adapter(self, host: str) -> HTTPAdapter:
+        """Returns the shared connection pool adapter for a host, creating it if necessary.
+
+        Args:
+            host: Host name.
+
+        Returns:
+            The HTTPAdapter managing connections to this host.
+        """
+        with self._lock:
+            if host not in self._adapters:
+                config = self._configs.get(host, self.config)
+                self._adapters[host] = KeepAliveAdapter(
+                    keep_alive_idle=config.keep_alive_idle,
+                    pool_connections=config.pool_connections,
+                    pool_maxsize=config.pool_maxsize,
+                    pool_block=config.pool_block
+                ) if config.keep_alive else HTTPAdapter(
+                    pool_connections=config.pool_connections,
+                    pool_maxsize=config.pool_maxsize,
+                    pool_block=config.pool_block)
+            return self._adapters[host]
+
+    def get_session(self, url: Union[str, yarl.URL]) -> Session:
+        """Returns the session to use for a request, creating one for the current thread if necessary.
+
+        Args:
+            url: Request URL, or the host name the request is made to.
+
+        Returns:
+            An injected session if one was provided for this host, otherwise a pooled session.
+        """
+        host = self.get_host(url)
+        if session := self._injected.get(host):
+            return session
+
+        # Sessions are rebuilt after the pool is reconfigured or closed
+        if getattr(self._local, 'generation', None) != self._generation:
+            self._local.sessions, self._local.generation = {}, self._generation
+        sessions: dict[str, Session] = self._local.sessions
+        if host not in sessions:
+            config = self._configs.get(host, self.config)
+            session = Session()
+            session.headers.update(config.headers)
+            session.headers['Connection'] = 'keep-alive' if config.keep_alive else 'close'
+            adapter = self.get_adapter(host)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            sessions[host] = session
+        return sessions[host]
+
+    def close(self) -> None:
+        """Close every pooled connection, sessions are recreated on the next request."""
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+            self._generation += 1
+
+
+# Pool used by each data source module by default
+session_pool = SessionPool()
+
+"""
+* Session Funcs
+"""
+
+
+def get_session(url: Union[str, yarl.URL]) -> Session:
+    """Returns the session from the default pool used for requests to a URL's host.
+
+    Args:
+        url: Request URL, or the host name the request is made to.
+
+    Returns:
+        Session to make the request with.
+    """
+    return session_pool.get_session(url)
+
+
+def set_session(host: str, session: Optional[Session]) -> None:
+    """Inject a session into the default pool to use for every request made to a host.
+
+    Args:
+        host: Host name, or a URL on that host, e.g. api.scryfall.com
+        session: Session to use, or None to go back to using pooled sessions.
+    """
+    session_pool.set_session(host, session)
+
+
+def configure_session(host: str, config: SessionConfig) -> None:
+    """Set the connection pool settings used by the default pool for a host.
+
+    Args:
+        host: Host name, or a URL on that host, e.g. api.scryfall.com
+        config: Settings to use for this host.
+    """
+    session_pool.configure(host, config)
+
+
+"""
+* Request Funcs
+"""
+
+
+def download_file(
+    url: Union[str, yarl.URL],
+    path: Union[str, os.PathLike],
+    header: Optional[dict] = None,
+    session: Optional[Session] = None,
+    callback: Optional[Callable[[int, int], None]] = None,
+    chunk_size: int = chunk_size_default
+) -> Union[str, os.PathLike]:
+    """Download a file in chunks using a pooled session.
+
+    Args:
+        url: URL where the file is hosted.
+        path: Path to save the file to.
+        header: Optional header to pass with the request.
+        session: Session to make the request with, uses the pooled session for the URL's host if not provided.
+        callback: Optional callback to execute after each chunk is written. Passes
+            number of bytes written (int) and number of bytes total (int).
+        chunk_size: Chunk size in bytes to download over each iteration.
+
+    Returns:
+        Path to the saved file, if successful.
+    """
+    session = session or get_session(url)
+    with session.get(str(url), headers=header, stream=True) as r:
+        return download_file_from_response(
+            response=r,
+            path=path,
+            callback=callback,
+            chunk_size=chunk_size)
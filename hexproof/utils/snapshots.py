@@ -0,0 +1,171 @@
+"""
+* Snapshot Cache Utilities
+* On-disk snapshots of validated datasets, so a restarted process can skip fetching and validating them.
+"""
+# Standard Library Imports
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+# Local Imports
+from hexproof.utils.validation import paused_gc
+
+T = TypeVar('T')
+
+# Snapshot file format, bumped whenever the layout of a snapshot changes
+_snapshot_format = 1
+
+"""
+* Snapshot Cache
+"""
+
+
+class SnapshotCache:
+    """A directory of pickled datasets, each stored alongside the version of the source it was built from.
+
+    Notes:
+        Each snapshot is a pickle (protocol 5) holding a small header followed by the dataset, so a
+        snapshot's version can be checked without loading the dataset. Snapshots are written to a
+        temporary file and moved into place, so concurrent processes never read a partial snapshot.
+        A snapshot is stale once the source version changes, e.g. a new MTGJSON 'Meta' version or
+        a new Scryfall bulk data 'updated_at', and is rebuilt on its next use.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Initialize the cache, creating the directory if necessary.
+
+        Args:
+            path: Directory to save snapshots in.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_path(self, name: str) -> Path:
+        """Returns the path of a named snapshot."""
+        return (self.path / name).with_suffix('.pickle')
+
+    def _get_lock(self, name: str) -> threading.Lock:
+        """Returns the lock used to build a named snapshot, so each snapshot is only built once at a time."""
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    """
+    * Snapshots
+    """
+
+    def get_version(self, name: str) -> Optional[str]:
+        """Returns the source version of a named snapshot, without loading its dataset.
+
+        Args:
+            name: Name of the snapshot, e.g. 'mtgjson_atomic_cards'
+
+        Returns:
+            The source version, or None if the snapshot doesn't exist or is unreadable.
+        """
+        try:
+            with open(self.get_path(name), 'rb') as f:
+                fmt, version = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        return version if fmt == _snapshot_format else None
+
+    def get(self, name: str, version: Optional[str] = None) -> Optional[Any]:
+        """Load a named snapshot.
+
+        Args:
+            name: Name of the snapshot, e.g. 'mtgjson_atomic_cards'
+            version: Source version the snapshot must have been built from, any version if not provided.
+
+        Returns:
+            The dataset, or None if the snapshot doesn't exist, is stale, or is unreadable.
+        """
+        try:
+            with open(self.get_path(name), 'rb') as f:
+                fmt, stored = pickle.load(f)
+                if fmt != _snapshot_format or (version is not None and stored != version):
+                    return None
+                with paused_gc():
+                    return pickle.load(f)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+            return None
+
+    def set(self, name: str, version: str, obj: Any) -> Path:
+        """Save a dataset as a named snapshot, replacing any previous snapshot.
+
+        Args:
+            name: Name of the snapshot, e.g. 'mtgjson_atomic_cards'
+            version: Source version the dataset was built from.
+            obj: Dataset to save, e.g. a dict of validated schema objects.
+
+        Returns:
+            Path to the snapshot file.
+        """
+        path = self.get_path(name)
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=f'.{name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((_snapshot_format, version), f, protocol=5)
+                pickle.dump(obj, f, protocol=5)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+
+    def remove(self, name: str) -> None:
+        """Remove a named snapshot if it exists.
+
+        Args:
+            name: Name of the snapshot.
+        """
+        self.get_path(name).unlink(missing_ok=True)
+
+    def fetch(self, name: str, version: str, load: Callable[[], T]) -> T:
+        """Returns a named dataset from its snapshot, rebuilding the snapshot if it is missing or stale.
+
+        Args:
+            name: Name of the snapshot, e.g. 'mtgjson_atomic_cards'
+            version: Current version of the source, e.g. the MTGJSON 'Meta' version.
+            load: Function which fetches and validates the dataset, called if the snapshot can't be used.
+
+        Returns:
+            The dataset.
+        """
+        if (obj := self.get(name, version)) is not None:
+            return obj
+        with self._get_lock(name):
+
+            # Another thread may have rebuilt the snapshot while waiting
+            if (obj := self.get(name, version)) is not None:
+                return obj
+            obj = load()
+            self.set(name, version, obj)
+            return obj
+
+
+"""
+* Default Snapshot Cache
+"""
+
+# Snapshot cache used by each data source module, disabled by default
+_snapshot_cache: Optional[SnapshotCache] = None
+
+
+def get_snapshot_cache() -> Optional[SnapshotCache]:
+    """Returns the snapshot cache used by each data source module, if one is enabled."""
+    return _snapshot_cache
+
+
+def set_snapshot_cache(cache: Optional[SnapshotCache]) -> None:
+    """Set the snapshot cache used by each data source module.
+
+    Args:
+        cache: Snapshot cache to use, or None to disable snapshots.
+    """
+    global _snapshot_cache
+    _snapshot_cache = cache
@@ -0,0 +1,283 @@
+"""
+* Card Store Utilities
+* Durable SQLite storage of schema objects with indexed lookups and full text search.
+"""
+# Standard Library Imports
+import os
+import sqlite3
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Generic, Iterable, Iterator, Optional, TypeVar, Union
+
+# Third Party Imports
+from omnitils.schema import Schema
+from omnitils.strings import normalize_str
+
+T = TypeVar('T', bound=Schema)
+
+"""
+* SQLite Store
+"""
+
+
+class SQLiteStore(Generic[T]):
+    """An on-disk SQLite store of schema objects, each saved as JSON alongside its indexed lookup columns.
+
+    Notes:
+        Subclasses define the schema, the lookup columns to index, and how an object maps to its row.
+        Objects are inserted in large transactions, one per batch. Each object is also indexed by its
+        normalized names for exact name lookups, and by its name, type line and rules text in an FTS5
+        table kept in sync by triggers. Lookups return validated schema objects.
+        See docs: https://www.sqlite.org/fts5.html
+    """
+    schema: type[T]
+    table: str
+    key: str
+    columns: tuple[str, ...] = ()
+    indexes: tuple[tuple[str, ...], ...] = ()
+
+    def __init__(self, path: Union[str, os.PathLike], batch_size: int = 10000):
+        """Initialize the store, creating the database if necessary.
+
+        Args:
+            path: Path to the SQLite database file.
+            batch_size: Number of objects inserted per transaction.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Create the object, name, and full text search tables along with their indexes and triggers."""
+        t, columns = self.table, ''.join(f'{n} TEXT, ' for n in self.columns)
+        self._db.executescript(f"""
+            CREATE TABLE IF NOT EXISTS {t} (
+                {self.key} TEXT PRIMARY KEY, {columns}name TEXT, type_line TEXT, oracle_text TEXT,
+                data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS {t}_names (name TEXT NOT NULL, {self.key} TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS {t}_names_name ON {t}_names (name);
+            CREATE INDEX IF NOT EXISTS {t}_names_{self.key} ON {t}_names ({self.key});
+            CREATE VIRTUAL TABLE IF NOT EXISTS {t}_fts USING fts5(
+                name, type_line, oracle_text, content='{t}', content_rowid='rowid');
+            CREATE TRIGGER IF NOT EXISTS {t}_ai AFTER INSERT ON {t} BEGIN
+                INSERT INTO {t}_fts (rowid, name, type_line, oracle_text)
+                VALUES (new.rowid, new.name, new.type_line, new.oracle_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS {t}_ad AFTER DELETE ON {t} BEGIN
+                INSERT INTO {t}_fts ({t}_fts, rowid, name, type_line, oracle_text)
+                VALUES ('delete', old.rowid, old.name, old.type_line, old.oracle_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS {t}_au AFTER UPDATE ON {t} BEGIN
+                INSERT INTO {t}_fts ({t}_fts, rowid, name, type_line, oracle_text)
+                VALUES ('delete', old.rowid, old.name, old.type_line, old.oracle_text);
+                INSERT INTO {t}_fts (rowid, name, type_line, oracle_text)
+                VALUES (new.rowid, new.name, new.type_line, new.oracle_text);
+            END;
+        """)
+        for columns in self.indexes:
+            self._db.execute(
+                f'CREATE INDEX IF NOT EXISTS {t}_{"_".join(columns)} ON {t} ({", ".join(columns)})')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._db.execute(
+                f'SELECT 1 FROM {self.table} WHERE {self.key} = ?', (key,)
+            ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iter_query(f'SELECT data FROM {self.table}')
+
+    """
+    * Object Rows
+    """
+
+    def get_key(self, obj: T) -> str:
+        """Returns the primary key of an object."""
+        return getattr(obj, self.key)
+
+    def get_columns(self, obj: T) -> tuple[Optional[str], ...]:
+        """Returns the value of each lookup column for an object, in the order of `columns`."""
+        return tuple(getattr(obj, n) for n in self.columns)
+
+    def get_text(self, obj: T) -> tuple[str, str, str]:
+        """Returns the name, type line, and rules text of an object to index for full text search.
+
+        Notes:
+            Reads the 'name', 'type_line', and 'oracle_text' fields, any missing or empty field is
+            indexed as an empty string. Subclasses override this for schemas using other fields.
+        """
+        return tuple(getattr(obj, n, None) or '' for n in ('name', 'type_line', 'oracle_text'))
+
+    def get_names(self, obj: T) -> set[str]:
+        """Returns the names an object can be looked up by, before normalizing."""
+        return {obj.name}
+
+    """
+    * Modifying the Store
+    """
+
+    def add(self, obj: T) -> None:
+        """Add an object to the store, replacing any object with the same key.
+
+        Args:
+            obj: Schema object to add.
+        """
+        self.update([obj])
+
+    def update(self, objects: Iterable[T]) -> int:
+        """Add any number of objects to the store, inserting each batch in a single transaction.
+
+        Args:
+            objects: Schema objects to add, e.g. from a bulk data stream.
+
+        Returns:
+            Number of objects added.
+        """
+        t, total = self.table, 0
+        cols = (self.key, *self.columns, 'name', 'type_line', 'oracle_text', 'data')
+        sql = (
+            f'INSERT INTO {t} ({", ".join(cols)}) VALUES ({", ".join("?" * len(cols))}) '
+            f'ON CONFLICT ({self.key}) DO UPDATE SET {", ".join(f"{n} = excluded.{n}" for n in cols[1:])}')
+        objects = iter(objects)
+        while batch := list(islice(objects, self.batch_size)):
+            rows = [
+                (self.get_key(n), *self.get_columns(n), *self.get_text(n), n.model_dump_json())
+                for n in batch]
+            names = [(normalize_str(name), self.get_key(n)) for n in batch for name in self.get_names(n)]
+            with self._lock:
+                self._db.execute('BEGIN IMMEDIATE')
+                try:
+                    self._db.executemany(f'DELETE FROM {t}_names WHERE {self.key} = ?', [(r[0],) for r in rows])
+                    self._db.executemany(sql, rows)
+                    self._db.executemany(f'INSERT INTO {t}_names VALUES (?, ?)', names)
+                    self._db.execute('COMMIT')
+                except Exception:
+                    self._db.execute('ROLLBACK')
+                    raise
+            total += len(batch)
+        return total
+
+    def remove(self, key: str) -> Optional[T]:
+        """Remove an object from the store.
+
+        Args:
+            key: Primary key of the object.
+
+        Returns:
+            The object removed, or None if it wasn't in the store.
+        """
+        obj = self.get(key)
+        if obj is None:
+            return None
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.execute(f'DELETE FROM {self.table} WHERE {self.key} = ?', (key,))
+                self._db.execute(f'DELETE FROM {self.table}_names WHERE {self.key} = ?', (key,))
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return obj
+
+    """
+    * Lookups
+    """
+
+    def _get_clauses(self, columns: dict[str, str], order_by: Optional[str] = None) -> tuple[str, str]:
+        """Returns the WHERE conditions and ORDER BY clause for a lookup on the store's columns.
+
+        Raises:
+            ValueError: If a column isn't one of the store's lookup columns.
+        """
+        allowed = (self.key, *self.columns)
+        if any(n not in allowed for n in columns) or (order_by and order_by.lstrip('-') not in allowed):
+            raise ValueError(f'Lookup columns must be one of: {", ".join(allowed)}')
+        where = ''.join(f' AND {self.table}.{n} = ?' for n in columns)
+        order = f' ORDER BY {self.table}.{order_by.lstrip("-")} {"DESC" if order_by[0] == "-" else "ASC"}' \
+            if order_by else ''
+        return where, order
+
+    def _iter_query(self, sql: str, params: tuple = ()) -> Iterator[T]:
+        """Yields the schema object of each row returned by a query selecting the 'data' column."""
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        for data, *_ in rows:
+            yield self.schema.model_validate_json(data)
+
+    def get(self, key: str) -> Optional[T]:
+        """Returns the object with a given primary key.
+
+        Args:
+            key: Primary key of the object.
+        """
+        return next(self._iter_query(
+            f'SELECT data FROM {self.table} WHERE {self.key} = ?', (key,)), None)
+
+    def find(self, order_by: Optional[str] = None, limit: Optional[int] = None, **columns: str) -> list[T]:
+        """Returns every object whose lookup columns equal the given values.
+
+        Args:
+            order_by: Optional column to sort the results by, prefix with '-' to sort descending.
+            limit: Optional maximum number of objects to return.
+            **columns: Lookup column names mapped to the value to look for.
+
+        Raises:
+            ValueError: If a column isn't one of the store's lookup columns.
+        """
+        where, order = self._get_clauses(columns, order_by)
+        sql = f'SELECT data FROM {self.table} WHERE 1{where}{order}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return list(self._iter_query(sql, tuple(columns.values())))
+
+    def find_named(self, name: str, order_by: Optional[str] = None, **columns: str) -> list[T]:
+        """Returns every object with an exact name, compared after normalizing.
+
+        Args:
+            name: Name of the object, or one of its faces.
+            order_by: Optional column to sort the results by, prefix with '-' to sort descending.
+            **columns: Lookup column names mapped to the value to look for.
+
+        Raises:
+            ValueError: If a column isn't one of the store's lookup columns.
+        """
+        where, order = self._get_clauses(columns, order_by)
+        t, k = self.table, self.key
+        sql = f'SELECT {t}.data FROM {t}_names JOIN {t} ON {t}.{k} = {t}_names.{k} WHERE {t}_names.name = ?'
+        sql += f'{where}{order}'
+        return list(self._iter_query(sql, (normalize_str(name), *columns.values())))
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[T]:
+        """Returns the objects matching a full text search, best match first.
+
+        Args:
+            query: FTS5 query over the name, type_line, and oracle_text columns,
+                e.g. 'oracle_text:"draw a card" AND type_line:instant'
+            limit: Optional maximum number of objects to return.
+
+        Returns:
+            A list of matching schema objects.
+        """
+        t = self.table
+        sql = (
+            f'SELECT {t}.data FROM {t}_fts JOIN {t} ON {t}.rowid = {t}_fts.rowid '
+            f'WHERE {t}_fts MATCH ? ORDER BY {t}_fts.rank')
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return list(self._iter_query(sql, (query,)))
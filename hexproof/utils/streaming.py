@@ -0,0 +1,341 @@
+"""
+* Streaming JSON Utilities
+* Incrementally parse large JSON documents without holding the entire document in memory.
+"""
+# Standard Library Imports
+import json
+import re
+from codecs import getincrementaldecoder
+from typing import Any, BinaryIO, Container, Iterator, Optional, Sequence
+
+# Default number of bytes to read from a stream per chunk
+chunk_size_default = 1024 * 1024
+
+# Patterns used when tokenizing a stream
+_RE_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_RE_STRUCTURE = re.compile(r'[\[\]{}"]')
+_RE_STRING_END = re.compile(r'["\\]')
+_RE_SCALAR_END = re.compile(r'[,\]}: \t\n\r]')
+
+# Decoder used to decode values directly from the buffer
+_json_decoder = json.JSONDecoder()
+
+"""
+* Classes
+"""
+
+
+class JSONStreamReader:
+    """Tokenizes a binary JSON stream chunk by chunk, returning raw JSON text for one value at a time.
+
+    Notes:
+        Values are located by scanning for structural characters, they are never decoded by the
+        reader itself. Values which are skipped are discarded as the stream is consumed, so the
+        reader only ever holds the value currently being captured.
+    """
+
+    def __init__(self, fp: BinaryIO, chunk_size: int = chunk_size_default):
+        """Initialize the reader.
+
+        Args:
+            fp: Binary file-like object to read JSON data from.
+            chunk_size: Number of bytes to read from the stream per chunk.
+        """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    """
+    * Buffer Handling
+    """
+
+    def _read(self) -> bool:
+        """Replace the buffer with the next chunk of the stream, dropping any consumed text.
+
+        Returns:
+            True if more text was read, otherwise False.
+        """
+        while not self._eof:
+            chunk = self._fp.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                text = self._decoder.decode(b'', final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                self._buf, self._pos = self._buf[self._pos:] + text, 0
+                return True
+        return False
+
+    def _skip_whitespace(self) -> None:
+        """Advance the cursor past any whitespace."""
+        while True:
+            self._pos = _RE_WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._read():
+                return
+
+    def _peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it, empty string at the end of the stream."""
+        self._skip_whitespace()
+        return self._buf[self._pos] if self._pos < len(self._buf) else ''
+
+    def _consume(self, expected: str) -> str:
+        """Consume the next non-whitespace character.
+
+        Args:
+            expected: Characters which are allowed at this position.
+
+        Returns:
+            The character consumed.
+
+        Raises:
+            ValueError: If the next character isn't one of the expected characters.
+        """
+        char = self._peek()
+        if not char or char not in expected:
+            raise ValueError(f"Malformed JSON stream, expected one of '{expected}' but found '{char}'!")
+        self._pos += 1
+        return char
+
+    """
+    * Tokenizing Values
+    """
+
+    def read_value(self, keep: bool = True) -> Optional[str]:
+        """Consume the next JSON value in the stream.
+
+        Args:
+            keep: Whether to return the raw text of the value, otherwise the value is discarded.
+
+        Returns:
+            Raw JSON text of the value if `keep` is True, otherwise None.
+
+        Raises:
+            ValueError: If the stream ends before the value is complete.
+        """
+        char = self._peek()
+        if not char:
+            raise ValueError('Malformed JSON stream, expected a value but reached the end of the stream!')
+        parts: list[str] = []
+        start = i = self._pos
+        depth, in_string, escaped = 0, False, False
+        scalar = char not in '[{"'
+
+        while True:
+            buf = self._buf
+            end = None
+
+            # Scan the current buffer for the end of the value
+            while end is None and i < len(buf):
+                if escaped:
+                    i, escaped = i + 1, False
+                elif in_string:
+                    match = _RE_STRING_END.search(buf, i)
+                    if match is None:
+                        i = len(buf)
+                    elif match.group() == '\\':
+                        i, escaped = match.end(), True
+                    else:
+                        i, in_string = match.end(), False
+                        if depth == 0:
+                            end = i
+                elif scalar:
+                    match = _RE_SCALAR_END.search(buf, i)
+                    if match is None:
+                        i = len(buf)
+                    else:
+                        end = match.start()
+                else:
+                    match = _RE_STRUCTURE.search(buf, i)
+                    if match is None:
+                        i = len(buf)
+                        continue
+                    i, token = match.end(), match.group()
+                    if token == '"':
+                        in_string = True
+                    elif token in '[{':
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            end = i
+
+            # Value is complete
+            if end is not None:
+                self._pos = end
+                if keep:
+                    parts.append(buf[start:end])
+                    return ''.join(parts)
+                return None
+
+            # Value continues into the next chunk
+            if keep:
+                parts.append(buf[start:])
+            self._pos = len(buf)
+            if not self._read():
+                if scalar:
+                    return ''.join(parts) if keep else None
+                raise ValueError('Malformed JSON stream, reached the end of the stream inside a value!')
+            start = i = 0
+
+    def read_decoded(self) -> Any:
+        """Consume and decode the next JSON value in the stream.
+
+        Notes:
+            The value is decoded directly from the buffer by the C JSON decoder, which is much faster
+            than `read_value` for small values. If the value can't be decoded from the buffer, because
+            it continues into the next chunk or is malformed, the tokenizer captures it up to its
+            closing character instead, so it is only read and decoded once.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: If the value is malformed, or the stream ends before the value is complete.
+        """
+        # Scalars have no closing character, so their end can only be found by the tokenizer
+        if self._peek() in '[{"':
+            try:
+                value, self._pos = _json_decoder.raw_decode(self._buf, self._pos)
+                return value
+            except json.JSONDecodeError:
+                pass
+        return json.loads(self.read_value())
+
+    def read_key(self) -> str:
+        """Consume the next object key and its trailing colon.
+
+        Returns:
+            The decoded key.
+        """
+        if self._peek() != '"':
+            raise ValueError('Malformed JSON stream, expected an object key!')
+        key = json.loads(self.read_value())
+        self._consume(':')
+        return key
+
+    """
+    * Navigating Containers
+    """
+
+    def iter_array(self) -> Iterator[str]:
+        """Yields the raw JSON text of each item in the array at the cursor.
+
+        Yields:
+            Raw JSON text of an array item.
+        """
+        self._consume('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self._consume(',]') == ']':
+                return
+
+    def iter_object(
+        self,
+        keys: Optional[Container[str]] = None,
+        decode: bool = False
+    ) -> Iterator[tuple[str, Any]]:
+        """Yields each key and the raw JSON text of its value in the object at the cursor.
+
+        Args:
+            keys: Optional collection of keys to include, values of other keys are skipped without
+                being captured.
+            decode: Whether to yield each decoded value instead of its raw JSON text, faster for small values.
+
+        Yields:
+            Tuple containing the key and the raw JSON text of its value, or the decoded value.
+        """
+        self._consume('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_key()
+            if keys is None or key in keys:
+                yield key, self.read_decoded() if decode else self.read_value()
+            else:
+                self.read_value(keep=False)
+            if self._consume(',}') == '}':
+                return
+
+    def enter(self, path: Sequence[str]) -> None:
+        """Move the cursor to the value found at a path of nested object keys.
+
+        Args:
+            path: Sequence of object keys to descend into.
+
+        Raises:
+            KeyError: If a key in the path isn't present.
+        """
+        for target in path:
+            self._consume('{')
+            while True:
+                if self._peek() == '}':
+                    raise KeyError(target)
+                if self.read_key() == target:
+                    break
+                self.read_value(keep=False)
+                if self._consume(',}') == '}':
+                    raise KeyError(target)
+
+
+"""
+* Streaming Funcs
+"""
+
+
+def iter_json_array(
+    fp: BinaryIO,
+    path: Sequence[str] = (),
+    chunk_size: int = chunk_size_default
+) -> Iterator[str]:
+    """Yields the raw JSON text of each item in a JSON array, reading the stream incrementally.
+
+    Args:
+        fp: Binary file-like object to read JSON data from.
+        path: Optional sequence of object keys leading to the array, the document root is used if empty.
+        chunk_size: Number of bytes to read from the stream per chunk.
+
+    Yields:
+        Raw JSON text of an array item.
+    """
+    reader = JSONStreamReader(fp, chunk_size=chunk_size)
+    reader.enter(path)
+    yield from reader.iter_array()
+
+
+def iter_json_object(
+    fp: BinaryIO,
+    path: Sequence[str] = (),
+    keys: Optional[Container[str]] = None,
+    decode: bool = False,
+    chunk_size: int = chunk_size_default
+) -> Iterator[tuple[str, Any]]:
+    """Yields each key and the raw JSON text of its value in a JSON object, reading the stream incrementally.
+
+    Args:
+        fp: Binary file-like object to read JSON data from.
+        path: Optional sequence of object keys leading to the object, the document root is used if empty.
+        keys: Optional collection of keys to include, values of other keys are skipped at the tokenizer
+            level. If a sized collection is provided, reading stops once every key has been found.
+        decode: Whether to yield each decoded value instead of its raw JSON text, faster for small values.
+        chunk_size: Number of bytes to read from the stream per chunk.
+
+    Yields:
+        Tuple containing the key and the raw JSON text of its value, or the decoded value.
+    """
+    reader = JSONStreamReader(fp, chunk_size=chunk_size)
+    reader.enter(path)
+    remaining = len(keys) if keys is not None and hasattr(keys, '__len__') else None
+    for key, value in reader.iter_object(keys=keys, decode=decode):
+        yield key, value
+        if remaining is not None:
+            remaining -= 1
+            if remaining <= 0:
+                return
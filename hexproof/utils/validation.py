@@ -0,0 +1,243 @@
+"""
+* Validation Utilities
+* Cached pydantic validators shared by each data source module.
+"""
+# Standard Library Imports
+import gc
+import json
+import types
+from contextlib import contextmanager
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar, Union, get_args, get_origin
+
+# Third Party Imports
+from omnitils.enums import StrConstant
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar('T')
+
+"""
+* Enums
+"""
+
+
+class ValidationMode(StrConstant):
+    """How raw JSON is turned into schema objects.
+
+    Notes:
+        Validate: Full validation, coercing values where the schema allows it.
+        Strict: Full validation in strict mode, rejecting any value which would need to be coerced.
+        Construct: No validation, objects are built the same way as `model_construct`, including any
+            nested objects. Enum values are looked up by value, any other value is kept as decoded
+            from JSON, e.g. unions of schemas use their first schema. Only use with trusted sources.
+    """
+    Validate = 'validate'
+    Strict = 'strict'
+    Construct = 'construct'
+
+
+"""
+* Schemas
+"""
+
+
+class JSONData(BaseModel, Generic[T]):
+    """A JSON document which wraps its content in a 'data' key, e.g. every MTGJSON file."""
+    data: T
+
+
+"""
+* Validation Mode
+"""
+
+# Validation mode used when a mode isn't provided, can be swapped using `set_validation_mode(...)`
+_validation_mode: ValidationMode = ValidationMode.Validate
+
+
+def get_validation_mode() -> ValidationMode:
+    """Returns the validation mode used by each data source module when a mode isn't provided."""
+    return _validation_mode
+
+
+def set_validation_mode(mode: Union[ValidationMode, str]) -> None:
+    """Set the validation mode used by each data source module when a mode isn't provided.
+
+    Args:
+        mode: Validation mode to use, e.g. 'construct' to skip validating a trusted source, or 'strict' for CI.
+    """
+    global _validation_mode
+    _validation_mode = ValidationMode(mode)
+
+
+"""
+* Constructing Without Validation
+"""
+
+
+def _get_constructor(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Returns a function building the schema objects within a decoded JSON value, or None if it contains none."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [n for n in get_args(annotation) if n is not type(None)]
+        funcs = [f for n in args if (f := _get_constructor(n)) is not None]
+        if len(args) == 1 and funcs:
+            return lambda v: v if v is None else funcs[0](v)
+
+        # Build the first schema in an ambiguous union which the value could be
+        models = [n for n in args if isinstance(n, type) and issubclass(n, BaseModel)]
+        if models:
+            return lambda v: _get_model_constructor(models[0])(v) if isinstance(v, dict) else v
+        return None
+    origin = get_origin(annotation)
+    if origin in (list, tuple, set):
+        if (item := _get_constructor(get_args(annotation)[0])) is not None:
+            return lambda v: v if v is None else [item(n) for n in v]
+        return None
+    if origin is dict:
+        if (item := _get_constructor(get_args(annotation)[1])) is not None:
+            return lambda v: v if v is None else {k: item(n) for k, n in v.items()}
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _get_model_constructor(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        members = annotation._value2member_map_
+        return lambda v: members.get(v, v)
+    return None
+
+
+@cache
+def _get_model_constructor(schema: type[BaseModel]) -> Callable[[dict], BaseModel]:
+    """Returns a function building a schema object and its nested schema objects without validation.
+
+    Notes:
+        Objects are created the same way as `model_construct`, but the per-field work is worked out
+        once per schema, so building each object is little more than copying its decoded dict.
+    """
+    names = {(f.alias or n): n for n, f in schema.model_fields.items()}
+    keys = frozenset(names)
+    renamed = any(k != n for k, n in names.items())
+    defaults = {
+        n: f.default for n, f in schema.model_fields.items()
+        if not f.is_required() and f.default_factory is None}
+    factories = {n: f.default_factory for n, f in schema.model_fields.items() if f.default_factory is not None}
+    nested = {
+        n: func for n, f in schema.model_fields.items()
+        if (func := _get_constructor(f.annotation)) is not None}
+    new, setattr_ = schema.__new__, object.__setattr__
+
+    def construct(obj: Optional[dict]) -> Optional[BaseModel]:
+        if obj is None:
+            return None
+
+        # Map JSON keys to field names, dropping any unknown keys
+        if renamed or not keys.issuperset(obj):
+            obj = {names[k]: v for k, v in obj.items() if k in names}
+        fields_set = set(obj)
+        values = {**defaults, **obj}
+        for name, func in factories.items():
+            if name not in values:
+                values[name] = func()
+        for name in nested.keys() & fields_set:
+            values[name] = nested[name](values[name])
+
+        # Create the object without calling its validator
+        model = new(schema)
+        setattr_(model, '__dict__', values)
+        setattr_(model, '__pydantic_fields_set__', fields_set)
+        setattr_(model, '__pydantic_extra__', None)
+        setattr_(model, '__pydantic_private__', None)
+        return model
+    return construct
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """Pause the cyclic garbage collector while building a large number of objects.
+
+    Notes:
+        Decoded JSON and schema objects can't contain reference cycles, but allocating millions of
+        them would otherwise trigger repeated full collections which scan every object built so far.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def construct(schema: type[T], data: Any) -> T:
+    """Build schema objects from decoded JSON without validating them.
+
+    Args:
+        schema: Schema model class or type annotation, e.g. `dict[str, list[MTGJsonTypes.CardAtomic]]`
+        data: Decoded JSON value, modified in place.
+
+    Returns:
+        The constructed object.
+    """
+    func = _get_constructor(schema)
+    if func is None:
+        return data
+    with paused_gc():
+        return func(data)
+
+
+"""
+* Validators
+"""
+
+
+@cache
+def get_type_adapter(schema: Any) -> TypeAdapter:
+    """Returns a cached TypeAdapter for a schema or type, e.g. `dict[str, list[CardAtomic]]`.
+
+    Args:
+        schema: Schema model class or type annotation, must be hashable.
+    """
+    return TypeAdapter(schema)
+
+
+def validate_json(
+    schema: type[T],
+    data: Union[bytes, bytearray, str],
+    mode: Optional[ValidationMode] = None
+) -> T:
+    """Validate raw JSON directly against a schema, without decoding it into Python objects first.
+
+    Args:
+        schema: Schema model class or type annotation, e.g. `ScrySchema.Card` or `dict[str, MTGJsonTypes.Meta]`
+        data: Raw JSON document, e.g. the content of a response.
+        mode: Validation mode to use, uses the global validation mode if not provided.
+
+    Returns:
+        The validated object.
+    """
+    mode = ValidationMode(mode or _validation_mode)
+    if mode == ValidationMode.Construct:
+        with paused_gc():
+            return construct(schema, json.loads(data))
+    return get_type_adapter(schema).validate_json(data, strict=mode == ValidationMode.Strict)
+
+
+def validate_json_data(
+    schema: type[T],
+    data: Union[bytes, bytearray, str],
+    mode: Optional[ValidationMode] = None
+) -> T:
+    """Validate the 'data' of a raw JSON document directly against a schema, ignoring any other keys.
+
+    Args:
+        schema: Schema model class or type annotation of the 'data' value.
+        data: Raw JSON document, e.g. the content of an MTGJSON file.
+        mode: Validation mode to use, uses the global validation mode if not provided.
+
+    Returns:
+        The validated 'data' object.
+    """
+    mode = ValidationMode(mode or _validation_mode)
+    if mode == ValidationMode.Construct:
+        with paused_gc():
+            return construct(schema, json.loads(data).get('data'))
+    return validate_json(JSONData[schema], data, mode=mode).data